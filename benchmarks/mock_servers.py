@@ -0,0 +1,411 @@
+"""
+Local stand-ins for a JSON-RPC node and the OpenSea, Rarible, LooksRare and Mintable APIs.
+
+Every server adds a configurable latency (plus uniform jitter) to each response and can throttle with a token bucket,
+answering 429 with a Retry-After header once the bucket is empty. Responses are generated deterministically from the
+request so runs are reproducible. GET responses carry an ETag and answer a matching If-None-Match with 304, and
+fail_next scripts error responses, so the servers also back the offline unit tests.
+"""
+import hashlib
+import json
+import random
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from urllib.parse import parse_qs, urlsplit
+from eth_abi import decode, encode
+
+SELECTORS = {
+    "06fdde03": "name",
+    "95d89b41": "symbol",
+    "18160ddd": "totalSupply",
+    "70a08231": "balanceOf",
+    "6352211e": "ownerOf",
+    "c87b56dd": "tokenURI",
+}
+
+TRAITS = {
+    "Background": ["Blue", "Red", "Gold", "Purple", "Gray"],
+    "Eyes": ["Laser", "Cyborg", "Sleepy", "Wide", "Closed", "Angry"],
+    "Hat": ["None", "Crown", "Cap", "Beanie"],
+    "Mouth": ["Smile", "Grin", "Pipe"],
+}
+
+
+def _digest(*parts) -> bytes:
+    return hashlib.blake2b(":".join(map(str, parts)).encode("utf-8"), digest_size=20).digest()
+
+
+def token_attributes(token_id: int) -> list:
+    digest = _digest("traits", token_id)
+    return [{"trait_type": trait_type, "value": values[digest[i] % len(values)]}
+            for i, (trait_type, values) in enumerate(TRAITS.items())]
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # The default backlog of 5 drops connections opened in bursts, e.g. one per NFTWallet query thread
+    request_queue_size = 256
+
+
+class _Throttle:
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = Lock()
+
+    def wait(self) -> float:
+        """Take a token, or return how long until one is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+
+class MockServer:
+    """
+    A threaded HTTP server on a free local port.
+
+    Args:
+        latency (float, optional): Seconds added to every response.
+        jitter (float, optional): Maximum extra seconds, drawn uniformly per response.
+        rate (float, optional): Requests per second served before answering 429. None disables throttling.
+        burst (int, optional): Requests served back to back before the rate applies.
+        seed (int, optional): Seed of the jitter.
+    """
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, rate: float = None, burst: int = 10, seed: int = 0):
+        self.latency = latency
+        self.jitter = jitter
+        self.throttle = _Throttle(rate, burst) if rate else None
+        self.requests = 0
+        self.throttled = 0
+        self.not_modified = 0
+        self._failures = deque()
+        self._random = random.Random(seed)
+        self._lock = Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    def handle(self, method: str, path: str, query: dict, body: bytes):
+        """Return (status, payload) for a request."""
+        raise NotImplementedError
+
+    def fail_next(self, count: int = 1, status: int = 503, headers: dict = None):
+        """Answer the next `count` requests with `status` and the given headers instead of handling them."""
+        with self._lock:
+            self._failures.extend([(status, dict(headers or {}))] * count)
+
+    def _respond(self, handler: BaseHTTPRequestHandler, method: str):
+        # The body is always read so throttled keep-alive connections stay usable
+        length = int(handler.headers.get("Content-Length") or 0)
+        body = handler.rfile.read(length) if length else b""
+        with self._lock:
+            self.requests += 1
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+            failure = self._failures.popleft() if self._failures else None
+        wait = self.throttle.wait() if self.throttle is not None and failure is None else 0.0
+        if delay:
+            time.sleep(delay)
+        if failure is not None:
+            status, headers = failure
+            payload = {"error": f"Injected {status}"}
+        elif wait:
+            with self._lock:
+                self.throttled += 1
+            status, payload, headers = 429, {"error": "Too Many Requests"}, {"Retry-After": f"{wait:.3f}"}
+        else:
+            split = urlsplit(handler.path)
+            try:
+                status, payload = self.handle(method, split.path, parse_qs(split.query), body)
+            except Exception as e:
+                status, payload = 500, {"error": repr(e)}
+            headers = {}
+        content = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        if method == "GET" and status == 200:
+            etag = '"' + hashlib.blake2b(content, digest_size=8).hexdigest() + '"'
+            headers["ETag"] = etag
+            if handler.headers.get("If-None-Match") == etag:
+                with self._lock:
+                    self.not_modified += 1
+                status, content = 304, b""
+        handler.send_response(status)
+        if content:
+            handler.send_header("Content-Type", "application/json")
+        handler.send_header("Content-Length", str(len(content)))
+        for name, value in headers.items():
+            handler.send_header(name, value)
+        handler.end_headers()
+        handler.wfile.write(content)
+
+    def start(self) -> "MockServer":
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body are written separately; without TCP_NODELAY delayed ACKs add ~40ms per response
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                server._respond(self, "GET")
+
+            def do_POST(self):
+                server._respond(self, "POST")
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = _Server(("127.0.0.1", 0), Handler)
+        # A short poll interval keeps stop() fast, which matters for the unit tests starting a server per test
+        self._thread = Thread(target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+class MockRPCNode(MockServer):
+    """
+    A JSON-RPC node serving an ERC721 contract at every address.
+
+    POST / answers as chain 1, POST /<chain_id> as that chain, so one node can back several chains of a wallet.
+
+    Blocks are served up to the head, which advances every 12 seconds unless `head` is set. Block hashes depend on
+    the number of reorgs at or below the block, so reorg(number) replaces that block and every later one. Numbers in
+    `missing_blocks` are answered with null, like a load balanced node that reports a head one backend lacks.
+
+    Args:
+        metadata_url (str, optional): Base URL returned by tokenURI, followed by the token ID.
+        **kwargs: See MockServer.
+    """
+    def __init__(self, metadata_url: str = "http://127.0.0.1/metadata", **kwargs):
+        super().__init__(**kwargs)
+        self.metadata_url = metadata_url
+        self.head = None
+        self.missing_blocks = set()
+        self._reorgs = []
+        self._started = time.time()
+
+    def block_number(self) -> int:
+        if self.head is not None:
+            return self.head
+        return 19_000_000 + int((time.time() - self._started) / 12)
+
+    def reorg(self, number: int):
+        """Replace block `number` and every later block with a new branch."""
+        with self._lock:
+            self._reorgs.append(number)
+
+    def block_hash(self, chain_id: int, number: int) -> str:
+        fork = sum(1 for reorg in self._reorgs if reorg <= number)
+        return "0x" + hashlib.blake2b(f"block:{chain_id}:{number}:{fork}".encode("utf-8"), digest_size=32).hexdigest()
+
+    def _block(self, chain_id: int, identifier):
+        head = self.block_number()
+        number = head if identifier in ("latest", "pending", "safe", "finalized") else int(identifier, 16)
+        if number > head or number in self.missing_blocks:
+            return None
+        return {"number": hex(number), "hash": self.block_hash(chain_id, number),
+                "parentHash": self.block_hash(chain_id, number - 1), "timestamp": hex(1_700_000_000 + number * 12),
+                "gasLimit": hex(30_000_000), "gasUsed": "0x0", "transactions": []}
+
+    def chain_url(self, chain_id: int) -> str:
+        return f"{self.url}/{chain_id}"
+
+    def handle(self, method, path, query, body):
+        request = json.loads(body)
+        chain_id = int(path.strip("/") or 1)
+        if isinstance(request, list):
+            return 200, [self._call(chain_id, item) for item in request]
+        return 200, self._call(chain_id, request)
+
+    def _call(self, chain_id: int, request: dict) -> dict:
+        method, params = request.get("method"), request.get("params") or []
+        if method == "eth_chainId":
+            result = hex(chain_id)
+        elif method == "net_version":
+            result = str(chain_id)
+        elif method == "web3_clientVersion":
+            result = "nftpy-mock/1.0"
+        elif method == "eth_blockNumber":
+            result = hex(self.block_number())
+        elif method == "eth_getBlockByNumber":
+            result = self._block(chain_id, params[0])
+        elif method == "eth_gasPrice":
+            result = hex(20 * 10 ** 9)
+        elif method == "eth_getBalance":
+            result = hex(int.from_bytes(_digest("balance", chain_id, params[0].lower())[:8], "big"))
+        elif method == "eth_getTransactionCount":
+            result = hex(7)
+        elif method == "eth_call":
+            result = "0x" + self._eth_call(params[0]).hex()
+        else:
+            return {"jsonrpc": "2.0", "id": request.get("id"),
+                    "error": {"code": -32601, "message": f"Method {method} not found"}}
+        return {"jsonrpc": "2.0", "id": request.get("id"), "result": result}
+
+    def _eth_call(self, transaction: dict) -> bytes:
+        data = bytes.fromhex((transaction.get("data") or transaction.get("input"))[2:])
+        function = SELECTORS.get(data[:4].hex())
+        arguments = data[4:]
+        if function == "name":
+            return encode(["string"], ["Mock Collection"])
+        if function == "symbol":
+            return encode(["string"], ["MOCK"])
+        if function == "totalSupply":
+            return encode(["uint256"], [10_000])
+        if function == "balanceOf":
+            owner, = decode(["address"], arguments)
+            return encode(["uint256"], [_digest("owned", owner)[0]])
+        if function == "ownerOf":
+            token_id, = decode(["uint256"], arguments)
+            return encode(["address"], ["0x" + _digest("owner", token_id).hex()])
+        if function == "tokenURI":
+            token_id, = decode(["uint256"], arguments)
+            return encode(["string"], [f"{self.metadata_url}/{token_id}"])
+        raise ValueError(f"Unsupported call {data[:4].hex()}")
+
+
+class MockMarketplace(MockServer):
+    """
+    Serves the marketplace endpoints the benchmarks use under one port, each API under its own prefix, plus token
+    metadata under /metadata/<token_id>.
+
+    Every NFT has one OpenSea sale event per `event_interval` seconds from `events_start` on. Event queries include
+    both occurred_after and occurred_before, so adjacent time windows share their edge events.
+
+    Args:
+        collection_size (int, optional): Number of tokens in every collection, bounding paginated crawls. Also the
+            number of Rarible transactions.
+        event_count (int, optional): Number of events of every NFT.
+        event_interval (int, optional): Seconds between two events.
+        events_start (int, optional): Unix timestamp of the oldest event.
+        **kwargs: See MockServer.
+    """
+    def __init__(self, collection_size: int = 1000, event_count: int = 200, event_interval: int = 60,
+                 events_start: int = 1_700_000_000, **kwargs):
+        super().__init__(**kwargs)
+        self.collection_size = collection_size
+        self.event_count = event_count
+        self.event_interval = event_interval
+        self.events_start = events_start
+
+    @property
+    def events_end(self) -> int:
+        """Timestamp of the newest event."""
+        return self.events_start + (self.event_count - 1) * self.event_interval
+
+    @property
+    def opensea_url(self) -> str:
+        return f"{self.url}/opensea/api/v2"
+
+    @property
+    def rarible_url(self) -> str:
+        return f"{self.url}/rarible/v0.1"
+
+    @property
+    def looksrare_url(self) -> str:
+        # LooksRareChain values are base URLs ending in a slash
+        return f"{self.url}/looksrare/api/"
+
+    @property
+    def mintable_url(self) -> str:
+        return f"{self.url}/mintable/v1"
+
+    @property
+    def metadata_url(self) -> str:
+        return f"{self.url}/metadata"
+
+    def _nft(self, token_id: int) -> dict:
+        return {"identifier": str(token_id), "collection": "mock", "contract": "0x" + _digest("contract").hex(),
+                "token_standard": "erc721", "name": f"Mock #{token_id}", "traits": token_attributes(token_id)}
+
+    def _events(self, contract: str, token_id: str, occurred_after, occurred_before) -> list:
+        newest = self.events_end if occurred_before is None else min(self.events_end, int(occurred_before))
+        oldest = self.events_start if occurred_after is None else max(self.events_start, int(occurred_after))
+        first = -(-(oldest - self.events_start) // self.event_interval)
+        last = (newest - self.events_start) // self.event_interval
+        return [{"event_type": "sale", "transaction": "0x" + _digest("tx", contract, token_id, index).hex(),
+                 "order_hash": None, "event_timestamp": self.events_start + index * self.event_interval,
+                 "nft": {"contract": contract, "identifier": token_id}}
+                for index in range(last, first - 1, -1)]
+
+    def handle(self, method, path, query, body):
+        parts = [part for part in path.split("/") if part]
+
+        def first(key, default=None):
+            return (query.get(key) or [default])[0]
+
+        def page(items, items_key, cursor_key):
+            # The cursor is the offset of the next page
+            offset, limit = int(first("cursor", 0) or 0), int(first("limit", 50))
+            end = min(offset + limit, len(items))
+            return 200, {items_key: items[offset:end], cursor_key: str(end) if end < len(items) else None}
+
+        if parts[0] == "metadata":
+            token_id = int(parts[1])
+            return 200, {"name": f"Mock #{token_id}", "image": f"ipfs://mock/{token_id}.png",
+                         "attributes": token_attributes(token_id)}
+        if parts[0] == "opensea":
+            if "events" in parts:
+                # /events/chain/<chain>/contract/<address>/nfts/<token_id>
+                events = self._events(parts[-3], parts[-1], first("occurred_after"), first("occurred_before"))
+                return page(events, "asset_events", "next")
+            if parts[-2] == "collection":
+                return 200, {"collection": parts[-1], "name": f"Mock {parts[-1]}",
+                             "total_supply": self.collection_size}
+            if parts[-1] == "stats":
+                slug = parts[-2]
+                return 200, {"total": {"volume": 1000.0, "sales": 500, "floor_price": _digest(slug)[0] / 10}}
+            if parts[-1] == "nfts":
+                # /chain/<chain>/collection/<slug>/nfts, the cursor is the offset of the next page
+                offset, limit = int(first("cursor", 0) or 0), int(first("limit", 50))
+                end = min(offset + limit, self.collection_size)
+                return 200, {"nfts": [self._nft(token_id) for token_id in range(offset, end)],
+                             "next": str(end) if end < self.collection_size else None}
+        if parts[0] == "rarible":
+            if parts[-1] == "transactions":
+                transactions = [{"id": f"tx-{index}", "type": "SELL", "price": str(index)}
+                                for index in range(self.collection_size)]
+                return page(transactions, "transactions", "continuation")
+            if parts[-1] == "stats":
+                return 200, {"floorPrice": 1.25, "items": self.collection_size, "owners": 900}
+            if parts[-2] == "items":
+                item_id = parts[-1]
+                token_id = int(item_id.rsplit(":", 1)[-1])
+                return 200, {"id": item_id, "tokenId": str(token_id),
+                             "meta": {"name": f"Mock #{token_id}", "attributes": token_attributes(token_id)}}
+        if parts[0] == "looksrare":
+            if parts[-1] == "stats":
+                return 200, {"address": first("collection"), "floorPrice": "1250000000000000000", "countOwners": 900,
+                             "totalSupply": self.collection_size}
+        if parts[0] == "mintable":
+            if parts[-1] in ("search", "ending-soon", "hot"):
+                page, limit = int(first("page", 1)), int(first("limit", 50))
+                start = (page - 1) * limit
+                end = min(start + limit, self.collection_size)
+                return 200, {"items": [{"id": str(i), "price": 0.1 + i / 1000, "endsAt": 1_700_000_000 + i}
+                                       for i in range(start, max(start, end))]}
+            if parts[-2] == "marketplace":
+                return 200, {"id": parts[-1], "price": 0.5, "title": f"Mock #{parts[-1]}"}
+        return 404, {"error": f"No mock route for {path}"}
@@ -0,0 +1,222 @@
+"""
+Run the nftpy benchmarks against the local mock servers and append the results to a JSON Lines file.
+
+    python -m benchmarks.run --scenario all --latency 20 --jitter 10 --concurrency 8
+    python -m benchmarks.run --scenario opensea_crawl --rate 50 --burst 10 --prefetch
+
+Every result line records the scenario, its parameters, the git commit, the nftpy version and JSON backend, the
+throughput and latency percentiles, and how many requests the mock servers answered and throttled, so numbers from
+different commits can be compared.
+"""
+import argparse
+import platform
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+import nftpy
+from nftpy import (NFT, NFTWallet, Chain, HTTPTransport, Mintable, MintableChain, OpenSea, OpenSeaChain, Rarible,
+                   RaribleChain, LooksRareAPI, add_observer, remove_observer, get_json_backend, set_json_backend)
+from nftpy.codec import dumps
+
+from .mock_servers import MockMarketplace, MockRPCNode
+
+CONTRACT = "0xBC4CA0EdA7647A8aB7C2061c2E118A18a936f13D"
+WALLET = "0x5A0b54D5dc17e0AadC383d2db43B0a0D3E029c4c"
+RESULTS = Path(__file__).with_name("results.jsonl")
+
+
+def _percentile(ordered: list, q: float) -> float:
+    if not ordered:
+        return None
+    index = min(len(ordered) - 1, max(0, int(round(q / 100 * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def _timed(func, inputs, concurrency: int):
+    """Call func on every input with `concurrency` threads, returning per-call latencies and the error count."""
+    def call(item):
+        started = time.perf_counter()
+        try:
+            func(item)
+            return time.perf_counter() - started, None
+        except Exception as e:
+            return time.perf_counter() - started, e
+
+    if concurrency <= 1:
+        results = [call(item) for item in inputs]
+    else:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(executor.map(call, inputs))
+    return [latency for latency, _ in results], sum(1 for _, error in results if error is not None)
+
+
+class _RequestLatencies:
+    """Collects the duration of every HTTP request, for scenarios where one operation spans many requests."""
+    def __init__(self):
+        self.latencies = []
+
+    def __call__(self, event):
+        if event.kind == "http":
+            self.latencies.append(event.duration)
+
+    def __enter__(self):
+        add_observer(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        remove_observer(self)
+
+
+def nft_reads(args, node, market, transport):
+    """ownerOf, balanceOf and tokenURI calls through NFT."""
+    nft = NFT(CONTRACT, rpc_url=node.url, transport=transport)
+    calls = (lambda i: nft.get_owner(i), lambda i: nft.get_balance(WALLET), lambda i: nft.get_token_uri(i))
+    latencies, errors = _timed(lambda i: calls[i % 3](i), range(args.operations), args.concurrency)
+    return args.operations, errors, latencies
+
+
+def wallet_multichain(args, node, market, transport):
+    """NFTWallet.get_balance_wei fanning out over several chains served by the mock node."""
+    chains = [Chain(f"Mock {index}", 990_000 + index, node.chain_url(990_000 + index))
+              for index in range(args.chains)]
+    wallet = NFTWallet(address=WALLET, chains=chains)
+    latencies, errors = _timed(lambda i: wallet.get_balance_wei(), range(args.operations), args.concurrency)
+    return args.operations, errors, latencies
+
+
+def metadata(args, node, market, transport):
+    """NFT.get_token_metadata: a tokenURI call followed by a metadata request."""
+    nft = NFT(CONTRACT, rpc_url=node.url, transport=transport)
+    latencies, errors = _timed(nft.get_token_metadata, range(args.operations), args.concurrency)
+    return args.operations, errors, latencies
+
+
+def opensea_crawl(args, node, market, transport):
+    """Follow the OpenSea cursor over a whole collection."""
+    opensea = OpenSea(api_key="mock", chain=OpenSeaChain.ETHEREUM, transport=transport)
+    opensea.base_url = market.opensea_url
+    with _RequestLatencies() as requests:
+        items = sum(1 for _ in opensea.iter_nfts_by_collection("mock", limit=args.page_size, prefetch=args.prefetch))
+    return items, 0, requests.latencies
+
+
+def mintable_crawl(args, node, market, transport):
+    """Request numbered Mintable pages until a short page."""
+    mintable = Mintable("mock", MintableChain.MAINNET, transport=transport)
+    mintable.base_url = market.mintable_url
+    with _RequestLatencies() as requests:
+        items = sum(1 for _ in mintable.iter_auctions_ending_soon(page_size=args.page_size, prefetch=args.prefetch))
+    return items, 0, requests.latencies
+
+
+def marketplace_reads(args, node, market, transport):
+    """Round robin single-object reads on OpenSea, Rarible, LooksRare and Mintable."""
+    opensea = OpenSea(api_key="mock", transport=transport)
+    opensea.base_url = market.opensea_url
+    rarible = Rarible(api_key="mock", chain=RaribleChain.ETHEREUM, transport=transport)
+    rarible.base_url = market.rarible_url
+    looksrare = LooksRareAPI(SimpleNamespace(name="MOCK", value=market.looksrare_url), transport=transport)
+    mintable = Mintable("mock", MintableChain.MAINNET, transport=transport)
+    mintable.base_url = market.mintable_url
+    calls = (lambda i: opensea.get_collection_stats(f"mock-{i}"),
+             lambda i: rarible.get_item_by_id(f"ETHEREUM:{CONTRACT}:{i}"),
+             lambda i: looksrare.get_collection_stats(f"0x{i:040x}"),
+             lambda i: mintable.fetch_single_nft_for_sale(str(i)))
+    latencies, errors = _timed(lambda i: calls[i % 4](i), range(args.operations), args.concurrency)
+    return args.operations, errors, latencies
+
+
+SCENARIOS = {
+    "nft_reads": nft_reads,
+    "wallet_multichain": wallet_multichain,
+    "metadata": metadata,
+    "opensea_crawl": opensea_crawl,
+    "mintable_crawl": mintable_crawl,
+    "marketplace_reads": marketplace_reads,
+}
+
+
+def _commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=Path(__file__).parent, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_scenario(name: str, args) -> dict:
+    server_options = {"latency": args.latency / 1000, "jitter": args.jitter / 1000, "rate": args.rate,
+                      "burst": args.burst, "seed": args.seed}
+    with MockMarketplace(collection_size=args.collection_size, **server_options) as market, \
+            MockRPCNode(**server_options) as node, \
+            HTTPTransport(pool_maxsize=max(args.concurrency, 10)) as transport:
+        node.metadata_url = market.metadata_url
+        started = time.perf_counter()
+        operations, errors, latencies = SCENARIOS[name](args, node, market, transport)
+        elapsed = time.perf_counter() - started
+        servers = {"requests": market.requests + node.requests, "throttled": market.throttled + node.throttled}
+
+    ordered = sorted(latencies)
+    milliseconds = lambda value: round(value * 1000, 3) if value is not None else None
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": _commit(),
+        "nftpy": nftpy.__version__,
+        "python": platform.python_version(),
+        "json_backend": get_json_backend(),
+        "scenario": name,
+        "params": {"operations": args.operations, "concurrency": args.concurrency, "latency_ms": args.latency,
+                   "jitter_ms": args.jitter, "rate": args.rate, "burst": args.burst, "chains": args.chains,
+                   "collection_size": args.collection_size, "page_size": args.page_size, "prefetch": args.prefetch},
+        "operations": operations,
+        "errors": errors,
+        "seconds": round(elapsed, 4),
+        "throughput": round(operations / elapsed, 2) if elapsed else None,
+        "latency_ms": {"samples": len(ordered), "p50": milliseconds(_percentile(ordered, 50)),
+                       "p90": milliseconds(_percentile(ordered, 90)), "p99": milliseconds(_percentile(ordered, 99)),
+                       "max": milliseconds(ordered[-1] if ordered else None)},
+        "server": servers,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS) + ["all"],
+                        help="Scenario to run, repeatable. Defaults to all.")
+    parser.add_argument("--operations", type=int, default=200, help="Operations per scenario (reads and wallets).")
+    parser.add_argument("--concurrency", type=int, default=8, help="Threads issuing operations.")
+    parser.add_argument("--latency", type=float, default=0.0, help="Mock server latency in milliseconds.")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Maximum extra mock latency in milliseconds.")
+    parser.add_argument("--rate", type=float, default=None, help="Requests per second before the mocks answer 429.")
+    parser.add_argument("--burst", type=int, default=10, help="Requests allowed back to back when throttling.")
+    parser.add_argument("--chains", type=int, default=4, help="Chains of the wallet_multichain scenario.")
+    parser.add_argument("--collection-size", type=int, default=2000, help="Tokens crawled by the crawl scenarios.")
+    parser.add_argument("--page-size", type=int, default=50, help="Items per page in the crawl scenarios.")
+    parser.add_argument("--prefetch", action="store_true", help="Prefetch the next page while crawling.")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per scenario.")
+    parser.add_argument("--json-backend", choices=("json", "orjson"), default="json",
+                        help="JSON backend to decode with.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the mock latency jitter.")
+    parser.add_argument("--output", type=Path, default=RESULTS, help="JSON Lines file the results are appended to.")
+    args = parser.parse_args(argv)
+    set_json_backend(args.json_backend)
+
+    names = sorted(SCENARIOS) if not args.scenario or "all" in args.scenario else args.scenario
+    with open(args.output, "a", encoding="utf-8") as output:
+        for name in names:
+            for _ in range(args.repeat):
+                result = run_scenario(name, args)
+                output.write(dumps(result) + "\n")
+                output.flush()
+                latency = result["latency_ms"]
+                print(f"{name:<20} {result['throughput']:>10} ops/s  p50 {latency['p50']} ms  p99 {latency['p99']} ms"
+                      f"  errors {result['errors']}  throttled {result['server']['throttled']}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
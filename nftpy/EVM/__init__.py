@@ -1,6 +1,8 @@
 from .nft import NFT
 from .abi import ABI
-from .chains import Chains, Chain
+from .chains import Chains, Chain, ChainRegistry, chain_registry, resolve_chain
 from .wallet import NFTWallet
+from .follower import BlockFollower, NewBlockEvent, RollbackEvent
+from .provider import CodecHTTPProvider, http_provider
 
-__all__ = ['NFT', 'ABI', 'Chains', "NFTWallet", "Chain"]
\ No newline at end of file
+__all__ = ['NFT', 'ABI', 'Chains', "NFTWallet", "Chain", "ChainRegistry", "chain_registry", "resolve_chain", "BlockFollower", "NewBlockEvent", "RollbackEvent", "CodecHTTPProvider", "http_provider"]
\ No newline at end of file
@@ -1,18 +1,83 @@
+import json
+import os
 from enum import Enum
+from ..errors import UnknownChainError, InvalidChainConfigError
+
 
 class Chain:
-    def __init__(self, name:str, chain_id:int, rpc_url:str, symbol:str="ETH", explorer_url:str=None):
-        self.name = name
-        self.symbol = symbol
-        self.chain_id = chain_id
-        self.rpc_url = rpc_url
-        self.explorer_url = explorer_url
+    """
+    An immutable chain record. Usable anywhere a Chains member is expected.
+
+    Args:
+        name (str): The display name of the chain.
+        chain_id (int): The EIP-155 chain ID.
+        rpc_url (str): The primary RPC URL.
+        symbol (str, optional): The native currency symbol.
+        explorer_url (str, optional): The block explorer URL.
+        rpc_urls (list, optional): Every RPC URL of the chain. Defaults to the primary RPC URL only.
+        testnet (bool, optional): Whether the chain is a testnet.
+    """
+    __slots__ = ("name", "symbol", "chain_id", "rpc_url", "explorer_url", "rpc_urls", "testnet")
+
+    def __init__(self, name:str, chain_id:int, rpc_url:str, symbol:str="ETH", explorer_url:str=None, rpc_urls:list=None,
+                 testnet:bool=False):
+        setter = object.__setattr__
+        setter(self, "name", name)
+        setter(self, "symbol", symbol)
+        setter(self, "chain_id", int(chain_id))
+        setter(self, "rpc_url", rpc_url)
+        setter(self, "explorer_url", explorer_url)
+        setter(self, "rpc_urls", tuple(rpc_urls) if rpc_urls else (rpc_url,))
+        setter(self, "testnet", testnet)
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        try:
+            return cls(name=data["name"], chain_id=data["chain_id"], rpc_url=data.get("rpc_url") or data["rpc_urls"][0],
+                       symbol=data.get("symbol", "ETH"), explorer_url=data.get("explorer_url"),
+                       rpc_urls=data.get("rpc_urls"), testnet=data.get("testnet", False))
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            raise InvalidChainConfigError(f"Invalid chain definition {data!r}") from e
+
+    def replace(self, **changes):
+        """
+        Create a copy of the record with some fields changed.
+
+        Returns:
+            Chain: The new record.
+        """
+        fields = {field: getattr(self, field) for field in self.__slots__}
+        if "rpc_urls" in changes and "rpc_url" not in changes:
+            changes["rpc_url"] = changes["rpc_urls"][0]
+        fields.update(changes)
+        return Chain(**fields)
+
+    def __setattr__(self, key, value):
+        raise AttributeError("Chain records are immutable, use Chain.replace() instead.")
+
+    def __delattr__(self, key):
+        raise AttributeError("Chain records are immutable.")
+
+    def __eq__(self, other):
+        if isinstance(other, (Chain, Chains)):
+            return self.chain_id == other.chain_id
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.chain_id)
+
+    def __reduce__(self):
+        return Chain, (self.name, self.chain_id, self.rpc_url, self.symbol, self.explorer_url, self.rpc_urls, self.testnet)
+
+    def __repr__(self):
+        return f"Chain(name={self.name!r}, chain_id={self.chain_id}, symbol={self.symbol!r}, rpc_url={self.rpc_url!r})"
 
 class Chains(Enum):
     ETH = {
         "chain_id": 1,
         "name": "Ethereum Mainnet",
         "rpc_url": "https://eth.llamarpc.com",
+        "rpc_urls": ["https://eth.llamarpc.com", "https://ethereum-rpc.publicnode.com"],
         "explorer_url": "https://etherscan.io",
         "symbol": "ETH"
     }
@@ -20,6 +85,7 @@ class Chains(Enum):
         "chain_id": 56,
         "name": "Binance Smart Chain",
         "rpc_url": "https://bsc-dataseed.binance.org/",
+        "rpc_urls": ["https://bsc-dataseed.binance.org/", "https://bsc-rpc.publicnode.com"],
         "explorer_url": "https://bscscan.com",
         "symbol": "BNB"
     }
@@ -27,6 +93,7 @@ class Chains(Enum):
         "chain_id": 137,
         "name": "Polygon (Matic)",
         "rpc_url": "https://polygon-rpc.com/",
+        "rpc_urls": ["https://polygon-rpc.com/", "https://polygon-bor-rpc.publicnode.com"],
         "explorer_url": "https://polygonscan.com",
         "symbol": "MATIC"
     }
@@ -48,6 +115,7 @@ class Chains(Enum):
         "chain_id": 42161,
         "name": "Arbitrum One",
         "rpc_url": "https://arb1.arbitrum.io/rpc",
+        "rpc_urls": ["https://arb1.arbitrum.io/rpc", "https://arbitrum-one-rpc.publicnode.com"],
         "explorer_url": "https://arbiscan.io",
         "symbol": "ARB"
     }
@@ -104,6 +172,7 @@ class Chains(Enum):
         "chain_id": 8453,
         "name": "Base",
         "rpc_url": "https://mainnet.base.org",
+        "rpc_urls": ["https://mainnet.base.org", "https://base-rpc.publicnode.com"],
         "explorer_url": "https://basescan.org",
         "symbol": "BASE"
     }
@@ -115,6 +184,7 @@ class Chains(Enum):
         "name": "Sepolia Testnet",
         "rpc_url": "https://rpc.sepolia.org",
         "explorer_url": "https://sepolia.etherscan.io",
+        "testnet": True,
         "symbol": "sETH"
     }
 
@@ -123,6 +193,7 @@ class Chains(Enum):
         "name": "Holešky Testnet",
         "rpc_url": "https://ethereum-holesky.publicnode.com",
         "explorer_url": "https://holesky.beaconcha.in",
+        "testnet": True,
         "symbol": "hETH"
     }
 
@@ -133,6 +204,7 @@ class Chains(Enum):
         "name": "BSC Testnet",
         "rpc_url": "https://data-seed-prebsc-1-s1.binance.org:8545/",
         "explorer_url": "https://testnet.bscscan.com",
+        "testnet": True,
         "symbol": "tBNB"
     }
 
@@ -143,6 +215,7 @@ class Chains(Enum):
         "name": "Polygon Mumbai Testnet",
         "rpc_url": "https://polygon-mumbai.api.onfinality.io/public",
         "explorer_url": "https://mumbai.polygonscan.com",
+        "testnet": True,
         "symbol": "mMATIC"
     }
 
@@ -151,6 +224,7 @@ class Chains(Enum):
         "name": "Polygon Amoy Testnet",
         "rpc_url": "https://rpc-amoy.polygon.technology",
         "explorer_url": "https://oklink.com/amoy",
+        "testnet": True,
         "symbol": "aMATIC"
     }
 
@@ -159,6 +233,7 @@ class Chains(Enum):
         "name": "Polygon zkEVM Cardona Testnet",
         "rpc_url": "https://rpc.cardona.zkevm-rpc.com",
         "explorer_url": "https://cardona-zkevm.polygonscan.com",
+        "testnet": True,
         "symbol": "cMATIC"
     }
 
@@ -169,6 +244,7 @@ class Chains(Enum):
         "name": "Avalanche Fuji Testnet",
         "rpc_url": "https://api.avax-test.network/ext/bc/C/rpc",
         "explorer_url": "https://testnet.snowtrace.io",
+        "testnet": True,
         "symbol": "fAVAX"
     }
 
@@ -179,6 +255,7 @@ class Chains(Enum):
         "name": "Fantom Testnet",
         "rpc_url": "https://rpc.testnet.fantom.network",
         "explorer_url": "https://testnet.ftmscan.com",
+        "testnet": True,
         "symbol": "tFTM"
     }
 
@@ -189,6 +266,7 @@ class Chains(Enum):
         "name": "Arbitrum Nova",
         "rpc_url": "https://nova.arbitrum.io/rpc",
         "explorer_url": "https://nova.arbiscan.io",
+        "testnet": True,
         "symbol": "aARB"
     }
 
@@ -199,6 +277,7 @@ class Chains(Enum):
         "name": "Optimism Goerli",
         "rpc_url": "https://optimism-goerli.public.blastapi.io",
         "explorer_url": "https://goerli-explorer.optimism.io",
+        "testnet": True,
         "symbol": "oETH"
     }
 
@@ -209,6 +288,7 @@ class Chains(Enum):
         "name": "Celo Alfajores Testnet",
         "rpc_url": "https://alfajores-forno.celo-testnet.org",
         "explorer_url": "https://alfajores-blockscout.celo-testnet.org",
+        "testnet": True,
         "symbol": "aCELO"
     }
 
@@ -217,6 +297,7 @@ class Chains(Enum):
         "name": "Celo Baklava Testnet",
         "rpc_url": "https://baklava-forno.celo-testnet.org",
         "explorer_url": "https://baklava-blockscout.celo-testnet.org",
+        "testnet": True,
         "symbol": "bCELO"
     }
 
@@ -227,25 +308,193 @@ class Chains(Enum):
         "name": "Cronos Testnet",
         "rpc_url": "https://evm-t3.cronos.org",
         "explorer_url": "https://testnet.cronoscan.com",
+        "testnet": True,
         "symbol": "tCRO"
     }
 
-    @property
-    def chain_id(self):
-        return self.value["chain_id"]
+    def __init__(self, data):
+        # Plain attributes instead of properties so hot paths avoid a dict lookup per access
+        self.chain_id = data["chain_id"]
+        self.rpc_url = data["rpc_url"]
+        self.rpc_urls = tuple(data.get("rpc_urls", (data["rpc_url"],)))
+        self.explorer_url = data["explorer_url"]
+        self.symbol = data["symbol"]
+        self.testnet = data.get("testnet", False)
+        self.record = Chain(data["name"], self.chain_id, self.rpc_url, self.symbol, self.explorer_url, self.rpc_urls,
+                            self.testnet)
 
     @property
     def name(self):
         return self.value["name"]
 
-    @property
-    def rpc_url(self):
-        return self.value["rpc_url"]
+    # Members hash like their Chain record so dicts keyed by either type find entries made with the other
+    def __eq__(self, other):
+        if isinstance(other, Chains):
+            return self is other
+        if isinstance(other, Chain):
+            return self.chain_id == other.chain_id
+        return NotImplemented
 
-    @property
-    def explorer_url(self):
-        return self.value["explorer_url"]
+    def __hash__(self):
+        return hash(self.chain_id)
 
-    @property
-    def symbol(self):
-        return self.value["symbol"]
\ No newline at end of file
+
+class ChainRegistry:
+    """
+    A registry of Chain records indexed by chain ID, name and symbol.
+
+    Names and symbols are matched case-insensitively. When two chains share a symbol the first registered one keeps it.
+    """
+    def __init__(self):
+        self._chains = {}
+        self._by_name = {}
+        self._by_symbol = {}
+
+    def register(self, chain, aliases: tuple = ()) -> Chain:
+        """
+        Add a chain, replacing any chain registered under the same chain ID.
+
+        Args:
+            chain (Chain or Chains or dict): The chain to register.
+            aliases (tuple, optional): Extra names the chain can be looked up by.
+
+        Returns:
+            Chain: The registered record.
+        """
+        if isinstance(chain, dict):
+            chain = Chain.from_dict(chain)
+        elif isinstance(chain, Chains):
+            aliases = (chain._name_,) + tuple(aliases)
+            chain = chain.record
+        previous = self._chains.get(chain.chain_id)
+        if previous is not None:
+            for index in (self._by_name, self._by_symbol):
+                for key in [key for key, value in index.items() if value is previous]:
+                    index[key] = chain
+        self._chains[chain.chain_id] = chain
+        for name in (chain.name,) + tuple(aliases):
+            self._by_name[name.lower()] = chain
+        self._by_symbol.setdefault(chain.symbol.lower(), chain)
+        return chain
+
+    def set_endpoints(self, chain, rpc_urls: list) -> Chain:
+        """
+        Replace the RPC endpoints of a registered chain.
+
+        Args:
+            chain: Anything get() accepts.
+            rpc_urls (list): The new endpoints, primary first.
+
+        Returns:
+            Chain: The updated record.
+        """
+        if not rpc_urls:
+            raise InvalidChainConfigError(f"No RPC URLs given for chain {chain!r}")
+        return self.register(self.resolve(chain).replace(rpc_urls=tuple(rpc_urls)))
+
+    def get(self, key, default=None):
+        """
+        Look up a chain by chain ID, name, symbol, Chains member or Chain record.
+
+        Returns:
+            Chain: The registered record, or default if nothing matches.
+        """
+        if isinstance(key, (Chain, Chains)):
+            return self._chains.get(key.chain_id, default)
+        if isinstance(key, bool):
+            return default
+        if isinstance(key, int):
+            return self._chains.get(key, default)
+        if isinstance(key, str):
+            lowered = key.lower()
+            chain = self._by_name.get(lowered) or self._by_symbol.get(lowered)
+            if chain is None and key.isdigit():
+                chain = self._chains.get(int(key))
+            return default if chain is None else chain
+        return default
+
+    def by_chain_id(self, chain_id: int) -> Chain:
+        if isinstance(chain_id, bool):
+            raise UnknownChainError(chain_id)
+        try:
+            return self._chains[chain_id]
+        except KeyError:
+            raise UnknownChainError(chain_id) from None
+
+    def by_name(self, name: str) -> Chain:
+        try:
+            return self._by_name[name.lower()]
+        except KeyError:
+            raise UnknownChainError(name) from None
+
+    def by_symbol(self, symbol: str) -> Chain:
+        try:
+            return self._by_symbol[symbol.lower()]
+        except KeyError:
+            raise UnknownChainError(symbol) from None
+
+    def resolve(self, chain) -> Chain:
+        """
+        Turn any chain reference into a Chain record.
+
+        Unregistered Chain records are returned unchanged so ad hoc chains keep working.
+
+        Raises:
+            UnknownChainError: If the reference does not match a registered chain.
+        """
+        resolved = self.get(chain)
+        if resolved is not None:
+            return resolved
+        if isinstance(chain, Chain):
+            return chain
+        if isinstance(chain, Chains):
+            return chain.record
+        raise UnknownChainError(chain)
+
+    def load_config(self, path: str):
+        """
+        Load user-defined chains and endpoint lists from a JSON file.
+
+        The file may contain a "chains" list of chain definitions and an "endpoints" object mapping a chain ID,
+        name or symbol to a list of RPC URLs.
+
+        Args:
+            path (str): The path of the config file.
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                config = json.load(file)
+        except (OSError, ValueError) as e:
+            raise InvalidChainConfigError(f"Could not read chain config {path}: {e}") from e
+        if not isinstance(config, dict):
+            raise InvalidChainConfigError(f"Chain config {path} must be a JSON object")
+
+        for definition in config.get("chains", []):
+            self.register(Chain.from_dict(definition), aliases=tuple(definition.get("aliases", ())))
+        for key, rpc_urls in config.get("endpoints", {}).items():
+            self.set_endpoints(key, rpc_urls)
+
+    def __iter__(self):
+        return iter(list(self._chains.values()))
+
+    def __len__(self):
+        return len(self._chains)
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+
+def resolve_chain(chain):
+    """
+    Resolve a chain reference through the default registry, passing None through.
+    """
+    return None if chain is None else chain_registry.resolve(chain)
+
+
+chain_registry = ChainRegistry()
+for _chain in Chains:
+    chain_registry.register(_chain)
+
+_config_path = os.environ.get("NFTPY_CHAINS_CONFIG", os.path.join(os.path.expanduser("~"), ".nftpy", "chains.json"))
+if os.path.isfile(_config_path):
+    chain_registry.load_config(_config_path)
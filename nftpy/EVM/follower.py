@@ -0,0 +1,199 @@
+import asyncio
+import time
+from collections import OrderedDict
+import requests
+from web3 import Web3
+from web3.exceptions import BlockNotFound
+from .chains import Chains, resolve_chain
+from .provider import connect
+from ..errors import *
+
+# Errors a healthy node recovers from, e.g. a load balanced RPC reporting a head one of its backends cannot serve yet
+_TRANSIENT_ERRORS = (requests.ConnectionError, requests.Timeout, BlockNotFound)
+
+
+class NewBlockEvent:
+    """
+    Emitted for every block that becomes part of the followed chain.
+
+    Args:
+        chain (Chains): The chain the block belongs to.
+        header (dict): The block header (the block without its transaction list).
+    """
+    def __init__(self, chain, header):
+        self.chain = chain
+        self.header = header
+        self.number = header["number"]
+        self.hash = header["hash"]
+        self.parent_hash = header["parentHash"]
+        self.timestamp = header["timestamp"]
+
+    def __repr__(self):
+        return f"NewBlockEvent(number={self.number}, hash={Web3.to_hex(self.hash)})"
+
+
+class RollbackEvent:
+    """
+    Emitted when a reorg replaced blocks that were already yielded.
+
+    Args:
+        chain (Chains): The chain the reorg happened on.
+        dropped (list): (number, hash) pairs of the orphaned blocks, newest first.
+        common_ancestor (int): The number of the last block shared by both branches.
+    """
+    def __init__(self, chain, dropped, common_ancestor):
+        self.chain = chain
+        self.dropped = dropped
+        self.common_ancestor = common_ancestor
+        self.depth = len(dropped)
+
+    def __repr__(self):
+        return f"RollbackEvent(depth={self.depth}, common_ancestor={self.common_ancestor})"
+
+
+class BlockFollower:
+    """
+    Follows the head of a chain and yields block headers as they arrive.
+
+    The follower polls ``eth_blockNumber`` and only fetches blocks it has not seen yet. Every new block is checked
+    against the hash remembered for its parent; on a mismatch the orphaned blocks are reported through a
+    RollbackEvent and the canonical replacements are yielded again.
+
+    Args:
+        chain (Chains, optional): The chain to follow.
+        rpc_url (str, optional): Custom RPC URL. If not provided, the chain's default URL is used.
+        poll_interval (float, optional): Seconds to wait between polls when no new block is available.
+        max_reorg_depth (int, optional): Number of recent block hashes kept for reorg detection.
+        web3 (Web3, optional): An existing connection to reuse.
+    """
+    def __init__(self, chain=Chains.ETH, rpc_url: str = None, poll_interval: float = 2.0, max_reorg_depth: int = 64,
+                 web3: Web3 = None):
+        self.chain = resolve_chain(chain)
+        self.poll_interval = poll_interval
+        self.max_reorg_depth = max_reorg_depth
+        self._rpc_url = rpc_url or self.chain.rpc_url
+        self._web3 = web3
+        self._hashes = OrderedDict()
+        self._next_number = None
+
+    def _connect(self):
+        if self._web3 is None:
+            conn = connect(self._rpc_url, self.chain)
+            if not conn.is_connected():
+                raise InvalidRPCURL(self._rpc_url, self.chain.name if self.chain else None)
+            self._web3 = conn
+        return self._web3
+
+    def _get_header(self, block_identifier):
+        block = self._connect().eth.get_block(block_identifier)
+        return {key: value for key, value in block.items() if key != "transactions"}
+
+    def _remember(self, event):
+        self._hashes[event.number] = event.hash
+        while len(self._hashes) > self.max_reorg_depth:
+            self._hashes.popitem(last=False)
+
+    def _rollback(self, header):
+        dropped = []
+        replacements = []
+        number = header["number"] - 1
+        expected = header["parentHash"]
+        while number in self._hashes and self._hashes[number] != expected:
+            canonical = self._get_header(number)
+            dropped.append((number, self._hashes[number]))
+            replacements.append(canonical)
+            expected = canonical["parentHash"]
+            number -= 1
+
+        # Only forget the orphaned hashes once every replacement was fetched, so a failed fetch can be retried
+        for dropped_number, _ in dropped:
+            del self._hashes[dropped_number]
+        events = [RollbackEvent(self.chain, dropped, number)]
+        for canonical in reversed(replacements):
+            event = NewBlockEvent(self.chain, canonical)
+            self._remember(event)
+            events.append(event)
+        return events
+
+    def _process(self, header):
+        events = []
+        parent_hash = self._hashes.get(header["number"] - 1)
+        if parent_hash is not None and parent_hash != header["parentHash"]:
+            events.extend(self._rollback(header))
+        event = NewBlockEvent(self.chain, header)
+        self._remember(event)
+        events.append(event)
+        return events
+
+    def poll(self, start_block: int = None) -> list:
+        """
+        Fetch every block produced since the last poll.
+
+        Args:
+            start_block (int, optional): The first block to yield on the first poll. Defaults to the current head.
+
+        Returns:
+            list: NewBlockEvent and RollbackEvent objects in the order they happened. If fetching a block fails after
+            earlier blocks were fetched, those are returned and the failed block is fetched again on the next poll.
+        """
+        latest = self._connect().eth.block_number
+        if self._next_number is None:
+            self._next_number = latest if start_block is None else start_block
+
+        events = []
+        while self._next_number <= latest:
+            try:
+                block_events = self._process(self._get_header(self._next_number))
+            except Exception:
+                if events:
+                    break
+                raise
+            events.extend(block_events)
+            self._next_number += 1
+        return events
+
+    def _poll_or_wait(self, start_block):
+        try:
+            return self.poll(start_block)
+        except _TRANSIENT_ERRORS:
+            return []
+
+    def follow(self, start_block: int = None):
+        """
+        Yield block events forever, sleeping between polls while the chain is idle. Connection errors, timeouts and
+        BlockNotFound are retried after poll_interval.
+
+        Args:
+            start_block (int, optional): The first block to yield. Defaults to the current head.
+
+        Yields:
+            NewBlockEvent or RollbackEvent: The next event on the chain.
+        """
+        while True:
+            events = self._poll_or_wait(start_block)
+            yield from events
+            if not events:
+                time.sleep(self.poll_interval)
+
+    async def follow_async(self, start_block: int = None):
+        """
+        Async variant of follow. RPC calls run in a worker thread so the event loop is never blocked.
+
+        Args:
+            start_block (int, optional): The first block to yield. Defaults to the current head.
+
+        Yields:
+            NewBlockEvent or RollbackEvent: The next event on the chain.
+        """
+        while True:
+            events = await asyncio.to_thread(self._poll_or_wait, start_block)
+            for event in events:
+                yield event
+            if not events:
+                await asyncio.sleep(self.poll_interval)
+
+    def __iter__(self):
+        return self.follow()
+
+    def __aiter__(self):
+        return self.follow_async()
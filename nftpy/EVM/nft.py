@@ -1,31 +1,45 @@
 import json
-import requests
-from .chains import Chains
+from .chains import Chains, resolve_chain
 from .abi import ABI
-from web3 import Web3
+from .provider import connect
 from ..errors import *
+from ..transport import HTTPTransport, get_default_transport
+from ..concurrency import SingleFlight
+from ..instrumentation import instrumented
 
+_contract_calls = SingleFlight()
 
+
+@instrumented
 class NFT:
-    def __init__(self, contract_address: str, network=Chains.ETH, rpc_url: str = None, abi: ABI = ABI.ERC721):
+    def __init__(self, contract_address: str, network=Chains.ETH, rpc_url: str = None, abi: ABI = ABI.ERC721,
+                 transport: HTTPTransport = None):
         """
         Creates an Object Interface for interaction with a contract on chain
 
         Args:
             contract_address (str): The address of the NFT contract.
-            network (Chains): The blockchain network on which the contract is deployed (ex. Chains.ETH).
+            network (Chains): The blockchain network on which the contract is deployed (ex. Chains.ETH). A Chain
+                record, chain ID, name or symbol from the chain registry is accepted as well.
             rpc_url (str): Optional custom RPC URL. If not provided, the default URL for the network will be used.
             abi (ABI): The ABI of the contract.
+            transport (HTTPTransport): Optional pooled transport used to fetch token metadata.
         """
         self.contract_address = contract_address
-        self.network = network
+        self.network = resolve_chain(network)
         self.abi = abi.value
+        self._transport = transport or get_default_transport()
         if rpc_url is None:
-            self.web3 = Web3(Web3.HTTPProvider(self.network.rpc_url))
+            self.web3 = connect(self.network.rpc_url, self.network)
         else:
-            self.web3 = Web3(Web3.HTTPProvider(rpc_url))
+            self.web3 = connect(rpc_url, self.network)
         self.contract = self.web3.eth.contract(address=self.contract_address, abi=self.abi)
 
+    def _call(self, function_name: str, *args):
+        # Concurrent identical reads of the same contract through the same endpoint share one RPC call
+        key = (getattr(self.web3.provider, "endpoint_uri", None), self.contract_address, function_name, repr(args))
+        return _contract_calls.do(key, lambda: getattr(self.contract.functions, function_name)(*args).call())
+
     def get_balance(self, wallet_address: str) -> int:
         """
         Get the balance of tokens owned by a specific wallet address.
@@ -37,7 +51,7 @@ class NFT:
             int: The balance of tokens.
         """
         try:
-            return self.contract.functions.balanceOf(wallet_address).call()
+            return self._call('balanceOf', wallet_address)
         except Exception as e:
             raise ContractFunctionFailedError('balanceOf') from e
 
@@ -52,7 +66,7 @@ class NFT:
             str: The URI of the token.
         """
         try:
-            return self.contract.functions.tokenURI(token_id).call()
+            return self._call('tokenURI', token_id)
         except Exception as e:
             raise ContractFunctionFailedError('tokenURI') from e
 
@@ -67,7 +81,7 @@ class NFT:
             str: The address of the owner.
         """
         try:
-            return self.contract.functions.ownerOf(token_id).call()
+            return self._call('ownerOf', token_id)
         except Exception as e:
             raise ContractFunctionFailedError('ownerOf') from e
 
@@ -82,7 +96,7 @@ class NFT:
             str: The address that is approved for the token.
         """
         try:
-            return self.contract.functions.getApproved(token_id).call()
+            return self._call('getApproved', token_id)
         except Exception as e:
             raise ContractFunctionFailedError('getApproved') from e
 
@@ -98,7 +112,7 @@ class NFT:
             bool: True if the operator is approved for all tokens, False otherwise.
         """
         try:
-            return self.contract.functions.isApprovedForAll(owner_address, operator_address).call()
+            return self._call('isApprovedForAll', owner_address, operator_address)
         except Exception as e:
             raise ContractFunctionFailedError('isApprovedForAll') from e
 
@@ -115,7 +129,7 @@ class NFT:
         """
         try:
             token_uri = self.get_token_uri(token_id)
-            response = requests.get(token_uri)
+            response = self._transport.get(token_uri)
             return response.json()
         except Exception as e:
             raise ContractFunctionFailedError('get_token_metadata') from e
@@ -132,7 +146,7 @@ class NFT:
             dict: A dictionary where the key is the token ID and the value is the balance.
         """
         try:
-            balances = self.contract.functions.balanceOfBatch([wallet_address] * len(token_ids), token_ids).call()
+            balances = self._call('balanceOfBatch', [wallet_address] * len(token_ids), token_ids)
             return {token_id: balance for token_id, balance in zip(token_ids, balances)}
         except Exception as e:
             raise ContractFunctionFailedError('balanceOfBatch') from e
@@ -149,7 +163,7 @@ class NFT:
             bool: True if the operator is approved for all tokens, False otherwise.
         """
         try:
-            return self.contract.functions.isApprovedForAll(owner_address, operator_address).call()
+            return self._call('isApprovedForAll', owner_address, operator_address)
         except Exception as e:
             raise ContractFunctionFailedError('isApprovedForAll') from e
 
@@ -165,6 +179,6 @@ class NFT:
             int: The balance of the token.
         """
         try:
-            return self.contract.functions.balanceOf(wallet_address, token_id).call()
+            return self._call('balanceOf', wallet_address, token_id)
         except Exception as e:
             raise ContractFunctionFailedError('balanceOf') from e
@@ -0,0 +1,99 @@
+import time
+from threading import local
+import requests
+from web3 import Web3, HTTPProvider
+from ..cassette import _cassettes, rpc_key
+from ..codec import dumps, loads
+from ..instrumentation import _observers, report
+
+
+class CodecHTTPProvider(HTTPProvider):
+    """
+    An HTTPProvider that decodes JSON-RPC responses with the configured JSON backend.
+
+    Args:
+        chain (Chain, optional): The chain the endpoint serves, reported to instrumentation observers.
+    """
+    def __init__(self, *args, chain=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.chain = chain
+        self._response_sizes = local()
+
+    def decode_rpc_response(self, raw_response: bytes):
+        if _observers:
+            self._response_sizes.last = len(raw_response)
+        return loads(raw_response)
+
+    def make_request(self, method, params):
+        if not _observers and not _cassettes:
+            return super().make_request(method, params)
+        self._response_sizes.last = 0
+        started = time.perf_counter()
+        try:
+            response = self._exchange(method, params, started)
+        except Exception as e:
+            if _observers:
+                status = getattr(getattr(e, "response", None), "status_code", None)
+                report("rpc", method, self.endpoint_uri, status, self._response_sizes.last, started, e,
+                       chain=self.chain)
+            raise
+        if _observers:
+            error = "JSONRPCError" if isinstance(response, dict) and response.get("error") else None
+            report("rpc", method, self.endpoint_uri, 200, self._response_sizes.last, started, error, chain=self.chain)
+        return response
+
+    def _exchange(self, method, params, started):
+        cassette = _cassettes[0] if _cassettes else None
+        if cassette is None:
+            return super().make_request(method, params)
+        # Keyed on the encoded params so values web3 serializes (bytes, addresses) match across runs
+        request = loads(self.encode_rpc_request(method, params))
+        key = rpc_key(self.endpoint_uri, method, request.get("params"))
+        if cassette.replaying:
+            exchange = cassette.next("rpc", key)
+            if exchange is not None:
+                time.sleep(cassette.delay(exchange))
+                if exchange.error == "timeout":
+                    raise requests.Timeout(f"Recorded timeout for {key}")
+                if exchange.error == "http":
+                    response = requests.Response()
+                    response.status_code = exchange.status
+                    raise requests.HTTPError(f"{exchange.status} Error for url: {self.endpoint_uri}",
+                                             response=response)
+                if exchange.error is not None:
+                    raise requests.ConnectionError(f"Recorded connection error for {key}")
+                self._response_sizes.last = len(exchange.content)
+                response = loads(exchange.content)
+                # The request IDs of the replay differ from the recording
+                response["id"] = request.get("id")
+                return response
+            return super().make_request(method, params)
+        try:
+            response = super().make_request(method, params)
+        except requests.HTTPError as e:
+            cassette.add("rpc", key, started, getattr(e.response, "status_code", None), error="http")
+            raise
+        except (requests.ConnectionError, requests.Timeout) as e:
+            cassette.add("rpc", key, started, error="timeout" if isinstance(e, requests.Timeout) else "connection")
+            raise
+        cassette.add("rpc", key, started, 200, content=dumps(response).encode("utf-8"), url=self.endpoint_uri)
+        return response
+
+
+def http_provider(rpc_url: str, chain=None, **kwargs) -> CodecHTTPProvider:
+    """
+    Create the HTTP provider used for every RPC connection.
+
+    Args:
+        rpc_url (str): The RPC endpoint.
+        chain (Chain, optional): The chain the endpoint serves.
+        **kwargs: Passed to HTTPProvider, e.g. request_kwargs.
+    """
+    return CodecHTTPProvider(rpc_url, chain=chain, **kwargs)
+
+
+def connect(rpc_url: str, chain=None) -> Web3:
+    """
+    Create a Web3 connection to an RPC endpoint.
+    """
+    return Web3(http_provider(rpc_url, chain=chain))
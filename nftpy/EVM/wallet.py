@@ -1,11 +1,19 @@
 import time
+from queue import Queue
+from contextvars import copy_context
 from threading import Thread
 from web3 import Web3
 from web3.exceptions import TransactionNotFound
 from .abi import ABI
-from .chains import Chains
+from .chains import chain_registry, resolve_chain
+from .follower import BlockFollower
+from .provider import connect
 from ..errors import *
+from ..instrumentation import instrumented
 
+_ALREADY_KNOWN_ERRORS = ("already known", "known transaction", "alreadyknown", "already imported", "already exists")
+
+@instrumented
 class NFTWallet:
     """
     A class to interact with NFTs on various EVM Based networks from a wallet.
@@ -21,7 +29,7 @@ class NFTWallet:
             raise NoCredentialsProvidedError()
         self._private_key = private_key
         self._address = address or self._get_address_from_private_key()
-        self.chains = chains or []
+        self.chains = [resolve_chain(chain) for chain in chains] if chains else []
         self._rpc_url = rpc_url
         self._connections = self._connect_to_chains()
 
@@ -30,8 +38,8 @@ class NFTWallet:
         return account.address
 
     def _connect_to_chains(self):
-        def connect(chain, connections):
-            conn = Web3(Web3.HTTPProvider(chain.rpc_url))
+        def connect_chain(chain, connections):
+            conn = connect(chain.rpc_url, chain)
             if not conn.is_connected():
                 raise InvalidRPCURL(chain.rpc_url, chain.name)
             connections.append((chain, conn))
@@ -40,22 +48,22 @@ class NFTWallet:
         threads = []
 
         if not self.chains and not self._rpc_url:
-            for chain in Chains:
-                thread = Thread(target=connect, args=(chain, connections))
+            for chain in chain_registry:
+                thread = Thread(target=connect_chain, args=(chain, connections))
                 threads.append(thread)
                 thread.start()
         elif self.chains and not self._rpc_url:
             for chain in self.chains:
-                thread = Thread(target=connect, args=(chain, connections))
+                thread = Thread(target=connect_chain, args=(chain, connections))
                 threads.append(thread)
                 thread.start()
         elif self.chains and self._rpc_url:
             for chain in self.chains:
-                thread = Thread(target=connect, args=(chain, connections))
+                thread = Thread(target=connect_chain, args=(chain, connections))
                 threads.append(thread)
                 thread.start()
         elif not self.chains and self._rpc_url:
-            conn = Web3(Web3.HTTPProvider(self._rpc_url))
+            conn = connect(self._rpc_url)
             if not conn.is_connected():
                 raise InvalidRPCURL(self._rpc_url)
             connections.append((None, conn))
@@ -74,7 +82,8 @@ class NFTWallet:
             results[chain.symbol if chain else ""] = result
 
         for chain, conn in self._connections:
-            thread = Thread(target=query, args=(chain, conn, results))
+            # Run in a copy of the caller's context so instrumentation labels the RPCs with the calling method
+            thread = Thread(target=copy_context().run, args=(query, chain, conn, results))
             threads.append(thread)
             thread.start()
 
@@ -93,8 +102,9 @@ class NFTWallet:
         Returns:
             dict: A dictionary with the chain symbol as key and the balance as value.
         """
+        chain = resolve_chain(chain)
         if chain:
-            conn = Web3(Web3.HTTPProvider(chain.rpc_url))
+            conn = connect(chain.rpc_url, chain)
             if conn.is_connected():
                 balance = conn.eth.get_balance(self._address)
                 return {chain.symbol: balance}
@@ -115,8 +125,9 @@ class NFTWallet:
         Returns:
             dict: A dictionary with the chain symbol as key and the balance as value.
         """
+        chain = resolve_chain(chain)
         if chain:
-            conn = Web3(Web3.HTTPProvider(chain.rpc_url))
+            conn = connect(chain.rpc_url, chain)
             if conn.is_connected():
                 balance = conn.eth.get_balance(self._address)
                 return {chain.symbol: Web3.from_wei(balance, 'ether')}
@@ -138,8 +149,9 @@ class NFTWallet:
         Returns:
             dict: A dictionary with the chain symbol as key and the gas price as value.
         """
+        chain = resolve_chain(chain)
         if chain:
-            conn = Web3(Web3.HTTPProvider(chain.rpc_url))
+            conn = connect(chain.rpc_url, chain)
             if conn.is_connected():
                 gas_price = conn.eth.gas_price
                 return {chain.symbol: gas_price}
@@ -160,8 +172,9 @@ class NFTWallet:
         Returns:
             dict: A dictionary with the chain symbol as key and the gas price as value.
         """
+        chain = resolve_chain(chain)
         if chain:
-            conn = Web3(Web3.HTTPProvider(chain.rpc_url))
+            conn = connect(chain.rpc_url, chain)
             if conn.is_connected():
                 gas_price = conn.eth.gas_price
                 return {chain.symbol: Web3.from_wei(gas_price, 'gwei')}
@@ -175,7 +188,7 @@ class NFTWallet:
 
     def transfer_nft(self, to: str, contract_address: str, amount: int, gas_limit: int, gas_price_gwei: int = None,
                      gas_price_wei: int = None, abi: ABI = None, abi_str: str = None,
-                     chain = None, token_id: int = None) -> dict:
+                     chain = None, token_id: int = None, broadcast: bool = False) -> dict:
         """
         Transfer an NFT to another wallet.
 
@@ -190,6 +203,8 @@ class NFTWallet:
             abi_str (str, optional): The ABI as a string.
             chain (Chains, optional): The specific chain to perform the transfer on.
             token_id (int, optional): The token ID of the NFT to transfer.
+            broadcast (bool, optional): Send the signed transaction to every RPC endpoint of the chain at once
+                and return as soon as the first one accepts it.
 
         Returns:
             dict: A dictionary with the transaction hash and explorer URL.
@@ -198,17 +213,13 @@ class NFTWallet:
             raise WalletReadOnlyError()
         if chain is None and not self.chains:
             raise MissingChainError()
-        chain = chain or self.chains[0]
+        chain = resolve_chain(chain) or self.chains[0]
 
         if gas_price_gwei is None and gas_price_wei is None:
             raise ValueError("Either gas_price_gwei or gas_price_wei must be provided.")
 
         gas_price = gas_price_wei if gas_price_wei is not None else Web3.to_wei(gas_price_gwei, 'gwei')
 
-        conn = Web3(Web3.HTTPProvider(chain.rpc_url))
-        if not conn.is_connected():
-            raise InvalidRPCURL(chain.rpc_url, chain.name)
-
         if abi is not None:
             contract_abi = abi.value
         elif abi_str is not None:
@@ -216,9 +227,16 @@ class NFTWallet:
         else:
             raise ValueError("Either abi or abi_str must be provided.")
 
+        if broadcast:
+            conn, nonce = self._broadcast_nonce(chain)
+        else:
+            conn = connect(chain.rpc_url, chain)
+            if not conn.is_connected():
+                raise InvalidRPCURL(chain.rpc_url, chain.name)
+            nonce = conn.eth.get_transaction_count(self._address)
+
         contract = conn.eth.contract(address=contract_address, abi=contract_abi)
 
-        nonce = conn.eth.get_transaction_count(self._address)
         tx = {
             'nonce': nonce,
             'to': contract_address,
@@ -234,7 +252,10 @@ class NFTWallet:
         signed_tx = conn.eth.account.sign_transaction(tx, private_key=self._private_key)
 
         try:
-            tx_hash = conn.eth.send_raw_transaction(signed_tx.rawTransaction)
+            if broadcast:
+                tx_hash = self._broadcast_raw_transaction(chain, signed_tx)
+            else:
+                tx_hash = conn.eth.send_raw_transaction(signed_tx.rawTransaction)
             if chain.explorer_url != None:
                 return {
                     'transaction_hash': tx_hash.hex(),
@@ -252,6 +273,75 @@ class NFTWallet:
             else:
                 raise e
 
+    def _broadcast_nonce(self, chain):
+        """
+        Read the wallet nonce from all RPC endpoints of a chain concurrently.
+
+        The highest nonce wins, so an endpoint lagging behind cannot make the broadcast reuse a spent nonce.
+
+        Args:
+            chain (Chains): The chain to broadcast on.
+
+        Returns:
+            tuple: A connection to an endpoint reporting the highest nonce, and that nonce.
+        """
+        endpoints = list(dict.fromkeys(chain.rpc_urls))
+        results = Queue()
+
+        def read(rpc_url):
+            try:
+                conn = connect(rpc_url, chain)
+                results.put((conn, conn.eth.get_transaction_count(self._address)) if conn.is_connected() else None)
+            except Exception:
+                results.put(None)
+
+        for rpc_url in endpoints:
+            Thread(target=read, args=(rpc_url,), daemon=True).start()
+
+        healthy = [result for result in (results.get() for _ in endpoints) if result is not None]
+        if not healthy:
+            raise InvalidRPCURL(chain.rpc_url, chain.name)
+        return max(healthy, key=lambda result: result[1])
+
+    def _broadcast_raw_transaction(self, chain, signed_tx):
+        """
+        Send a signed transaction to all RPC endpoints of a chain concurrently.
+
+        An endpoint answering that the transaction is already known counts as accepted.
+
+        Args:
+            chain (Chains): The chain to broadcast on.
+            signed_tx: The signed transaction.
+
+        Returns:
+            HexBytes: The hash of the first accepted transaction.
+        """
+        endpoints = list(dict.fromkeys(chain.rpc_urls))
+        results = Queue()
+
+        def send(rpc_url):
+            try:
+                conn = connect(rpc_url, chain)
+                results.put((conn.eth.send_raw_transaction(signed_tx.rawTransaction), None))
+            except Exception as e:
+                if any(marker in str(e).lower() for marker in _ALREADY_KNOWN_ERRORS):
+                    results.put((signed_tx.hash, None))
+                else:
+                    results.put((None, e))
+
+        for rpc_url in endpoints:
+            Thread(target=send, args=(rpc_url,), daemon=True).start()
+
+        errors = []
+        for _ in endpoints:
+            tx_hash, error = results.get()
+            if error is None:
+                return tx_hash
+            errors.append(error)
+
+        # Prefer an RPC rejection over a network failure so the gas/balance checks in transfer_nft still apply
+        raise next((e for e in errors if isinstance(e, ValueError)), errors[0])
+
     def wait_until_transaction_processes(self, tx_hash, chain) -> bool:
         """
         Wait until a transaction is processed.
@@ -265,8 +355,9 @@ class NFTWallet:
         """
         if isinstance(tx_hash, str):
             tx_hash = Web3.to_bytes(hexstr=tx_hash)
+        chain = resolve_chain(chain)
 
-        conn = Web3(Web3.HTTPProvider(chain.rpc_url))
+        conn = connect(chain.rpc_url, chain)
         if not conn.is_connected():
             raise InvalidRPCURL(chain.rpc_url, chain.name)
 
@@ -289,8 +380,9 @@ class NFTWallet:
         Returns:
             dict: A dictionary with the chain symbol as key and the transaction count as value.
         """
+        chain = resolve_chain(chain)
         if chain:
-            conn = Web3(Web3.HTTPProvider(chain.rpc_url))
+            conn = connect(chain.rpc_url, chain)
             if conn.is_connected():
                 count = conn.eth.get_transaction_count(self._address)
                 return {chain.symbol: count}
@@ -314,8 +406,9 @@ class NFTWallet:
         Returns:
             dict: A dictionary with the chain symbol as key and the gas estimate as value.
         """
+        chain = resolve_chain(chain)
         if chain:
-            conn = Web3(Web3.HTTPProvider(chain.rpc_url))
+            conn = connect(chain.rpc_url, chain)
             if conn.is_connected():
                 estimate = conn.eth.estimate_gas({'to': to, 'value': value, 'data': data})
                 return {chain.symbol: estimate}
@@ -336,8 +429,9 @@ class NFTWallet:
         Returns:
             dict: A dictionary with the chain symbol as key and the sync status as value.
         """
+        chain = resolve_chain(chain)
         if chain:
-            conn = Web3(Web3.HTTPProvider(chain.rpc_url))
+            conn = connect(chain.rpc_url, chain)
             if conn.is_connected():
                 synced = not conn.eth.syncing
                 return {chain.symbol: synced}
@@ -358,8 +452,9 @@ class NFTWallet:
         Returns:
             dict: A dictionary with the chain symbol as key and the latest block details as value.
         """
+        chain = resolve_chain(chain)
         if chain:
-            conn = Web3(Web3.HTTPProvider(chain.rpc_url))
+            conn = connect(chain.rpc_url, chain)
             if conn.is_connected():
                 block = conn.eth.get_block('latest')
                 return {chain.symbol: block}
@@ -369,3 +464,26 @@ class NFTWallet:
             def get_block(chain, conn):
                 return conn.eth.get_block('latest')
             return self._threaded_query(get_block)
+
+    def follow_blocks(self, chain=None, poll_interval: float = 2.0, max_reorg_depth: int = 64):
+        """
+        Create block followers that stream new block headers and report reorgs.
+
+        Args:
+            chain (Chains, optional): The specific chain to follow.
+            poll_interval (float, optional): Seconds between polls while no new block is available.
+            max_reorg_depth (int, optional): Number of recent block hashes kept for reorg detection.
+
+        Returns:
+            BlockFollower or dict: The follower for the given chain, or a dictionary with the chain symbol as key
+            and a follower as value for every connected chain.
+        """
+        chain = resolve_chain(chain)
+        if chain:
+            return BlockFollower(chain, poll_interval=poll_interval, max_reorg_depth=max_reorg_depth)
+        return {
+            chain.symbol if chain else "": BlockFollower(chain, rpc_url=None if chain else self._rpc_url,
+                                                         poll_interval=poll_interval,
+                                                         max_reorg_depth=max_reorg_depth, web3=conn)
+            for chain, conn in self._connections
+        }
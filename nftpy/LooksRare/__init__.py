@@ -1,3 +1,4 @@
 from .looksrare import LooksRareAPI, LooksRareChain
+from .async_looksrare import AsyncLooksRare
 
-__all__ = {"LooksRareAPI", "LooksRareChain"}
\ No newline at end of file
+__all__ = {"LooksRareAPI", "LooksRareChain", "AsyncLooksRare"}
\ No newline at end of file
@@ -0,0 +1,178 @@
+from ..errors import APIKeyNotSpecifiedOnMainnetError, RateLimitExceededError, InvalidLooksRareAPIRequest, \
+    APIKeyRequiredForPostError
+from termcolor import colored
+from ..transport import AsyncHTTPTransport
+from ..retry import RetryPolicy
+from .looksrare import LooksRareAPI, LooksRareChain
+from ..instrumentation import instrumented
+
+
+@instrumented
+class AsyncLooksRare:
+    """
+    An asyncio counterpart of LooksRareAPI with the same methods, sent through an aiohttp based transport.
+    """
+    _Account = LooksRareAPI._Account
+    _CollectionInformation = LooksRareAPI._CollectionInformation
+    _CollectionStats = LooksRareAPI._CollectionStats
+    _Token = LooksRareAPI._Token
+    _Event = LooksRareAPI._Event
+
+    def __init__(self, chain: LooksRareChain, api_key: str = None, suppress_warnings: bool = False, version: int = 2,
+                 transport: AsyncHTTPTransport = None,
+                 retry_policy: RetryPolicy = None):
+        self._chain = chain
+        self._api_key = api_key
+        self._version = version
+        self._owns_transport = transport is None
+        self._transport = transport or AsyncHTTPTransport()
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._headers = {"Accept": "application/json"}
+        self._post_headers = {
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+            "X-API-KEY": self._api_key
+        }
+        if self._chain == LooksRareChain.MAINNET and self._version == 2:
+            if self._api_key is None:
+                raise APIKeyNotSpecifiedOnMainnetError()
+        elif self._chain == LooksRareChain.SEPOLIA:
+            if self._api_key is not None and suppress_warnings is False:
+                print(colored("[NFTPY]: Warning! API key isn't needed for the Sepolia Network!", 'yellow'))
+
+    async def close(self):
+        if self._owns_transport:
+            await self._transport.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def get_account_by_address(self, address: str, return_raw_json: bool = False):
+        url = f"{self._chain.value}v1/account/{address}"
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy)
+
+        if response.status_code == 429:
+            raise RateLimitExceededError()
+        if response.status_code == 400:
+            raise InvalidLooksRareAPIRequest()
+
+        if not response.ok:
+            response.raise_for_status()
+
+        if return_raw_json:
+            return response.json()
+        return self._Account.from_dict(response.json())
+
+    async def get_collection_by_address(self, address: str, return_raw_json: bool = False):
+        url = f"{self._chain.value}v1/collections/{address}"
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy, cache="collection")
+
+        if response.status_code == 429:
+            raise RateLimitExceededError()
+        if response.status_code == 400:
+            raise InvalidLooksRareAPIRequest()
+
+        if not response.ok:
+            response.raise_for_status()
+
+        if return_raw_json:
+            return response.json()
+        return self._CollectionInformation.from_dict(response.json())
+
+    async def get_collection_stats(self, address: str, return_raw_json: bool = False):
+        url = f"{self._chain.value}v1/collections/stats?collection={address}"
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy)
+
+        if response.status_code == 429:
+            raise RateLimitExceededError()
+        if response.status_code == 400:
+            raise InvalidLooksRareAPIRequest()
+
+        if not response.ok:
+            response.raise_for_status()
+
+        if return_raw_json:
+            return response.json()
+        return self._CollectionStats.from_dict(response.json())
+
+    async def get_lre_eligible_collections(self, return_raw_json: bool = False):
+        url = f"{self._chain.value}v1/collections/lre-eligible"
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy)
+
+        if response.status_code == 429:
+            raise RateLimitExceededError()
+        if response.status_code == 400:
+            raise InvalidLooksRareAPIRequest()
+
+        if not response.ok:
+            response.raise_for_status()
+
+        if return_raw_json:
+            return response.json()
+        return [self._CollectionInformation.from_dict(item) for item in response.json()]
+
+    async def get_collection_token(self, collection_address: str, token_id: str, return_raw_json: bool = False):
+        url = f"{self._chain.value}v1/collections/{collection_address}/tokens/{token_id}"
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy)
+
+        if response.status_code == 429:
+            raise RateLimitExceededError()
+        if response.status_code == 400:
+            raise InvalidLooksRareAPIRequest()
+
+        if not response.ok:
+            response.raise_for_status()
+
+        if return_raw_json:
+            return response.json()
+        return self._Token.from_dict(response.json())
+
+    async def refresh_token_metadata(self, collection_address: str, token_id: str, return_raw_json: bool = False):
+        if self._version == 1 and self._api_key is None:
+            raise APIKeyRequiredForPostError()
+
+        url = f"{self._chain.value}v1/tokens/refresh/{collection_address}/{token_id}"
+        response = await self._transport.post(url, headers=self._post_headers, retry=self._retry_policy)
+
+        if response.status_code == 429:
+            raise RateLimitExceededError()
+        if response.status_code == 400:
+            raise InvalidLooksRareAPIRequest()
+
+        if not response.ok:
+            response.raise_for_status()
+
+        return response.json()
+
+    async def get_events(self, return_raw_json: bool = False):
+        url = f"{self._chain.value}v1/events"
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy)
+
+        if response.status_code == 429:
+            raise RateLimitExceededError()
+        if response.status_code == 400:
+            raise InvalidLooksRareAPIRequest()
+
+        if not response.ok:
+            response.raise_for_status()
+
+        if return_raw_json:
+            return response.json()
+        return self._Event.from_list(response.json())
+
+    async def get_all_rewards(self, return_raw_json: bool = False):
+        url = f"{self._chain.value}v1/rewards"
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy)
+
+        if response.status_code == 429:
+            raise RateLimitExceededError()
+        if response.status_code == 400:
+            raise InvalidLooksRareAPIRequest()
+
+        if not response.ok:
+            response.raise_for_status()
+
+        return response.json()
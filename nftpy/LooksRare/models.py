@@ -0,0 +1,241 @@
+class _Field:
+    """
+    Reads one key of the raw response on access. Nested objects are parsed into ``model`` on first access and cached.
+    """
+    __slots__ = ("key", "default", "model", "name")
+
+    def __init__(self, key: str, default=None, model=None):
+        self.key = key
+        self.default = default
+        self.model = model
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        if self.model is None:
+            return instance._data.get(self.key, self.default)
+        parsed = instance._parsed
+        if parsed is None:
+            parsed = instance._parsed = {}
+        if self.name not in parsed:
+            value = instance._data.get(self.key, self.default)
+            parsed[self.name] = self.model.from_dict(value) if isinstance(value, dict) else value
+        return parsed[self.name]
+
+    def __set__(self, instance, value):
+        instance._data[self.key] = value
+        if instance._parsed:
+            instance._parsed.pop(self.name, None)
+
+
+class _Model:
+    """
+    A LooksRare response object backed by the decoded JSON it was built from.
+
+    Instances hold a reference to the raw dict instead of copying every field, and nested objects are only parsed
+    when they are accessed. Raw keys remain available with ``model["rawKey"]``.
+    """
+    __slots__ = ("_data", "_parsed")
+    _fields = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._fields = tuple(name for name, value in vars(cls).items() if isinstance(value, _Field))
+
+    def __init__(self, *args, **kwargs):
+        if len(args) > len(self._fields):
+            raise TypeError(f"{type(self).__name__} takes at most {len(self._fields)} positional arguments")
+        self._data = {}
+        self._parsed = None
+        for name, value in zip(self._fields, args):
+            setattr(self, name, value)
+        for name, value in kwargs.items():
+            if name not in self._fields:
+                raise TypeError(f"{type(self).__name__} got an unexpected keyword argument '{name}'")
+            setattr(self, name, value)
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        """
+        Wrap a decoded response without copying it. Later attribute assignments write through to ``data``.
+        """
+        instance = cls.__new__(cls)
+        instance._data = data
+        instance._parsed = None
+        return instance
+
+    @classmethod
+    def from_list(cls, items: list) -> list:
+        """
+        Wrap every dict of a decoded list response.
+        """
+        new = cls.__new__
+        instances = []
+        for data in items:
+            instance = new(cls)
+            instance._data = data
+            instance._parsed = None
+            instances.append(instance)
+        return instances
+
+    def to_dict(self) -> dict:
+        return self._data
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def get(self, key, default=None):
+        return self._data.get(key, default)
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)}" for name in self._fields)
+        return f"{type(self).__name__.lstrip('_')}({fields})"
+
+
+class _Account(_Model):
+    __slots__ = ()
+    address = _Field('address')
+    balance = _Field('balance')
+    nonce = _Field('nonce')
+    is_operator = _Field('isOperator')
+    allowances = _Field('allowances')
+    trading_data = _Field('tradingData')
+    profile = _Field('profile')
+    name = _Field('name')
+    biography = _Field('biography')
+    website_link = _Field('websiteLink')
+    instagram_link = _Field('instagramLink')
+    twitter_link = _Field('twitterLink')
+    is_verified = _Field('isVerified', False)
+
+
+class _CollectionInformation(_Model):
+    __slots__ = ()
+    address = _Field('address')
+    owner = _Field('owner')
+    setter = _Field('setter')
+    admin = _Field('admin')
+    name = _Field('name')
+    description = _Field('description')
+    symbol = _Field('symbol')
+    collection_type = _Field('type')
+    website_link = _Field('websiteLink')
+    facebook_link = _Field('facebookLink')
+    twitter_link = _Field('twitterLink')
+    instagram_link = _Field('instagramLink')
+    telegram_link = _Field('telegramLink')
+    medium_link = _Field('mediumLink')
+    discord_link = _Field('discordLink')
+    is_verified = _Field('isVerified', False)
+    is_explicit = _Field('isExplicit', False)
+    logo_uri = _Field('logoURI')
+    banner_uri = _Field('bannerURI')
+
+
+class _CollectionStats(_Model):
+    __slots__ = ()
+    address = _Field('address')
+    count_owners = _Field('countOwners')
+    total_supply = _Field('totalSupply')
+    floor_price = _Field('floorPrice')
+    floor_change_24h = _Field('floorChange24h')
+    floor_change_7d = _Field('floorChange7d')
+    floor_change_30d = _Field('floorChange30d')
+    market_cap = _Field('marketCap')
+    volume_24h = _Field('volume24h')
+    average_24h = _Field('average24h')
+    count_24h = _Field('count24h')
+    change_24h = _Field('change24h')
+    volume_7d = _Field('volume7d')
+    average_7d = _Field('average7d')
+    count_7d = _Field('count7d')
+    change_7d = _Field('change7d')
+    volume_1m = _Field('volume1m')
+    average_1m = _Field('average1m')
+    count_1m = _Field('count1m')
+    change_1m = _Field('change1m')
+    volume_3m = _Field('volume3m')
+    average_3m = _Field('average3m')
+    count_3m = _Field('count3m')
+    change_3m = _Field('change_3m')
+    volume_6m = _Field('volume6m')
+    average_6m = _Field('average6m')
+    count_6m = _Field('count6m')
+    change_6m = _Field('change6m')
+    volume_1y = _Field('volume1y')
+    average_1y = _Field('average1y')
+    count_1y = _Field('count1y')
+    change_1y = _Field('change1y')
+    volume_all = _Field('volumeAll')
+    average_all = _Field('averageAll')
+    count_all = _Field('countAll')
+
+
+class _Order(_Model):
+    __slots__ = ()
+    order_id = _Field('orderId')
+    maker = _Field('maker')
+    taker = _Field('taker')
+    strategy = _Field('strategy')
+    currency = _Field('currency')
+    amount = _Field('amount')
+    price = _Field('price')
+    nonce = _Field('nonce')
+    start_time = _Field('startTime')
+    end_time = _Field('endTime')
+    status = _Field('status')
+    signature = _Field('signature')
+    intermediary = _Field('intermediary')
+    order_type = _Field('type')
+    salt = _Field('salt')
+    extra_params = _Field('extraParams')
+
+
+class _Token(_Model):
+    __slots__ = ()
+    id = _Field('id')
+    collection_address = _Field('collectionAddress')
+    token_id = _Field('tokenId')
+    token_uri = _Field('tokenURI')
+    image_uri = _Field('imageURI')
+    is_explicit = _Field('isExplicit')
+    is_animated = _Field('isAnimated')
+    flag = _Field('flag')
+    name = _Field('name')
+    description = _Field('description')
+    collection = _Field('collection', model=_CollectionInformation)
+
+
+class _ListingReward(_Model):
+    __slots__ = ()
+    proof = _Field('proof')
+    looks_total = _Field('looksTotal')
+    looks_24h = _Field('looks24h')
+    date = _Field('date')
+
+
+class _TradingReward(_Model):
+    __slots__ = ()
+    proof = _Field('proof')
+    looks_total = _Field('looksTotal')
+    looks_24h = _Field('looks24h')
+    volume_total = _Field('volumeTotal')
+    volume_24h = _Field('volume24h')
+    date = _Field('date')
+
+
+class _Event(_Model):
+    __slots__ = ()
+    id = _Field('id')
+    from_address = _Field('from')
+    to_address = _Field('to')
+    event_type = _Field('type')
+    hash = _Field('hash')
+    created_at = _Field('createdAt')
+    collection = _Field('collection', model=_CollectionInformation)
+    token = _Field('token', model=_Token)
+    order = _Field('order', model=_Order)
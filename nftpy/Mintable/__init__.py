@@ -1 +1,2 @@
-from .mintable import Mintable, MintableChain
\ No newline at end of file
+from .mintable import Mintable, MintableChain
+from .async_mintable import AsyncMintable
\ No newline at end of file
@@ -0,0 +1,78 @@
+import asyncio
+from ..transport import AsyncHTTPTransport
+from ..retry import RetryPolicy
+from ..errors import BulkFetchFailedError
+from .mintable import MintableChain
+from ..instrumentation import instrumented
+
+
+@instrumented
+class AsyncMintable:
+    """
+    An asyncio counterpart of Mintable with the same methods, sent through an aiohttp based transport.
+    """
+    def __init__(self, api_key, chain: MintableChain, transport: AsyncHTTPTransport = None,
+                 retry_policy: RetryPolicy = None):
+        self.api_key = api_key
+        self.chain = chain
+        self.base_url = "https://api.mintable.app/v1"
+        self._owns_transport = transport is None
+        self._transport = transport or AsyncHTTPTransport()
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}"
+        }
+
+    async def close(self):
+        if self._owns_transport:
+            await self._transport.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def search_nfts_for_sale(self, query_params=None):
+        url = f"{self.base_url}/marketplace/search"
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=query_params)
+        response.raise_for_status()
+        return response.json()
+
+    async def fetch_single_nft_for_sale(self, nft_id):
+        url = f"{self.base_url}/marketplace/{nft_id}"
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy)
+        response.raise_for_status()
+        return response.json()
+
+    async def fetch_auctions_ending_soon(self, query_params=None):
+        url = f"{self.base_url}/marketplace/auctions/ending-soon"
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=query_params)
+        response.raise_for_status()
+        return response.json()
+
+    async def fetch_hot_auctions(self, query_params=None):
+        url = f"{self.base_url}/marketplace/auctions/hot"
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=query_params)
+        response.raise_for_status()
+        return response.json()
+
+    async def fetch_nfts_for_sale(self, nft_ids: list, max_workers: int = 8):
+        nft_ids = list(nft_ids)
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def bounded_fetch(nft_id):
+            async with semaphore:
+                return await self.fetch_single_nft_for_sale(nft_id)
+
+        pages = await asyncio.gather(*(bounded_fetch(nft_id) for nft_id in nft_ids), return_exceptions=True)
+        results = []
+        errors = []
+        for nft_id, page in zip(nft_ids, pages):
+            if isinstance(page, Exception):
+                errors.append((nft_id, page))
+                page = None
+            results.append(page)
+        if errors:
+            raise BulkFetchFailedError(errors, results)
+        return results
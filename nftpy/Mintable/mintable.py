@@ -1,5 +1,10 @@
-import requests
 from enum import Enum
+from ..transport import HTTPTransport, get_default_transport
+from ..retry import RetryPolicy
+from ..concurrency import bounded_map
+from ..pagination import iterate_numbered_pages
+from ..errors import BulkFetchFailedError
+from ..instrumentation import instrumented
 
 
 class MintableChain(Enum):
@@ -7,41 +12,75 @@ class MintableChain(Enum):
     RINKEBY = 4
 
 
+@instrumented
 class Mintable:
-    def __init__(self, api_key, chain: MintableChain):
+    def __init__(self, api_key, chain: MintableChain, transport: HTTPTransport = None,
+                 retry_policy: RetryPolicy = None):
         self.api_key = api_key
         self.chain = chain
         self.base_url = "https://api.mintable.app/v1"
-
-    def _get_headers(self):
-        return {
+        self._transport = transport or get_default_transport()
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._headers = {
             "Authorization": f"Bearer {self.api_key}"
         }
 
+    def _get_headers(self):
+        return self._headers
+
     def search_nfts_for_sale(self, query_params=None):
         url = f"{self.base_url}/marketplace/search"
-        headers = self._get_headers()
-        response = requests.get(url, headers=headers, params=query_params)
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=query_params)
         response.raise_for_status()
         return response.json()
 
     def fetch_single_nft_for_sale(self, nft_id):
         url = f"{self.base_url}/marketplace/{nft_id}"
-        headers = self._get_headers()
-        response = requests.get(url, headers=headers)
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy)
         response.raise_for_status()
         return response.json()
 
     def fetch_auctions_ending_soon(self, query_params=None):
         url = f"{self.base_url}/marketplace/auctions/ending-soon"
-        headers = self._get_headers()
-        response = requests.get(url, headers=headers, params=query_params)
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=query_params)
         response.raise_for_status()
         return response.json()
 
     def fetch_hot_auctions(self, query_params=None):
         url = f"{self.base_url}/marketplace/auctions/hot"
-        headers = self._get_headers()
-        response = requests.get(url, headers=headers, params=query_params)
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=query_params)
         response.raise_for_status()
         return response.json()
+
+    def fetch_nfts_for_sale(self, nft_ids: list, max_workers: int = 8):
+        nft_ids = list(nft_ids)
+        results = []
+        errors = []
+        for nft_id, (result, error) in zip(nft_ids, bounded_map(self.fetch_single_nft_for_sale, nft_ids, max_workers)):
+            if error is not None:
+                errors.append((nft_id, error))
+            results.append(result)
+        if errors:
+            raise BulkFetchFailedError(errors, results)
+        return results
+
+    def _iter_pages(self, fetch, query_params, page_size, page_param, size_param, prefetch, max_pages):
+        query_params = dict(query_params or {})
+        return iterate_numbered_pages(
+            lambda page: fetch(dict(query_params, **{page_param: page, size_param: page_size})),
+            page_size, prefetch=prefetch, max_pages=max_pages)
+
+    def iter_nfts_for_sale(self, query_params=None, page_size: int = 50, page_param: str = "page",
+                           size_param: str = "limit", prefetch: bool = False, max_pages: int = None):
+        return self._iter_pages(self.search_nfts_for_sale, query_params, page_size, page_param, size_param, prefetch,
+                                max_pages)
+
+    def iter_auctions_ending_soon(self, query_params=None, page_size: int = 50, page_param: str = "page",
+                                  size_param: str = "limit", prefetch: bool = False, max_pages: int = None):
+        return self._iter_pages(self.fetch_auctions_ending_soon, query_params, page_size, page_param, size_param,
+                                prefetch, max_pages)
+
+    def iter_hot_auctions(self, query_params=None, page_size: int = 50, page_param: str = "page",
+                          size_param: str = "limit", prefetch: bool = False, max_pages: int = None):
+        return self._iter_pages(self.fetch_hot_auctions, query_params, page_size, page_param, size_param, prefetch,
+                                max_pages)
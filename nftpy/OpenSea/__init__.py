@@ -1,5 +1,7 @@
 from .opensea import OpenSea, OpenSeaChain
 from .collection import OpenSeaCollection
 from .wallet import OpenSeaWallet
+from .async_opensea import AsyncOpenSea
+from .backfill import EventBackfill
 
-__all__ = ['OpenSea', 'OpenSeaChain', 'OpenSeaCollection', 'OpenSeaWallet']
\ No newline at end of file
+__all__ = ['OpenSea', 'OpenSeaChain', 'OpenSeaCollection', 'OpenSeaWallet', 'AsyncOpenSea', 'EventBackfill']
\ No newline at end of file
@@ -0,0 +1,369 @@
+from ..errors import APIRequestFailedError, MissingChainError, MissingSlugError
+from ..transport import AsyncHTTPTransport
+from ..retry import RetryPolicy
+from ..analytics import ListingBook
+from .opensea import OpenSeaChain
+from ..instrumentation import instrumented
+
+
+@instrumented
+class AsyncOpenSea:
+    """
+    An asyncio counterpart of OpenSea with the same methods, sent through an aiohttp based transport.
+
+    Args:
+        api_key (str): The API key for accessing OpenSea.
+        chain (OpenSeaChain, optional): The blockchain network to interact with.
+        transport (AsyncHTTPTransport, optional): The transport to send requests through. Share one transport between
+            clients to share its connection pool and concurrency limit.
+        retry_policy (RetryPolicy, optional): How throttled and failed requests are retried. Each client gets its own
+            policy and retry budget by default.
+    """
+
+    def __init__(self, api_key: str, chain: OpenSeaChain = None, transport: AsyncHTTPTransport = None,
+                 retry_policy: RetryPolicy = None):
+        self.api_key = api_key
+        self.chain = chain
+        self.base_url = "https://api.opensea.io/api/v2"
+        self._owns_transport = transport is None
+        self._transport = transport or AsyncHTTPTransport()
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._headers = {
+            "Accept": "application/json",
+            "X-API-KEY": self.api_key
+        }
+
+    async def close(self):
+        if self._owns_transport:
+            await self._transport.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def get_collection_stats(self, collection_slug: str):
+        """
+        Get statistics for a collection.
+
+        Args:
+            collection_slug (str): The slug of the collection.
+
+        Returns:
+            dict: A dictionary containing collection statistics.
+
+        Raises:
+            MissingSlugError: If no collection slug is provided.
+            APIRequestFailedError: If the API request fails.
+        """
+        if collection_slug is None:
+            raise MissingSlugError()
+        url = f"{self.base_url}/collection/{collection_slug}/stats"
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy)
+        if response.status_code == 200:
+            return response.json()
+        else:
+            raise APIRequestFailedError(response.status_code)
+
+    async def list_events_by_nft(self, address: str, token_id: str, chain: OpenSeaChain = None, event_type: str = None,
+                                 only_opensea: bool = False, auction_type: str = None, occurred_before: str = None,
+                                 occurred_after: str = None, cursor: str = None, limit: int = 50):
+        """
+        List events related to a specific NFT.
+
+        Args:
+            address (str): The contract address of the NFT.
+            token_id (str): The token ID of the NFT.
+            chain (OpenSeaChain, optional): The blockchain network.
+            event_type (str, optional): The type of event.
+            only_opensea (bool, optional): Whether to include only OpenSea events.
+            auction_type (str, optional): The type of auction.
+            occurred_before (str, optional): Events occurred before this date.
+            occurred_after (str, optional): Events occurred after this date.
+            cursor (str, optional): Cursor for pagination.
+            limit (int, optional): Number of results to return (default is 50).
+
+        Returns:
+            dict: A dictionary containing the events.
+
+        Raises:
+            MissingChainError: If no chain is provided.
+            APIRequestFailedError: If the API request fails.
+        """
+        chain = chain or self.chain
+        if chain is None:
+            raise MissingChainError()
+        url = f"{self.base_url}/events/chain/{chain.value}/contract/{address}/nfts/{token_id}"
+        params = {
+            "event_type": event_type,
+            "only_opensea": str(only_opensea).lower(),
+            "auction_type": auction_type,
+            "occurred_before": occurred_before,
+            "occurred_after": occurred_after,
+            "cursor": cursor,
+            "limit": limit
+        }
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
+        if response.status_code == 200:
+            return response.json()
+        else:
+            raise APIRequestFailedError(response.status_code)
+
+    async def get_collection(self, collection_slug: str):
+        """
+        Get details of a collection.
+
+        Args:
+            collection_slug (str): The slug of the collection.
+
+        Returns:
+            dict: A dictionary containing collection details.
+
+        Raises:
+            MissingSlugError: If no collection slug is provided.
+            APIRequestFailedError: If the API request fails.
+        """
+        if collection_slug is None:
+            raise MissingSlugError()
+        url = f"{self.base_url}/collection/{collection_slug}"
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy, cache="collection")
+        if response.status_code == 200:
+            return response.json()
+        else:
+            raise APIRequestFailedError(response.status_code)
+
+    async def get_contract(self, address: str, chain: OpenSeaChain = None):
+        """
+        Get details of a specific contract.
+
+        Args:
+            address (str): The contract address.
+            chain (OpenSeaChain, optional): The blockchain network.
+
+        Returns:
+            dict: A dictionary containing contract details.
+
+        Raises:
+            MissingChainError: If no chain is provided.
+            APIRequestFailedError: If the API request fails.
+        """
+        chain = chain or self.chain
+        if chain is None:
+            raise MissingChainError()
+        url = f"{self.base_url}/chain/{chain.value}/contract/{address}"
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy, cache="contract")
+        if response.status_code == 200:
+            return response.json()
+        else:
+            raise APIRequestFailedError(response.status_code)
+
+    async def get_nft(self, address: str, token_id: str, chain: OpenSeaChain = None):
+        """
+        Get details of a specific NFT.
+
+        Args:
+            address (str): The contract address of the NFT.
+            token_id (str): The token ID of the NFT.
+            chain (OpenSeaChain, optional): The blockchain network.
+
+        Returns:
+            dict: A dictionary containing NFT details.
+
+        Raises:
+            MissingChainError: If no chain is provided.
+            APIRequestFailedError: If the API request fails.
+        """
+        chain = chain or self.chain
+        if chain is None:
+            raise MissingChainError()
+        url = f"{self.base_url}/chain/{chain.value}/contract/{address}/nfts/{token_id}"
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy)
+        if response.status_code == 200:
+            return response.json()
+        else:
+            raise APIRequestFailedError(response.status_code)
+
+    async def list_nfts_by_account(self, address: str, chain: OpenSeaChain = None, cursor: str = None, limit: int = 50):
+        """
+        List NFTs owned by a specific account.
+
+        Args:
+            address (str): The account address.
+            chain (OpenSeaChain, optional): The blockchain network.
+            cursor (str, optional): Cursor for pagination.
+            limit (int, optional): Number of results to return (default is 50).
+
+        Returns:
+            dict: A dictionary containing the NFTs.
+
+        Raises:
+            MissingChainError: If no chain is provided.
+            APIRequestFailedError: If the API request fails.
+        """
+        chain = chain or self.chain
+        if chain is None:
+            raise MissingChainError()
+        url = f"{self.base_url}/chain/{chain.value}/account/{address}/nfts"
+        params = {
+            "cursor": cursor,
+            "limit": limit
+        }
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
+        if response.status_code == 200:
+            return response.json()
+        else:
+            raise APIRequestFailedError(response.status_code)
+
+    async def list_nfts_by_collection(self, collection_slug: str, chain: OpenSeaChain = None, cursor: str = None,
+                                      limit: int = 50):
+        """
+        List NFTs in a specific collection.
+
+        Args:
+            collection_slug (str): The slug of the collection.
+            chain (OpenSeaChain, optional): The blockchain network.
+            cursor (str, optional): Cursor for pagination.
+            limit (int, optional): Number of results to return (default is 50).
+
+        Returns:
+            dict: A dictionary containing the NFTs.
+
+        Raises:
+            MissingSlugError: If no collection slug is provided.
+            MissingChainError: If no chain is provided.
+            APIRequestFailedError: If the API request fails.
+        """
+        if collection_slug is None:
+            raise MissingSlugError()
+        chain = chain or self.chain
+        if chain is None:
+            raise MissingChainError()
+        url = f"{self.base_url}/chain/{chain.value}/collection/{collection_slug}/nfts"
+        params = {
+            "cursor": cursor,
+            "limit": limit
+        }
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
+        if response.status_code == 200:
+            return response.json()
+        else:
+            raise APIRequestFailedError(response.status_code)
+
+    async def list_nfts_by_contract(self, contract_address: str, chain: OpenSeaChain = None, cursor: str = None,
+                                    limit: int = 50):
+        """
+        List NFTs under a specific contract.
+
+        Args:
+            contract_address (str): The contract address.
+            chain (OpenSeaChain, optional): The blockchain network.
+            cursor (str, optional): Cursor for pagination.
+            limit (int, optional): Number of results to return (default is 50).
+
+        Returns:
+            dict: A dictionary containing the NFTs.
+
+        Raises:
+            MissingChainError: If no chain is provided.
+            APIRequestFailedError: If the API request fails.
+        """
+        chain = chain or self.chain
+        if chain is None:
+            raise MissingChainError()
+        url = f"{self.base_url}/chain/{chain.value}/contract/{contract_address}/nfts"
+        params = {
+            "cursor": cursor,
+            "limit": limit
+        }
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
+        if response.status_code == 200:
+            return response.json()
+        else:
+            raise APIRequestFailedError(response.status_code)
+
+    async def get_payment_token(self, address: str, chain: OpenSeaChain = None):
+        """
+        Get details of a specific payment token.
+
+        Args:
+            address (str): The address of the payment token.
+            chain (OpenSeaChain, optional): The blockchain network.
+
+        Returns:
+            dict: A dictionary containing payment token details.
+
+        Raises:
+            MissingChainError: If no chain is provided.
+            APIRequestFailedError: If the API request fails.
+        """
+        chain = chain or self.chain
+        if chain is None:
+            raise MissingChainError()
+        url = f"{self.base_url}/chain/{chain.value}/payment_token/{address}"
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy, cache="payment_token")
+        if response.status_code == 200:
+            return response.json()
+        else:
+            raise APIRequestFailedError(response.status_code)
+
+    async def get_traits(self, collection_slug: str):
+        """
+        Get traits of a specific collection.
+
+        Args:
+            collection_slug (str): The slug of the collection.
+
+        Returns:
+            dict: A dictionary containing collection traits.
+
+        Raises:
+            MissingSlugError: If no collection slug is provided.
+            APIRequestFailedError: If the API request fails.
+        """
+        if collection_slug is None:
+            raise MissingSlugError()
+        url = f"{self.base_url}/collection/{collection_slug}/traits"
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy, cache="traits")
+        if response.status_code == 200:
+            return response.json()
+        else:
+            raise APIRequestFailedError(response.status_code)
+
+    async def get_all_listings_on_collection(self, collection_slug: str, chain: OpenSeaChain = None,
+                                             cursor: str = None, limit: int = 50, columnar: bool = False):
+        """
+        Get all listings of a specific collection.
+
+        Args:
+            collection_slug (str): The slug of the collection.
+            chain (OpenSeaChain, optional): The blockchain network.
+            cursor (str, optional): Cursor for pagination.
+            limit (int, optional): Number of results to return (default is 50).
+            columnar (bool, optional): Return the listings as a ListingBook of NumPy arrays (requires numpy).
+
+        Returns:
+            dict: A dictionary containing the listings, or a ListingBook if columnar is set.
+
+        Raises:
+            MissingSlugError: If no collection slug is provided.
+            MissingChainError: If no chain is provided.
+            APIRequestFailedError: If the API request fails.
+        """
+        if collection_slug is None:
+            raise MissingSlugError()
+        chain = chain or self.chain
+        if chain is None:
+            raise MissingChainError()
+        url = f"{self.base_url}/chain/{chain.value}/collection/{collection_slug}/listings"
+        params = {
+            "cursor": cursor,
+            "limit": limit
+        }
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
+        if response.status_code == 200:
+            if columnar:
+                return ListingBook.from_opensea(response.json())
+            return response.json()
+        else:
+            raise APIRequestFailedError(response.status_code)
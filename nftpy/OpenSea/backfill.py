@@ -0,0 +1,95 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from ..concurrency import RateLimiter
+from ..pagination import iterate_items
+
+
+def _event_key(event: dict) -> tuple:
+    nft = event.get("nft") or {}
+    return (event.get("event_type"), event.get("transaction"), event.get("order_hash"),
+            event.get("event_timestamp"), nft.get("contract"), nft.get("identifier"))
+
+
+class EventBackfill:
+    """
+    Backfills the event history of an NFT by crawling time windows in parallel.
+
+    The range is split into equally sized windows that are crawled concurrently under one shared rate limit. Windows
+    are emitted newest first as soon as they and every newer window are complete, so the output is a single stream
+    ordered like the API (newest first). Events at a window edge that both windows return are emitted once.
+
+    Args:
+        api (OpenSea): The client used to fetch pages.
+        address (str): The contract address of the NFT.
+        token_id (str): The token ID of the NFT.
+        chain (OpenSeaChain, optional): The blockchain network.
+        event_type (str, optional): The type of event.
+        windows (int, optional): Number of time windows the range is split into.
+        max_workers (int, optional): Number of windows crawled at once.
+        requests_per_second (float, optional): Shared request rate across all workers.
+        limit (int, optional): Number of events per page.
+    """
+    def __init__(self, api, address: str, token_id: str, chain=None, event_type: str = None, windows: int = 8,
+                 max_workers: int = 4, requests_per_second: float = 4, limit: int = 50):
+        self.api = api
+        self.address = address
+        self.token_id = token_id
+        self.chain = chain
+        self.event_type = event_type
+        self.windows = windows
+        self.max_workers = max_workers
+        self.limit = limit
+        self._limiter = RateLimiter(requests_per_second, burst=max_workers)
+
+    def _fetch_page(self, occurred_after, occurred_before, cursor):
+        self._limiter.acquire()
+        return self.api.list_events_by_nft(self.address, self.token_id, chain=self.chain, event_type=self.event_type,
+                                           occurred_after=occurred_after, occurred_before=occurred_before,
+                                           cursor=cursor, limit=self.limit)
+
+    def _crawl_window(self, window):
+        occurred_after, occurred_before = window
+        events = list(iterate_items(lambda cursor: self._fetch_page(occurred_after, occurred_before, cursor),
+                                    "asset_events"))
+        events.sort(key=lambda event: event.get("event_timestamp") or 0, reverse=True)
+        return events
+
+    def split(self, occurred_after: int, occurred_before: int) -> list:
+        """
+        Split a range into (occurred_after, occurred_before) windows, newest first.
+        """
+        count = max(1, min(self.windows, occurred_before - occurred_after))
+        step = (occurred_before - occurred_after) / count
+        bounds = [occurred_before - round(step * i) for i in range(count)] + [occurred_after]
+        return [(bounds[i + 1], bounds[i]) for i in range(count)]
+
+    def run(self, occurred_after: int, occurred_before: int):
+        """
+        Crawl every event between two unix timestamps.
+
+        Args:
+            occurred_after (int): The start of the range.
+            occurred_before (int): The end of the range.
+
+        Yields:
+            dict: Each event once, newest first.
+        """
+        windows = deque(self.split(int(occurred_after), int(occurred_before)))
+        edge_keys = set()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = deque()
+            while windows or pending:
+                # Keep one window queued beyond the workers so no worker idles while results are consumed
+                while windows and len(pending) <= self.max_workers:
+                    window = windows.popleft()
+                    pending.append((window, executor.submit(self._crawl_window, window)))
+                (window_after, _), future = pending.popleft()
+                next_edge_keys = set()
+                for event in future.result():
+                    key = _event_key(event)
+                    if key in edge_keys:
+                        continue
+                    if (event.get("event_timestamp") or 0) <= window_after:
+                        next_edge_keys.add(key)
+                    yield event
+                edge_keys = next_edge_keys
@@ -1,14 +1,22 @@
 from .opensea import OpenSea, OpenSeaChain
+from ..transport import HTTPTransport
+from ..retry import RetryPolicy
+from ..cache import StaleWhileRevalidateCache
+from ..instrumentation import instrumented
 
+@instrumented
 class OpenSeaCollection:
     """
     A class built for collection specific interactions.
     """
-    def __init__(self, api_key, collection_slug, chain: OpenSeaChain = OpenSeaChain.ETHEREUM):
+    def __init__(self, api_key, collection_slug, chain: OpenSeaChain = OpenSeaChain.ETHEREUM,
+                 transport: HTTPTransport = None, retry_policy: RetryPolicy = None,
+                 stats_cache: StaleWhileRevalidateCache = None):
         self._api_key = api_key
         self._collection_slug = collection_slug
         self._chain = chain
-        self._api = OpenSea(api_key=api_key, chain=chain)
+        self._api = OpenSea(api_key=api_key, chain=chain, transport=transport, retry_policy=retry_policy,
+                            stats_cache=stats_cache)
 
     def get_collection_stats(self):
         """
@@ -50,18 +58,48 @@ class OpenSeaCollection:
         """
         return self._api.get_traits(self._collection_slug)
 
-    def get_all_listings_on_collection(self, cursor: str = None, limit: int = 50):
+    def get_all_listings_on_collection(self, cursor: str = None, limit: int = 50, columnar: bool = False):
         """
         Get all listings of the collection.
 
         Args:
             cursor (str, optional): Cursor for pagination.
             limit (int, optional): Number of results to return (default is 50).
+            columnar (bool, optional): Return the listings as a ListingBook of NumPy arrays (requires numpy).
 
         Returns:
-            dict: A dictionary containing the listings.
+            dict: A dictionary containing the listings, or a ListingBook if columnar is set.
         """
-        return self._api.get_all_listings_on_collection(self._collection_slug, chain=self._chain, cursor=cursor, limit=limit)
+        return self._api.get_all_listings_on_collection(self._collection_slug, chain=self._chain, cursor=cursor, limit=limit,
+                                                        columnar=columnar)
+
+    def iter_nfts_by_collection(self, limit: int = 50, prefetch: bool = False):
+        """
+        Iterate over every NFT in the collection, following the pagination cursor.
+
+        Args:
+            limit (int, optional): Number of results per page (default is 50).
+            prefetch (bool, optional): Fetch the next page while the current one is consumed.
+
+        Yields:
+            dict: Each NFT.
+        """
+        return self._api.iter_nfts_by_collection(self._collection_slug, chain=self._chain, limit=limit,
+                                                 prefetch=prefetch)
+
+    def iter_all_listings_on_collection(self, limit: int = 50, prefetch: bool = False):
+        """
+        Iterate over every listing of the collection, following the pagination cursor.
+
+        Args:
+            limit (int, optional): Number of results per page (default is 50).
+            prefetch (bool, optional): Fetch the next page while the current one is consumed.
+
+        Yields:
+            dict: Each listing.
+        """
+        return self._api.iter_all_listings_on_collection(self._collection_slug, chain=self._chain, limit=limit,
+                                                         prefetch=prefetch)
 
     def get_collection_slug(self):
         """
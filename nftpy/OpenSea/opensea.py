@@ -1,6 +1,12 @@
-import requests
 from enum import Enum
 from ..errors import APIRequestFailedError, MissingChainError, MissingSlugError
+from ..pagination import iterate_items
+from ..analytics import ListingBook
+from .backfill import EventBackfill
+from ..transport import HTTPTransport, get_default_transport
+from ..retry import RetryPolicy
+from ..cache import StaleWhileRevalidateCache
+from ..instrumentation import instrumented
 
 
 class OpenSeaChain(Enum):
@@ -16,6 +22,7 @@ class OpenSeaChain(Enum):
     SCROLL_ALPHA = "scroll_alpha"
 
 
+@instrumented
 class OpenSea:
     """
     A class to interact with the OpenSea API.
@@ -23,12 +30,25 @@ class OpenSea:
     Args:
         api_key (str): The API key for accessing OpenSea.
         chain (OpenSeaChain, optional): The blockchain network to interact with.
+        transport (HTTPTransport, optional): The pooled transport to send requests through. Defaults to the shared one.
+        retry_policy (RetryPolicy, optional): How throttled and failed requests are retried. Each client gets its own
+            policy and retry budget by default.
+        stats_cache (StaleWhileRevalidateCache, optional): Serves get_collection_stats from cache and refreshes it in
+            the background.
     """
 
-    def __init__(self, api_key: str, chain: OpenSeaChain = None):
+    def __init__(self, api_key: str, chain: OpenSeaChain = None, transport: HTTPTransport = None,
+                 retry_policy: RetryPolicy = None, stats_cache: StaleWhileRevalidateCache = None):
         self.api_key = api_key
         self.chain = chain
         self.base_url = "https://api.opensea.io/api/v2"
+        self._transport = transport or get_default_transport()
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._stats_cache = stats_cache
+        self._headers = {
+            "Accept": "application/json",
+            "X-API-KEY": self.api_key
+        }
 
     def get_collection_stats(self, collection_slug: str):
         """
@@ -46,12 +66,14 @@ class OpenSea:
         """
         if collection_slug is None:
             raise MissingSlugError()
+        if self._stats_cache is not None:
+            return self._stats_cache.get((self.base_url, "collection_stats", collection_slug),
+                                         lambda: self._fetch_collection_stats(collection_slug))
+        return self._fetch_collection_stats(collection_slug)
+
+    def _fetch_collection_stats(self, collection_slug: str):
         url = f"{self.base_url}/collection/{collection_slug}/stats"
-        headers = {
-            "Accept": "application/json",
-            "X-API-KEY": self.api_key
-        }
-        response = requests.get(url, headers=headers)
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy)
         if response.status_code == 200:
             return response.json()
         else:
@@ -86,10 +108,6 @@ class OpenSea:
         if chain is None:
             raise MissingChainError()
         url = f"{self.base_url}/events/chain/{chain.value}/contract/{address}/nfts/{token_id}"
-        headers = {
-            "Accept": "application/json",
-            "X-API-KEY": self.api_key
-        }
         params = {
             "event_type": event_type,
             "only_opensea": str(only_opensea).lower(),
@@ -99,7 +117,7 @@ class OpenSea:
             "cursor": cursor,
             "limit": limit
         }
-        response = requests.get(url, headers=headers, params=params)
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
         if response.status_code == 200:
             return response.json()
         else:
@@ -122,11 +140,7 @@ class OpenSea:
         if collection_slug is None:
             raise MissingSlugError()
         url = f"{self.base_url}/collection/{collection_slug}"
-        headers = {
-            "Accept": "application/json",
-            "X-API-KEY": self.api_key
-        }
-        response = requests.get(url, headers=headers)
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy, cache="collection")
         if response.status_code == 200:
             return response.json()
         else:
@@ -151,11 +165,7 @@ class OpenSea:
         if chain is None:
             raise MissingChainError()
         url = f"{self.base_url}/chain/{chain.value}/contract/{address}"
-        headers = {
-            "Accept": "application/json",
-            "X-API-KEY": self.api_key
-        }
-        response = requests.get(url, headers=headers)
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy, cache="contract")
         if response.status_code == 200:
             return response.json()
         else:
@@ -181,11 +191,7 @@ class OpenSea:
         if chain is None:
             raise MissingChainError()
         url = f"{self.base_url}/chain/{chain.value}/contract/{address}/nfts/{token_id}"
-        headers = {
-            "Accept": "application/json",
-            "X-API-KEY": self.api_key
-        }
-        response = requests.get(url, headers=headers)
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy)
         if response.status_code == 200:
             return response.json()
         else:
@@ -212,15 +218,11 @@ class OpenSea:
         if chain is None:
             raise MissingChainError()
         url = f"{self.base_url}/chain/{chain.value}/account/{address}/nfts"
-        headers = {
-            "Accept": "application/json",
-            "X-API-KEY": self.api_key
-        }
         params = {
             "cursor": cursor,
             "limit": limit
         }
-        response = requests.get(url, headers=headers, params=params)
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
         if response.status_code == 200:
             return response.json()
         else:
@@ -251,15 +253,11 @@ class OpenSea:
         if chain is None:
             raise MissingChainError()
         url = f"{self.base_url}/chain/{chain.value}/collection/{collection_slug}/nfts"
-        headers = {
-            "Accept": "application/json",
-            "X-API-KEY": self.api_key
-        }
         params = {
             "cursor": cursor,
             "limit": limit
         }
-        response = requests.get(url, headers=headers, params=params)
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
         if response.status_code == 200:
             return response.json()
         else:
@@ -287,15 +285,11 @@ class OpenSea:
         if chain is None:
             raise MissingChainError()
         url = f"{self.base_url}/chain/{chain.value}/contract/{contract_address}/nfts"
-        headers = {
-            "Accept": "application/json",
-            "X-API-KEY": self.api_key
-        }
         params = {
             "cursor": cursor,
             "limit": limit
         }
-        response = requests.get(url, headers=headers, params=params)
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
         if response.status_code == 200:
             return response.json()
         else:
@@ -320,11 +314,7 @@ class OpenSea:
         if chain is None:
             raise MissingChainError()
         url = f"{self.base_url}/chain/{chain.value}/payment_token/{address}"
-        headers = {
-            "Accept": "application/json",
-            "X-API-KEY": self.api_key
-        }
-        response = requests.get(url, headers=headers)
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy, cache="payment_token")
         if response.status_code == 200:
             return response.json()
         else:
@@ -347,18 +337,14 @@ class OpenSea:
         if collection_slug is None:
             raise MissingSlugError()
         url = f"{self.base_url}/collection/{collection_slug}/traits"
-        headers = {
-            "Accept": "application/json",
-            "X-API-KEY": self.api_key
-        }
-        response = requests.get(url, headers=headers)
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy, cache="traits")
         if response.status_code == 200:
             return response.json()
         else:
             raise APIRequestFailedError(response.status_code)
 
     def get_all_listings_on_collection(self, collection_slug: str, chain: OpenSeaChain = None,
-                                       cursor: str = None, limit: int = 50):
+                                       cursor: str = None, limit: int = 50, columnar: bool = False):
         """
         Get all listings of a specific collection.
 
@@ -367,9 +353,10 @@ class OpenSea:
             chain (OpenSeaChain, optional): The blockchain network.
             cursor (str, optional): Cursor for pagination.
             limit (int, optional): Number of results to return (default is 50).
+            columnar (bool, optional): Return the listings as a ListingBook of NumPy arrays (requires numpy).
 
         Returns:
-            dict: A dictionary containing the listings.
+            dict: A dictionary containing the listings, or a ListingBook if columnar is set.
 
         Raises:
             MissingSlugError: If no collection slug is provided.
@@ -382,16 +369,140 @@ class OpenSea:
         if chain is None:
             raise MissingChainError()
         url = f"{self.base_url}/chain/{chain.value}/collection/{collection_slug}/listings"
-        headers = {
-            "Accept": "application/json",
-            "X-API-KEY": self.api_key
-        }
         params = {
             "cursor": cursor,
             "limit": limit
         }
-        response = requests.get(url, headers=headers, params=params)
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
         if response.status_code == 200:
+            if columnar:
+                return ListingBook.from_opensea(response.json())
             return response.json()
         else:
             raise APIRequestFailedError(response.status_code)
+
+    def iter_events_by_nft(self, address: str, token_id: str, chain: OpenSeaChain = None, event_type: str = None,
+                           only_opensea: bool = False, auction_type: str = None, occurred_before: str = None,
+                           occurred_after: str = None, limit: int = 50, prefetch: bool = False):
+        """
+        Iterate over every event of a specific NFT, following the pagination cursor.
+
+        Args:
+            address (str): The contract address of the NFT.
+            token_id (str): The token ID of the NFT.
+            chain (OpenSeaChain, optional): The blockchain network.
+            event_type (str, optional): The type of event.
+            only_opensea (bool, optional): Whether to include only OpenSea events.
+            auction_type (str, optional): The type of auction.
+            occurred_before (str, optional): Events occurred before this date.
+            occurred_after (str, optional): Events occurred after this date.
+            limit (int, optional): Number of results per page (default is 50).
+            prefetch (bool, optional): Fetch the next page while the current one is consumed.
+
+        Yields:
+            dict: Each event.
+        """
+        return iterate_items(
+            lambda cursor: self.list_events_by_nft(address, token_id, chain=chain, event_type=event_type,
+                                                   only_opensea=only_opensea, auction_type=auction_type,
+                                                   occurred_before=occurred_before, occurred_after=occurred_after,
+                                                   cursor=cursor, limit=limit),
+            "asset_events", prefetch=prefetch)
+
+    def backfill_events_by_nft(self, address: str, token_id: str, occurred_after: int, occurred_before: int,
+                               chain: OpenSeaChain = None, event_type: str = None, windows: int = 8,
+                               max_workers: int = 4, requests_per_second: float = 4, limit: int = 50):
+        """
+        Backfill the event history of an NFT by crawling time windows in parallel.
+
+        Args:
+            address (str): The contract address of the NFT.
+            token_id (str): The token ID of the NFT.
+            occurred_after (int): The start of the range as a unix timestamp.
+            occurred_before (int): The end of the range as a unix timestamp.
+            chain (OpenSeaChain, optional): The blockchain network.
+            event_type (str, optional): The type of event.
+            windows (int, optional): Number of time windows the range is split into.
+            max_workers (int, optional): Number of windows crawled at once.
+            requests_per_second (float, optional): Shared request rate across all workers.
+            limit (int, optional): Number of results per page (default is 50).
+
+        Yields:
+            dict: Each event once, newest first.
+        """
+        backfill = EventBackfill(self, address, token_id, chain=chain or self.chain, event_type=event_type,
+                                 windows=windows, max_workers=max_workers,
+                                 requests_per_second=requests_per_second, limit=limit)
+        return backfill.run(occurred_after, occurred_before)
+
+    def iter_nfts_by_account(self, address: str, chain: OpenSeaChain = None, limit: int = 50, prefetch: bool = False):
+        """
+        Iterate over every NFT owned by a specific account, following the pagination cursor.
+
+        Args:
+            address (str): The account address.
+            chain (OpenSeaChain, optional): The blockchain network.
+            limit (int, optional): Number of results per page (default is 50).
+            prefetch (bool, optional): Fetch the next page while the current one is consumed.
+
+        Yields:
+            dict: Each NFT.
+        """
+        return iterate_items(
+            lambda cursor: self.list_nfts_by_account(address, chain=chain, cursor=cursor, limit=limit),
+            "nfts", prefetch=prefetch)
+
+    def iter_nfts_by_collection(self, collection_slug: str, chain: OpenSeaChain = None, limit: int = 50,
+                                prefetch: bool = False):
+        """
+        Iterate over every NFT in a specific collection, following the pagination cursor.
+
+        Args:
+            collection_slug (str): The slug of the collection.
+            chain (OpenSeaChain, optional): The blockchain network.
+            limit (int, optional): Number of results per page (default is 50).
+            prefetch (bool, optional): Fetch the next page while the current one is consumed.
+
+        Yields:
+            dict: Each NFT.
+        """
+        return iterate_items(
+            lambda cursor: self.list_nfts_by_collection(collection_slug, chain=chain, cursor=cursor, limit=limit),
+            "nfts", prefetch=prefetch)
+
+    def iter_nfts_by_contract(self, contract_address: str, chain: OpenSeaChain = None, limit: int = 50,
+                              prefetch: bool = False):
+        """
+        Iterate over every NFT under a specific contract, following the pagination cursor.
+
+        Args:
+            contract_address (str): The contract address.
+            chain (OpenSeaChain, optional): The blockchain network.
+            limit (int, optional): Number of results per page (default is 50).
+            prefetch (bool, optional): Fetch the next page while the current one is consumed.
+
+        Yields:
+            dict: Each NFT.
+        """
+        return iterate_items(
+            lambda cursor: self.list_nfts_by_contract(contract_address, chain=chain, cursor=cursor, limit=limit),
+            "nfts", prefetch=prefetch)
+
+    def iter_all_listings_on_collection(self, collection_slug: str, chain: OpenSeaChain = None, limit: int = 50,
+                                        prefetch: bool = False):
+        """
+        Iterate over every listing of a specific collection, following the pagination cursor.
+
+        Args:
+            collection_slug (str): The slug of the collection.
+            chain (OpenSeaChain, optional): The blockchain network.
+            limit (int, optional): Number of results per page (default is 50).
+            prefetch (bool, optional): Fetch the next page while the current one is consumed.
+
+        Yields:
+            dict: Each listing.
+        """
+        return iterate_items(
+            lambda cursor: self.get_all_listings_on_collection(collection_slug, chain=chain, cursor=cursor,
+                                                               limit=limit),
+            "listings", prefetch=prefetch)
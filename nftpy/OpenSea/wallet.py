@@ -1,14 +1,19 @@
 from .opensea import OpenSea, OpenSeaChain
+from ..transport import HTTPTransport
+from ..retry import RetryPolicy
+from ..instrumentation import instrumented
 
+@instrumented
 class OpenSeaWallet:
     """
     A class built for wallet specific interactions.
     """
-    def __init__(self, api_key, wallet: str, chain: OpenSeaChain = OpenSeaChain.ETHEREUM):
+    def __init__(self, api_key, wallet: str, chain: OpenSeaChain = OpenSeaChain.ETHEREUM,
+                 transport: HTTPTransport = None, retry_policy: RetryPolicy = None):
         self._api_key = api_key
         self._wallet = wallet
         self._chain = chain
-        self._api = OpenSea(api_key=api_key, chain=chain)
+        self._api = OpenSea(api_key=api_key, chain=chain, transport=transport, retry_policy=retry_policy)
 
     def list_nfts_by_account(self, cursor: str = None, limit: int = 50):
         """
@@ -23,6 +28,19 @@ class OpenSeaWallet:
         """
         return self._api.list_nfts_by_account(self._wallet, chain=self._chain, cursor=cursor, limit=limit)
 
+    def iter_nfts_by_account(self, limit: int = 50, prefetch: bool = False):
+        """
+        Iterate over every NFT owned by the wallet, following the pagination cursor.
+
+        Args:
+            limit (int, optional): Number of results per page (default is 50).
+            prefetch (bool, optional): Fetch the next page while the current one is consumed.
+
+        Yields:
+            dict: Each NFT.
+        """
+        return self._api.iter_nfts_by_account(self._wallet, chain=self._chain, limit=limit, prefetch=prefetch)
+
     def get_wallet(self):
         """
         Get the wallet address.
@@ -1,5 +1,7 @@
 from .rarible import Rarible, RaribleChain
 from .collection import RaribleCollection
 from .wallet import RaribleWallet
+from .async_rarible import AsyncRarible
+from .export import TransactionExporter
 
-__all__ = ["Rarible", "RaribleChain", "RaribleWallet", "RaribleCollection"]
\ No newline at end of file
+__all__ = ["Rarible", "RaribleChain", "RaribleWallet", "RaribleCollection", "AsyncRarible", "TransactionExporter"]
\ No newline at end of file
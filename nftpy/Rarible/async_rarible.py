@@ -0,0 +1,473 @@
+import asyncio
+from ..errors import MissingItemIdError, APIRequestFailedError, MissingCollectionIdError, BatchRequestFailedError
+from ..transport import AsyncHTTPTransport
+from ..retry import RetryPolicy
+from ..analytics import ListingBook
+from .rarible import RaribleChain, _merge_pages
+from ..instrumentation import instrumented
+
+
+@instrumented
+class AsyncRarible:
+    """
+    An asyncio counterpart of Rarible with the same methods, sent through an aiohttp based transport.
+    """
+    def __init__(self, api_key: str, chain: RaribleChain, transport: AsyncHTTPTransport = None,
+                 retry_policy: RetryPolicy = None):
+        self.api_key = api_key
+        self.chain = chain
+        self.base_url = "https://api.rarible.org/v0.1"
+        self._owns_transport = transport is None
+        self._transport = transport or AsyncHTTPTransport()
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._headers = {
+            "Accept": "application/json",
+            "X-API-KEY": self.api_key
+        }
+
+    async def close(self):
+        if self._owns_transport:
+            await self._transport.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def _get_by_ids(self, url: str, ids: list, items_key: str, chunk_size: int, max_workers: int):
+        async def fetch(chunk):
+            response = await self._transport.get(url, headers=self._headers, params={"ids": ",".join(chunk)},
+                                                 retry=self._retry_policy)
+            if response.status_code != 200:
+                raise APIRequestFailedError(response.status_code)
+            return response.json()
+
+        chunks = [ids[i:i + chunk_size] for i in range(0, len(ids), chunk_size)]
+        if len(chunks) == 1:
+            return _merge_pages([await fetch(chunks[0])], items_key)
+
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def bounded_fetch(chunk):
+            async with semaphore:
+                return await fetch(chunk)
+
+        pages = await asyncio.gather(*(bounded_fetch(chunk) for chunk in chunks), return_exceptions=True)
+        errors = [(chunk, page) for chunk, page in zip(chunks, pages) if isinstance(page, Exception)]
+        result = _merge_pages([page for page in pages if not isinstance(page, Exception)], items_key)
+        if errors:
+            raise BatchRequestFailedError(errors, result)
+        return result
+
+    async def get_item_by_id(self, item_id: str):
+        if not item_id:
+            raise MissingItemIdError()
+        url = f"{self.base_url}/items/{item_id}"
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy)
+        if response.status_code != 200:
+            raise APIRequestFailedError(response.status_code)
+        return response.json()
+
+    async def get_items_by_ids(self, item_ids: list, chunk_size: int = 50, max_workers: int = 4):
+        if not item_ids:
+            raise MissingItemIdError()
+        url = f"{self.base_url}/items/byIds"
+        return await self._get_by_ids(url, list(item_ids), "items", chunk_size, max_workers)
+
+    async def get_item_royalties_by_id(self, item_id: str):
+        if not item_id:
+            raise MissingItemIdError()
+        url = f"{self.base_url}/items/{item_id}/royalties"
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy)
+        if response.status_code != 200:
+            raise APIRequestFailedError(response.status_code)
+        return response.json()
+
+    async def get_items_by_owner(self, owner: str):
+        if not owner:
+            raise ValueError("Owner address must be provided.")
+        url = f"{self.base_url}/items/byOwner"
+        params = {"owner": owner}
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
+        if response.status_code != 200:
+            raise APIRequestFailedError(response.status_code)
+        return response.json()
+
+    async def get_items_by_creator(self, creator: str):
+        if not creator:
+            raise ValueError("Creator address must be provided.")
+        url = f"{self.base_url}/items/byCreator"
+        params = {"creator": creator}
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
+        if response.status_code != 200:
+            raise APIRequestFailedError(response.status_code)
+        return response.json()
+
+    async def get_items_by_collection(self, collection: str):
+        if not collection:
+            raise MissingCollectionIdError()
+        url = f"{self.base_url}/items/byCollection"
+        params = {"collection": collection}
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
+        if response.status_code != 200:
+            raise APIRequestFailedError(response.status_code)
+        return response.json()
+
+    async def query_traits(self, collection: str):
+        if not collection:
+            raise MissingCollectionIdError()
+        url = f"{self.base_url}/items/traits"
+        params = {"collection": collection}
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
+        if response.status_code != 200:
+            raise APIRequestFailedError(response.status_code)
+        return response.json()
+
+    async def get_lazy_item_by_id(self, item_id: str):
+        if not item_id:
+            raise MissingItemIdError()
+        url = f"{self.base_url}/items/{item_id}/lazy"
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy)
+        if response.status_code != 200:
+            raise APIRequestFailedError(response.status_code)
+        return response.json()
+
+    async def burn_lazy_item(self, item_id: str):
+        if not item_id:
+            raise MissingItemIdError()
+        url = f"{self.base_url}/items/{item_id}/lazy/burn"
+        response = await self._transport.post(url, headers=self._headers, retry=self._retry_policy)
+        if response.status_code != 200:
+            raise APIRequestFailedError(response.status_code)
+        return response.json()
+
+    async def get_ownership_by_id(self, ownership_id: str):
+        if not ownership_id:
+            raise ValueError("Ownership ID must be provided.")
+        url = f"{self.base_url}/ownerships/{ownership_id}"
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy)
+        if response.status_code != 200:
+            raise APIRequestFailedError(response.status_code)
+        return response.json()
+
+    async def get_ownerships_by_ids(self, ownership_ids: list, chunk_size: int = 50, max_workers: int = 4):
+        if not ownership_ids:
+            raise ValueError("Ownership IDs must be provided.")
+        url = f"{self.base_url}/ownerships/byIds"
+        return await self._get_by_ids(url, list(ownership_ids), "ownerships", chunk_size, max_workers)
+
+    async def get_ownerships_by_collection(self, collection: str):
+        if not collection:
+            raise MissingCollectionIdError()
+        url = f"{self.base_url}/ownerships/byCollection"
+        params = {"collection": collection}
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
+        if response.status_code != 200:
+            raise APIRequestFailedError(response.status_code)
+        return response.json()
+
+    async def get_ownerships_by_item(self, item_id: str):
+        if not item_id:
+            raise MissingItemIdError()
+        url = f"{self.base_url}/ownerships/byItem"
+        params = {"itemId": item_id}
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
+        if response.status_code != 200:
+            raise APIRequestFailedError(response.status_code)
+        return response.json()
+
+    async def get_collections_with_owned_items(self, owner: str):
+        if not owner:
+            raise ValueError("Owner address must be provided.")
+        url = f"{self.base_url}/ownerships/collectionsWithOwnedItems"
+        params = {"owner": owner}
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
+        if response.status_code != 200:
+            raise APIRequestFailedError(response.status_code)
+        return response.json()
+
+    async def get_orders_by_ids(self, order_ids: list, chunk_size: int = 50, max_workers: int = 4):
+        if not order_ids:
+            raise ValueError("Order IDs must be provided.")
+        url = f"{self.base_url}/orders/byIds"
+        return await self._get_by_ids(url, list(order_ids), "orders", chunk_size, max_workers)
+
+    async def get_orders_all(self):
+        url = f"{self.base_url}/orders/all"
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy)
+        if response.status_code != 200:
+            raise APIRequestFailedError(response.status_code)
+        return response.json()
+
+    async def get_all_sync(self):
+        url = f"{self.base_url}/orders/all/sync"
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy)
+        if response.status_code != 200:
+            raise APIRequestFailedError(response.status_code)
+        return response.json()
+
+    async def get_sell_orders_by_maker(self, maker: str):
+        if not maker:
+            raise ValueError("Maker address must be provided.")
+        url = f"{self.base_url}/orders/sell/byMaker"
+        params = {"maker": maker}
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
+        if response.status_code != 200:
+            raise APIRequestFailedError(response.status_code)
+        return response.json()
+
+    async def get_sell_orders_by_item(self, item_id: str):
+        if not item_id:
+            raise MissingItemIdError()
+        url = f"{self.base_url}/orders/sell/byItem"
+        params = {"itemId": item_id}
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
+        if response.status_code != 200:
+            raise APIRequestFailedError(response.status_code)
+        return response.json()
+
+    async def get_sell_orders(self, status: str = None, maker: str = None, collection: str = None, token: str = None,
+                              origin: str = None, columnar: bool = False):
+        url = f"{self.base_url}/orders/sell"
+        params = {}
+        if status:
+            params["status"] = status
+        if maker:
+            params["maker"] = maker
+        if collection:
+            params["collection"] = collection
+        if token:
+            params["token"] = token
+        if origin:
+            params["origin"] = origin
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
+        if response.status_code != 200:
+            raise APIRequestFailedError(response.status_code)
+        if columnar:
+            return ListingBook.from_rarible(response.json())
+        return response.json()
+
+    async def get_order_bids_by_maker(self, maker: str):
+        if not maker:
+            raise ValueError("Maker address must be provided.")
+        url = f"{self.base_url}/orders/bids/byMaker"
+        params = {"maker": maker}
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
+        if response.status_code != 200:
+            raise APIRequestFailedError(response.status_code)
+        return response.json()
+
+    async def get_order_bids_by_item(self, item_id: str):
+        if not item_id:
+            raise MissingItemIdError()
+        url = f"{self.base_url}/orders/bids/byItem"
+        params = {"itemId": item_id}
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
+        if response.status_code != 200:
+            raise APIRequestFailedError(response.status_code)
+        return response.json()
+
+    async def get_order_floor_bids_by_collection(self, collection: str):
+        if not collection:
+            raise MissingCollectionIdError()
+        url = f"{self.base_url}/orders/bids/floorByCollection"
+        params = {"collection": collection}
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
+        if response.status_code != 200:
+            raise APIRequestFailedError(response.status_code)
+        return response.json()
+
+    async def get_amm_order_trade_info(self, order_id: str):
+        if not order_id:
+            raise ValueError("Order ID must be provided.")
+        url = f"{self.base_url}/orders/amm/tradeInfo/{order_id}"
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy)
+        if response.status_code != 200:
+            raise APIRequestFailedError(response.status_code)
+        return response.json()
+
+    async def get_order_fees(self, order_id: str):
+        if not order_id:
+            raise ValueError("Order ID must be provided.")
+        url = f"{self.base_url}/orders/{order_id}/fees"
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy)
+        if response.status_code != 200:
+            raise APIRequestFailedError(response.status_code)
+        return response.json()
+
+    async def get_collection_by_id(self, collection_id: str):
+        if not collection_id:
+            raise MissingCollectionIdError()
+        url = f"{self.base_url}/collections/{collection_id}"
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy, cache="collection")
+        if response.status_code != 200:
+            raise APIRequestFailedError(response.status_code)
+        return response.json()
+
+    async def generate_token_id(self, collection_id: str, minter: str):
+        if not collection_id:
+            raise MissingCollectionIdError()
+        if not minter:
+            raise ValueError("Minter address must be provided.")
+        url = f"{self.base_url}/collections/{collection_id}/generateTokenId"
+        params = {"minter": minter}
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
+        if response.status_code != 200:
+            raise APIRequestFailedError(response.status_code)
+        return response.json()
+
+    async def refresh_collection_items_meta(self, collection_id: str):
+        if not collection_id:
+            raise MissingCollectionIdError()
+        url = f"{self.base_url}/collections/{collection_id}/refresh"
+        response = await self._transport.post(url, headers=self._headers, retry=self._retry_policy)
+        if response.status_code != 200:
+            raise APIRequestFailedError(response.status_code)
+        return response.json()
+
+    async def reset_collection_meta(self, collection_id: str):
+        if not collection_id:
+            raise MissingCollectionIdError()
+        url = f"{self.base_url}/collections/{collection_id}/reset"
+        response = await self._transport.post(url, headers=self._headers, retry=self._retry_policy)
+        if response.status_code != 200:
+            raise APIRequestFailedError(response.status_code)
+        return response.json()
+
+    async def get_collections_by_owner(self, owner: str):
+        if not owner:
+            raise ValueError("Owner address must be provided.")
+        url = f"{self.base_url}/collections/owner/{owner}"
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy)
+        if response.status_code != 200:
+            raise APIRequestFailedError(response.status_code)
+        return response.json()
+
+    async def get_all_collections(self):
+        url = f"{self.base_url}/collections"
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy)
+        if response.status_code != 200:
+            raise APIRequestFailedError(response.status_code)
+        return response.json()
+
+    async def get_collection_ranking_by_volume(self, period: str = "DAY", size: int = 10):
+        url = f"{self.base_url}/nft/collections/ranking/volume"
+        params = {"period": period, "size": size}
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
+        if response.status_code != 200:
+            raise APIRequestFailedError(response.status_code)
+        return response.json()
+
+    async def get_transactions(self, start_date: str = None, end_date: str = None, cursor: str = None, limit: int = 100):
+        url = f"{self.base_url}/nft/transactions"
+        params = {"startDate": start_date, "endDate": end_date, "cursor": cursor, "limit": limit}
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
+        if response.status_code != 200:
+            raise APIRequestFailedError(response.status_code)
+        return response.json()
+
+    async def get_collection_stats(self, collection_id: str):
+        if not collection_id:
+            raise MissingCollectionIdError()
+        url = f"{self.base_url}/nft/collections/{collection_id}/stats"
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy)
+        if response.status_code != 200:
+            raise APIRequestFailedError(response.status_code)
+        return response.json()
+
+    async def get_sellers(self, size: int = 10):
+        url = f"{self.base_url}/nft/sellers"
+        params = {"size": size}
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
+        if response.status_code != 200:
+            raise APIRequestFailedError(response.status_code)
+        return response.json()
+
+    async def get_buyers(self, size: int = 10):
+        url = f"{self.base_url}/nft/buyers"
+        params = {"size": size}
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
+        if response.status_code != 200:
+            raise APIRequestFailedError(response.status_code)
+        return response.json()
+
+    async def get_listed(self, period: str = "DAY"):
+        url = f"{self.base_url}/nft/listed"
+        params = {"period": period}
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
+        if response.status_code != 200:
+            raise APIRequestFailedError(response.status_code)
+        return response.json()
+
+    async def get_gmv(self, period: str = "DAY"):
+        url = f"{self.base_url}/nft/gmv"
+        params = {"period": period}
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
+        if response.status_code != 200:
+            raise APIRequestFailedError(response.status_code)
+        return response.json()
+
+    async def get_floor_price(self, collection_id: str):
+        if not collection_id:
+            raise MissingCollectionIdError()
+        url = f"{self.base_url}/nft/collections/{collection_id}/floorPrice"
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy)
+        if response.status_code != 200:
+            raise APIRequestFailedError(response.status_code)
+        return response.json()
+
+    async def get_domain_info(self, domain: str):
+        if not domain:
+            raise ValueError("Domain must be provided.")
+        url = f"{self.base_url}/domains/{domain}"
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy)
+        if response.status_code != 200:
+            raise APIRequestFailedError(response.status_code)
+        return response.json()
+
+    async def validate_signature(self, data: dict):
+        url = f"{self.base_url}/signature/validate"
+        response = await self._transport.post(url, headers=self._headers, retry=self._retry_policy, json=data)
+        if response.status_code != 200:
+            raise APIRequestFailedError(response.status_code)
+        return response.json()
+
+    async def get_signature_input(self, data: dict):
+        url = f"{self.base_url}/signature/input"
+        response = await self._transport.post(url, headers=self._headers, retry=self._retry_policy, json=data)
+        if response.status_code != 200:
+            raise APIRequestFailedError(response.status_code)
+        return response.json()
+
+    async def encode_data(self, data: dict):
+        url = f"{self.base_url}/encode"
+        response = await self._transport.post(url, headers=self._headers, retry=self._retry_policy, json=data)
+        if response.status_code != 200:
+            raise APIRequestFailedError(response.status_code)
+        return response.json()
+
+    async def get_usd_rate(self, currency: str):
+        if not currency:
+            raise ValueError("Currency must be provided.")
+        url = f"{self.base_url}/rates/{currency}/usd"
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy)
+        if response.status_code != 200:
+            raise APIRequestFailedError(response.status_code)
+        return response.json()
+
+    async def get_all_currencies(self):
+        url = f"{self.base_url}/currencies"
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy)
+        if response.status_code != 200:
+            raise APIRequestFailedError(response.status_code)
+        return response.json()
+
+    async def get_user_balance(self, user: str, currency: str):
+        if not user or not currency:
+            raise ValueError("User and currency must be provided.")
+        url = f"{self.base_url}/balances/{user}/{currency}"
+        response = await self._transport.get(url, headers=self._headers, retry=self._retry_policy)
+        if response.status_code != 200:
+            raise APIRequestFailedError(response.status_code)
+        return response.json()
@@ -1,14 +1,22 @@
 from .rarible import Rarible, RaribleChain
+from ..transport import HTTPTransport
+from ..retry import RetryPolicy
+from ..cache import StaleWhileRevalidateCache
+from ..instrumentation import instrumented
 
+@instrumented
 class RaribleCollection:
     """
     A class built for collection specific interactions.
     """
-    def __init__(self, api_key, collection_id, chain: RaribleChain = RaribleChain.ETHEREUM):
+    def __init__(self, api_key, collection_id, chain: RaribleChain = RaribleChain.ETHEREUM,
+                 transport: HTTPTransport = None, retry_policy: RetryPolicy = None,
+                 stats_cache: StaleWhileRevalidateCache = None):
         self._api_key = api_key
         self._collection_id = collection_id
         self._chain = chain
-        self._api = Rarible(api_key=api_key, chain=chain)
+        self._api = Rarible(api_key=api_key, chain=chain, transport=transport, retry_policy=retry_policy,
+                            stats_cache=stats_cache)
 
         self.items = self.get_items_by_collection()
 
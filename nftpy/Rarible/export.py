@@ -0,0 +1,92 @@
+import gzip
+import json
+import os
+from ..codec import dumps
+
+
+class TransactionExporter:
+    """
+    Streams Rarible transactions for a date range into a gzip compressed NDJSON file.
+
+    Each page is appended as its own gzip member, flushed to disk and followed by a checkpoint holding the next
+    cursor and the file size. An interrupted export truncates any partially written page and resumes from the last
+    checkpoint, so memory use is bounded by a single page and no record is written twice.
+
+    Args:
+        api (Rarible): The client used to fetch pages.
+        path (str): The output file, e.g. "transactions.ndjson.gz".
+        checkpoint_path (str, optional): Where progress is recorded. Defaults to path + ".checkpoint".
+        page_size (int, optional): Number of transactions requested per page.
+        compresslevel (int, optional): The gzip compression level.
+    """
+    def __init__(self, api, path: str, checkpoint_path: str = None, page_size: int = 1000, compresslevel: int = 6):
+        self.api = api
+        self.path = path
+        self.checkpoint_path = checkpoint_path or f"{path}.checkpoint"
+        self.page_size = page_size
+        self.compresslevel = compresslevel
+
+    def _load_checkpoint(self, start_date, end_date):
+        try:
+            with open(self.checkpoint_path, "r", encoding="utf-8") as file:
+                checkpoint = json.load(file)
+        except FileNotFoundError:
+            return None
+        if checkpoint.get("start_date") != start_date or checkpoint.get("end_date") != end_date:
+            raise ValueError(f"Checkpoint {self.checkpoint_path} belongs to a different date range "
+                             f"({checkpoint.get('start_date')} - {checkpoint.get('end_date')}).")
+        return checkpoint
+
+    def _save_checkpoint(self, checkpoint):
+        temp_path = f"{self.checkpoint_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(checkpoint, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, self.checkpoint_path)
+
+    @staticmethod
+    def _next_cursor(page):
+        return page.get("continuation") or page.get("cursor")
+
+    def export(self, start_date: str = None, end_date: str = None) -> int:
+        """
+        Export every transaction in the date range, resuming a previous run when a checkpoint exists.
+
+        Args:
+            start_date (str, optional): The start of the range.
+            end_date (str, optional): The end of the range.
+
+        Returns:
+            int: The total number of records in the output file.
+        """
+        checkpoint = self._load_checkpoint(start_date, end_date)
+        if checkpoint is None:
+            checkpoint = {"start_date": start_date, "end_date": end_date, "cursor": None, "offset": 0,
+                          "records": 0, "done": False}
+        if checkpoint["done"]:
+            return checkpoint["records"]
+
+        mode = "r+b" if checkpoint["offset"] and os.path.exists(self.path) else "wb"
+        with open(self.path, mode) as raw:
+            # Drop anything written after the last checkpoint, e.g. a page interrupted mid-write
+            raw.truncate(checkpoint["offset"])
+            raw.seek(checkpoint["offset"])
+            while True:
+                page = self.api.get_transactions(start_date=start_date, end_date=end_date,
+                                                 cursor=checkpoint["cursor"], limit=self.page_size)
+                records = page.get("transactions") or []
+                if records:
+                    with gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=self.compresslevel) as member:
+                        member.write("".join(dumps(record) + "\n" for record in records).encode("utf-8"))
+                    raw.flush()
+                    os.fsync(raw.fileno())
+
+                next_cursor = self._next_cursor(page)
+                checkpoint["records"] += len(records)
+                checkpoint["offset"] = raw.tell()
+                checkpoint["done"] = not records or not next_cursor or next_cursor == checkpoint["cursor"]
+                checkpoint["cursor"] = next_cursor
+                self._save_checkpoint(checkpoint)
+                if checkpoint["done"]:
+                    return checkpoint["records"]
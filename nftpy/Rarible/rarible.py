@@ -1,48 +1,92 @@
 from enum import Enum
-import requests
-from ..errors import MissingItemIdError, MissingChainError, APIRequestFailedError, MissingCollectionIdError
+from ..errors import MissingItemIdError, MissingChainError, APIRequestFailedError, MissingCollectionIdError, \
+    BatchRequestFailedError
+from ..concurrency import bounded_map
+from .export import TransactionExporter
+from ..transport import HTTPTransport, get_default_transport
+from ..retry import RetryPolicy
+from ..cache import StaleWhileRevalidateCache
+from ..analytics import ListingBook
+from ..instrumentation import instrumented
 
 class RaribleChain(Enum):
     ETHEREUM = "ETHEREUM"
     POLYGON = "POLYGON"
 
+
+def _merge_pages(pages: list, items_key: str) -> dict:
+    # The first page keeps its other top level fields so one chunk and many chunks return the same structure
+    result = {}
+    items = []
+    for page in pages:
+        if not result:
+            result.update(page)
+        items.extend(page.get(items_key) or [])
+    result[items_key] = items
+    return result
+
+@instrumented
 class Rarible:
-    def __init__(self, api_key: str, chain: RaribleChain):
+    def __init__(self, api_key: str, chain: RaribleChain, transport: HTTPTransport = None,
+                 retry_policy: RetryPolicy = None, stats_cache: StaleWhileRevalidateCache = None):
         self.api_key = api_key
         self.chain = chain
         self.base_url = "https://api.rarible.org/v0.1"
-
-    def _get_headers(self):
-        return {
+        self._transport = transport or get_default_transport()
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._stats_cache = stats_cache
+        self._headers = {
             "Accept": "application/json",
             "X-API-KEY": self.api_key
         }
 
+    def _get_headers(self):
+        return self._headers
+
+    def _get_by_ids(self, url: str, ids: list, items_key: str, chunk_size: int, max_workers: int):
+        def fetch(chunk):
+            response = self._transport.get(url, headers=self._headers, params={"ids": ",".join(chunk)},
+                                           retry=self._retry_policy)
+            if response.status_code != 200:
+                raise APIRequestFailedError(response.status_code)
+            return response.json()
+
+        chunks = [ids[i:i + chunk_size] for i in range(0, len(ids), chunk_size)]
+        if len(chunks) == 1:
+            return _merge_pages([fetch(chunks[0])], items_key)
+
+        pages = []
+        errors = []
+        for chunk, (page, error) in zip(chunks, bounded_map(fetch, chunks, max_workers)):
+            if error is not None:
+                errors.append((chunk, error))
+            else:
+                pages.append(page)
+        result = _merge_pages(pages, items_key)
+        if errors:
+            raise BatchRequestFailedError(errors, result)
+        return result
+
     def get_item_by_id(self, item_id: str):
         if not item_id:
             raise MissingItemIdError()
         url = f"{self.base_url}/items/{item_id}"
-        response = requests.get(url, headers=self._get_headers())
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy)
         if response.status_code != 200:
             raise APIRequestFailedError(response.status_code)
         return response.json()
 
-    def get_items_by_ids(self, item_ids: list):
+    def get_items_by_ids(self, item_ids: list, chunk_size: int = 50, max_workers: int = 4):
         if not item_ids:
             raise MissingItemIdError()
         url = f"{self.base_url}/items/byIds"
-        params = {"ids": ",".join(item_ids)}
-        response = requests.get(url, headers=self._get_headers(), params=params)
-        if response.status_code != 200:
-            raise APIRequestFailedError(response.status_code)
-        response.raise_for_status()
-        return response.json()
+        return self._get_by_ids(url, list(item_ids), "items", chunk_size, max_workers)
 
     def get_item_royalties_by_id(self, item_id: str):
         if not item_id:
             raise MissingItemIdError()
         url = f"{self.base_url}/items/{item_id}/royalties"
-        response = requests.get(url, headers=self._get_headers())
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy)
         if response.status_code != 200:
             raise APIRequestFailedError(response.status_code)
         return response.json()
@@ -52,7 +96,7 @@ class Rarible:
             raise ValueError("Owner address must be provided.")
         url = f"{self.base_url}/items/byOwner"
         params = {"owner": owner}
-        response = requests.get(url, headers=self._get_headers(), params=params)
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
         if response.status_code != 200:
             raise APIRequestFailedError(response.status_code)
         return response.json()
@@ -62,7 +106,7 @@ class Rarible:
             raise ValueError("Creator address must be provided.")
         url = f"{self.base_url}/items/byCreator"
         params = {"creator": creator}
-        response = requests.get(url, headers=self._get_headers(), params=params)
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
         if response.status_code != 200:
             raise APIRequestFailedError(response.status_code)
         return response.json()
@@ -72,7 +116,7 @@ class Rarible:
             raise MissingCollectionIdError()
         url = f"{self.base_url}/items/byCollection"
         params = {"collection": collection}
-        response = requests.get(url, headers=self._get_headers(), params=params)
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
         if response.status_code != 200:
             raise APIRequestFailedError(response.status_code)
         return response.json()
@@ -82,7 +126,7 @@ class Rarible:
             raise MissingCollectionIdError()
         url = f"{self.base_url}/items/traits"
         params = {"collection": collection}
-        response = requests.get(url, headers=self._get_headers(), params=params)
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
         if response.status_code != 200:
             raise APIRequestFailedError(response.status_code)
         return response.json()
@@ -91,7 +135,7 @@ class Rarible:
         if not item_id:
             raise MissingItemIdError()
         url = f"{self.base_url}/items/{item_id}/lazy"
-        response = requests.get(url, headers=self._get_headers())
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy)
         if response.status_code != 200:
             raise APIRequestFailedError(response.status_code)
         return response.json()
@@ -100,7 +144,7 @@ class Rarible:
         if not item_id:
             raise MissingItemIdError()
         url = f"{self.base_url}/items/{item_id}/lazy/burn"
-        response = requests.post(url, headers=self._get_headers())
+        response = self._transport.post(url, headers=self._headers, retry=self._retry_policy)
         if response.status_code != 200:
             raise APIRequestFailedError(response.status_code)
         return response.json()
@@ -109,27 +153,23 @@ class Rarible:
         if not ownership_id:
             raise ValueError("Ownership ID must be provided.")
         url = f"{self.base_url}/ownerships/{ownership_id}"
-        response = requests.get(url, headers=self._get_headers())
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy)
         if response.status_code != 200:
             raise APIRequestFailedError(response.status_code)
         return response.json()
 
-    def get_ownerships_by_ids(self, ownership_ids: list):
+    def get_ownerships_by_ids(self, ownership_ids: list, chunk_size: int = 50, max_workers: int = 4):
         if not ownership_ids:
             raise ValueError("Ownership IDs must be provided.")
         url = f"{self.base_url}/ownerships/byIds"
-        params = {"ids": ",".join(ownership_ids)}
-        response = requests.get(url, headers=self._get_headers(), params=params)
-        if response.status_code != 200:
-            raise APIRequestFailedError(response.status_code)
-        return response.json()
+        return self._get_by_ids(url, list(ownership_ids), "ownerships", chunk_size, max_workers)
 
     def get_ownerships_by_collection(self, collection: str):
         if not collection:
             raise MissingCollectionIdError()
         url = f"{self.base_url}/ownerships/byCollection"
         params = {"collection": collection}
-        response = requests.get(url, headers=self._get_headers(), params=params)
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
         if response.status_code != 200:
             raise APIRequestFailedError(response.status_code)
         return response.json()
@@ -139,7 +179,7 @@ class Rarible:
             raise MissingItemIdError()
         url = f"{self.base_url}/ownerships/byItem"
         params = {"itemId": item_id}
-        response = requests.get(url, headers=self._get_headers(), params=params)
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
         if response.status_code != 200:
             raise APIRequestFailedError(response.status_code)
         return response.json()
@@ -149,31 +189,27 @@ class Rarible:
             raise ValueError("Owner address must be provided.")
         url = f"{self.base_url}/ownerships/collectionsWithOwnedItems"
         params = {"owner": owner}
-        response = requests.get(url, headers=self._get_headers(), params=params)
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
         if response.status_code != 200:
             raise APIRequestFailedError(response.status_code)
         return response.json()
 
-    def get_orders_by_ids(self, order_ids: list):
+    def get_orders_by_ids(self, order_ids: list, chunk_size: int = 50, max_workers: int = 4):
         if not order_ids:
             raise ValueError("Order IDs must be provided.")
         url = f"{self.base_url}/orders/byIds"
-        params = {"ids": ",".join(order_ids)}
-        response = requests.get(url, headers=self._get_headers(), params=params)
-        if response.status_code != 200:
-            raise APIRequestFailedError(response.status_code)
-        return response.json()
+        return self._get_by_ids(url, list(order_ids), "orders", chunk_size, max_workers)
 
     def get_orders_all(self):
         url = f"{self.base_url}/orders/all"
-        response = requests.get(url, headers=self._get_headers())
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy)
         if response.status_code != 200:
             raise APIRequestFailedError(response.status_code)
         return response.json()
 
     def get_all_sync(self):
         url = f"{self.base_url}/orders/all/sync"
-        response = requests.get(url, headers=self._get_headers())
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy)
         if response.status_code != 200:
             raise APIRequestFailedError(response.status_code)
         return response.json()
@@ -183,7 +219,7 @@ class Rarible:
             raise ValueError("Maker address must be provided.")
         url = f"{self.base_url}/orders/sell/byMaker"
         params = {"maker": maker}
-        response = requests.get(url, headers=self._get_headers(), params=params)
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
         if response.status_code != 200:
             raise APIRequestFailedError(response.status_code)
         return response.json()
@@ -193,13 +229,13 @@ class Rarible:
             raise MissingItemIdError()
         url = f"{self.base_url}/orders/sell/byItem"
         params = {"itemId": item_id}
-        response = requests.get(url, headers=self._get_headers(), params=params)
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
         if response.status_code != 200:
             raise APIRequestFailedError(response.status_code)
         return response.json()
 
     def get_sell_orders(self, status: str = None, maker: str = None, collection: str = None, token: str = None,
-                        origin: str = None):
+                        origin: str = None, columnar: bool = False):
         url = f"{self.base_url}/orders/sell"
         params = {}
         if status:
@@ -212,9 +248,11 @@ class Rarible:
             params["token"] = token
         if origin:
             params["origin"] = origin
-        response = requests.get(url, headers=self._get_headers(), params=params)
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
         if response.status_code != 200:
             raise APIRequestFailedError(response.status_code)
+        if columnar:
+            return ListingBook.from_rarible(response.json())
         return response.json()
 
     def get_order_bids_by_maker(self, maker: str):
@@ -222,7 +260,7 @@ class Rarible:
             raise ValueError("Maker address must be provided.")
         url = f"{self.base_url}/orders/bids/byMaker"
         params = {"maker": maker}
-        response = requests.get(url, headers=self._get_headers(), params=params)
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
         if response.status_code != 200:
             raise APIRequestFailedError(response.status_code)
         return response.json()
@@ -232,7 +270,7 @@ class Rarible:
             raise MissingItemIdError()
         url = f"{self.base_url}/orders/bids/byItem"
         params = {"itemId": item_id}
-        response = requests.get(url, headers=self._get_headers(), params=params)
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
         if response.status_code != 200:
             raise APIRequestFailedError(response.status_code)
         return response.json()
@@ -242,7 +280,7 @@ class Rarible:
             raise MissingCollectionIdError()
         url = f"{self.base_url}/orders/bids/floorByCollection"
         params = {"collection": collection}
-        response = requests.get(url, headers=self._get_headers(), params=params)
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
         if response.status_code != 200:
             raise APIRequestFailedError(response.status_code)
         return response.json()
@@ -251,7 +289,7 @@ class Rarible:
         if not order_id:
             raise ValueError("Order ID must be provided.")
         url = f"{self.base_url}/orders/amm/tradeInfo/{order_id}"
-        response = requests.get(url, headers=self._get_headers())
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy)
         if response.status_code != 200:
             raise APIRequestFailedError(response.status_code)
         return response.json()
@@ -260,7 +298,7 @@ class Rarible:
         if not order_id:
             raise ValueError("Order ID must be provided.")
         url = f"{self.base_url}/orders/{order_id}/fees"
-        response = requests.get(url, headers=self._get_headers())
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy)
         if response.status_code != 200:
             raise APIRequestFailedError(response.status_code)
         return response.json()
@@ -269,7 +307,7 @@ class Rarible:
         if not collection_id:
             raise MissingCollectionIdError()
         url = f"{self.base_url}/collections/{collection_id}"
-        response = requests.get(url, headers=self._get_headers())
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy, cache="collection")
         if response.status_code != 200:
             raise APIRequestFailedError(response.status_code)
         return response.json()
@@ -281,7 +319,7 @@ class Rarible:
             raise ValueError("Minter address must be provided.")
         url = f"{self.base_url}/collections/{collection_id}/generateTokenId"
         params = {"minter": minter}
-        response = requests.get(url, headers=self._get_headers(), params=params)
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
         if response.status_code != 200:
             raise APIRequestFailedError(response.status_code)
         return response.json()
@@ -290,7 +328,7 @@ class Rarible:
         if not collection_id:
             raise MissingCollectionIdError()
         url = f"{self.base_url}/collections/{collection_id}/refresh"
-        response = requests.post(url, headers=self._get_headers())
+        response = self._transport.post(url, headers=self._headers, retry=self._retry_policy)
         if response.status_code != 200:
             raise APIRequestFailedError(response.status_code)
         return response.json()
@@ -299,7 +337,7 @@ class Rarible:
         if not collection_id:
             raise MissingCollectionIdError()
         url = f"{self.base_url}/collections/{collection_id}/reset"
-        response = requests.post(url, headers=self._get_headers())
+        response = self._transport.post(url, headers=self._headers, retry=self._retry_policy)
         if response.status_code != 200:
             raise APIRequestFailedError(response.status_code)
         return response.json()
@@ -308,14 +346,14 @@ class Rarible:
         if not owner:
             raise ValueError("Owner address must be provided.")
         url = f"{self.base_url}/collections/owner/{owner}"
-        response = requests.get(url, headers=self._get_headers())
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy)
         if response.status_code != 200:
             raise APIRequestFailedError(response.status_code)
         return response.json()
 
     def get_all_collections(self):
         url = f"{self.base_url}/collections"
-        response = requests.get(url, headers=self._get_headers())
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy)
         if response.status_code != 200:
             raise APIRequestFailedError(response.status_code)
         return response.json()
@@ -323,7 +361,7 @@ class Rarible:
     def get_collection_ranking_by_volume(self, period: str = "DAY", size: int = 10):
         url = f"{self.base_url}/nft/collections/ranking/volume"
         params = {"period": period, "size": size}
-        response = requests.get(url, headers=self._get_headers(), params=params)
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
         if response.status_code != 200:
             raise APIRequestFailedError(response.status_code)
         return response.json()
@@ -331,16 +369,40 @@ class Rarible:
     def get_transactions(self, start_date: str = None, end_date: str = None, cursor: str = None, limit: int = 100):
         url = f"{self.base_url}/nft/transactions"
         params = {"startDate": start_date, "endDate": end_date, "cursor": cursor, "limit": limit}
-        response = requests.get(url, headers=self._get_headers(), params=params)
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
         if response.status_code != 200:
             raise APIRequestFailedError(response.status_code)
         return response.json()
 
+    def export_transactions(self, path: str, start_date: str = None, end_date: str = None,
+                            checkpoint_path: str = None, page_size: int = 1000) -> int:
+        """
+        Stream every transaction in a date range to a gzip compressed NDJSON file, resuming an interrupted export.
+
+        Args:
+            path (str): The output file, e.g. "transactions.ndjson.gz".
+            start_date (str, optional): The start of the range.
+            end_date (str, optional): The end of the range.
+            checkpoint_path (str, optional): Where progress is recorded. Defaults to path + ".checkpoint".
+            page_size (int, optional): Number of transactions requested per page.
+
+        Returns:
+            int: The total number of exported records.
+        """
+        return TransactionExporter(self, path, checkpoint_path=checkpoint_path, page_size=page_size).export(
+            start_date=start_date, end_date=end_date)
+
     def get_collection_stats(self, collection_id: str):
         if not collection_id:
             raise MissingCollectionIdError()
+        if self._stats_cache is not None:
+            return self._stats_cache.get((self.base_url, "collection_stats", collection_id),
+                                         lambda: self._fetch_collection_stats(collection_id))
+        return self._fetch_collection_stats(collection_id)
+
+    def _fetch_collection_stats(self, collection_id: str):
         url = f"{self.base_url}/nft/collections/{collection_id}/stats"
-        response = requests.get(url, headers=self._get_headers())
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy)
         if response.status_code != 200:
             raise APIRequestFailedError(response.status_code)
         return response.json()
@@ -348,7 +410,7 @@ class Rarible:
     def get_sellers(self, size: int = 10):
         url = f"{self.base_url}/nft/sellers"
         params = {"size": size}
-        response = requests.get(url, headers=self._get_headers(), params=params)
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
         if response.status_code != 200:
             raise APIRequestFailedError(response.status_code)
         return response.json()
@@ -356,7 +418,7 @@ class Rarible:
     def get_buyers(self, size: int = 10):
         url = f"{self.base_url}/nft/buyers"
         params = {"size": size}
-        response = requests.get(url, headers=self._get_headers(), params=params)
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
         if response.status_code != 200:
             raise APIRequestFailedError(response.status_code)
         return response.json()
@@ -364,7 +426,7 @@ class Rarible:
     def get_listed(self, period: str = "DAY"):
         url = f"{self.base_url}/nft/listed"
         params = {"period": period}
-        response = requests.get(url, headers=self._get_headers(), params=params)
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
         if response.status_code != 200:
             raise APIRequestFailedError(response.status_code)
         return response.json()
@@ -372,7 +434,7 @@ class Rarible:
     def get_gmv(self, period: str = "DAY"):
         url = f"{self.base_url}/nft/gmv"
         params = {"period": period}
-        response = requests.get(url, headers=self._get_headers(), params=params)
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy, params=params)
         if response.status_code != 200:
             raise APIRequestFailedError(response.status_code)
         return response.json()
@@ -381,7 +443,7 @@ class Rarible:
         if not collection_id:
             raise MissingCollectionIdError()
         url = f"{self.base_url}/nft/collections/{collection_id}/floorPrice"
-        response = requests.get(url, headers=self._get_headers())
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy)
         if response.status_code != 200:
             raise APIRequestFailedError(response.status_code)
         return response.json()
@@ -390,28 +452,28 @@ class Rarible:
         if not domain:
             raise ValueError("Domain must be provided.")
         url = f"{self.base_url}/domains/{domain}"
-        response = requests.get(url, headers=self._get_headers())
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy)
         if response.status_code != 200:
             raise APIRequestFailedError(response.status_code)
         return response.json()
 
     def validate_signature(self, data: dict):
         url = f"{self.base_url}/signature/validate"
-        response = requests.post(url, headers=self._get_headers(), json=data)
+        response = self._transport.post(url, headers=self._headers, retry=self._retry_policy, json=data)
         if response.status_code != 200:
             raise APIRequestFailedError(response.status_code)
         return response.json()
 
     def get_signature_input(self, data: dict):
         url = f"{self.base_url}/signature/input"
-        response = requests.post(url, headers=self._get_headers(), json=data)
+        response = self._transport.post(url, headers=self._headers, retry=self._retry_policy, json=data)
         if response.status_code != 200:
             raise APIRequestFailedError(response.status_code)
         return response.json()
 
     def encode_data(self, data: dict):
         url = f"{self.base_url}/encode"
-        response = requests.post(url, headers=self._get_headers(), json=data)
+        response = self._transport.post(url, headers=self._headers, retry=self._retry_policy, json=data)
         if response.status_code != 200:
             raise APIRequestFailedError(response.status_code)
         return response.json()
@@ -420,14 +482,14 @@ class Rarible:
         if not currency:
             raise ValueError("Currency must be provided.")
         url = f"{self.base_url}/rates/{currency}/usd"
-        response = requests.get(url, headers=self._get_headers())
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy)
         if response.status_code != 200:
             raise APIRequestFailedError(response.status_code)
         return response.json()
 
     def get_all_currencies(self):
         url = f"{self.base_url}/currencies"
-        response = requests.get(url, headers=self._get_headers())
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy)
         if response.status_code != 200:
             raise APIRequestFailedError(response.status_code)
         return response.json()
@@ -436,7 +498,7 @@ class Rarible:
         if not user or not currency:
             raise ValueError("User and currency must be provided.")
         url = f"{self.base_url}/balances/{user}/{currency}"
-        response = requests.get(url, headers=self._get_headers())
+        response = self._transport.get(url, headers=self._headers, retry=self._retry_policy)
         if response.status_code != 200:
             raise APIRequestFailedError(response.status_code)
         return response.json()
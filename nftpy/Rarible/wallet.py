@@ -1,15 +1,20 @@
 from .rarible import Rarible, RaribleChain
+from ..transport import HTTPTransport
+from ..retry import RetryPolicy
+from ..instrumentation import instrumented
 
 
+@instrumented
 class RaribleWallet:
     """
     A class built for wallet specific interactions on Rareable.
     """
-    def __init__(self, api_key, wallet: str, chain: RaribleChain = RaribleChain.ETHEREUM):
+    def __init__(self, api_key, wallet: str, chain: RaribleChain = RaribleChain.ETHEREUM,
+                 transport: HTTPTransport = None, retry_policy: RetryPolicy = None):
         self._api_key = api_key
         self._wallet = wallet
         self._chain = chain
-        self._api = Rarible(api_key=api_key, chain=chain)
+        self._api = Rarible(api_key=api_key, chain=chain, transport=transport, retry_policy=retry_policy)
 
     def get_owned_items(self):
         """
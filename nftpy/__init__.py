@@ -1,8 +1,22 @@
 from .EVM import NFT, NFTWallet, ABI, Chains, Chain
-from .OpenSea import OpenSea, OpenSeaChain, OpenSeaWallet, OpenSeaCollection
-from .Rarible import Rarible, RaribleChain, RaribleCollection, RaribleWallet
-from .Mintable import Mintable, MintableChain
-from .LooksRare import LooksRareChain, LooksRareAPI
+from .OpenSea import OpenSea, OpenSeaChain, OpenSeaWallet, OpenSeaCollection, AsyncOpenSea
+from .Rarible import Rarible, RaribleChain, RaribleCollection, RaribleWallet, AsyncRarible
+from .Mintable import Mintable, MintableChain, AsyncMintable
+from .LooksRare import LooksRareChain, LooksRareAPI, AsyncLooksRare
+from .transport import HTTPTransport, AsyncHTTPTransport, get_default_transport, set_default_transport
+from .retry import RetryPolicy, RetryBudget
+from .concurrency import SingleFlight
+from .instrumentation import add_observer, remove_observer, clear_observers, RequestEvent, LatencyHistogram, \
+    RequestCounter
+from .metrics import MetricsExporter
+from .cassette import Cassette
+from .cache import HTTPCache, MemoryCacheBackend, DiskCacheBackend, StaleWhileRevalidateCache
+from .codec import set_json_backend, get_json_backend
+from .analytics import ListingBook
+from .rarity import RarityEngine
+from .trait_index import TraitIndex
+from .watcher import Watcher, ChangeEvent
+from .aggregator import FloorPriceAggregator, FloorPrices, FloorQuote
 __all__ = ["EVM", "OpenSea", "Rarible", "Mintable", "LooksRare"]
 
 __name__ = "nftpy"
@@ -0,0 +1,201 @@
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+from threading import Lock
+
+
+class FloorQuote:
+    """
+    The floor price reported by one marketplace.
+
+    ``stale`` is True when the source missed the deadline or failed and the last known value is returned instead.
+    ``error`` holds the exception of the failed request, if any.
+    """
+    __slots__ = ("source", "price", "fetched_at", "stale", "error")
+
+    def __init__(self, source: str, price: float, fetched_at: float, stale: bool = False, error: Exception = None):
+        self.source = source
+        self.price = price
+        self.fetched_at = fetched_at
+        self.stale = stale
+        self.error = error
+
+    @property
+    def age(self) -> float:
+        """Seconds since the price was fetched, or None if no price was ever received."""
+        return time.time() - self.fetched_at if self.fetched_at is not None else None
+
+    def __repr__(self):
+        return f"FloorQuote(source={self.source!r}, price={self.price!r}, stale={self.stale!r})"
+
+
+class FloorPrices:
+    """
+    The combined floor prices of one collection.
+    """
+    __slots__ = ("quotes", "created_at")
+
+    def __init__(self, quotes: dict, created_at: float):
+        self.quotes = quotes
+        self.created_at = created_at
+
+    @property
+    def floor_price(self) -> float:
+        """The lowest floor price across all sources that reported one."""
+        prices = [quote.price for quote in self.quotes.values() if quote.price is not None]
+        return min(prices) if prices else None
+
+    def __getitem__(self, source: str) -> FloorQuote:
+        return self.quotes[source]
+
+    def __repr__(self):
+        return f"FloorPrices(floor_price={self.floor_price!r}, quotes={list(self.quotes.values())!r})"
+
+
+def _opensea_floor(api, collection_slug):
+    return api.get_collection_stats(collection_slug)["total"]["floor_price"]
+
+
+def _rarible_floor(api, collection_id):
+    floor = api.get_floor_price(collection_id)
+    if isinstance(floor, dict):
+        floor = floor.get("value", floor.get("floorPrice"))
+    return float(floor) if floor is not None else None
+
+
+def _looksrare_floor(api, address):
+    floor = api.get_collection_stats(address, return_raw_json=True)["data"]["floorPrice"]
+    return int(floor) / 10 ** 18 if floor is not None else None
+
+
+class FloorPriceAggregator:
+    """
+    Queries the floor price of a collection on several marketplaces at once.
+
+    Every source is requested concurrently and the call returns once all of them answered or the deadline passed.
+    A source that missed the deadline or failed is reported with its last known price marked as stale; late answers
+    still update the last known price for the next call. Combined results are cached for ``cache_ttl`` seconds.
+
+    Args:
+        opensea (OpenSea, optional): The OpenSea client.
+        rarible (Rarible, optional): The Rarible client.
+        looksrare (LooksRareAPI, optional): The LooksRare client.
+        deadline (float, optional): Seconds to wait for the sources.
+        cache_ttl (float, optional): Seconds a combined result is served from cache.
+        max_entries (int, optional): Number of cached results and of last known prices kept before the least
+            recently used one is evicted.
+    """
+    def __init__(self, opensea=None, rarible=None, looksrare=None, deadline: float = 0.3, cache_ttl: float = 2.0,
+                 max_entries: int = 1024):
+        self.deadline = deadline
+        self.cache_ttl = cache_ttl
+        self.max_entries = max_entries
+        self._sources = {}
+        if opensea is not None:
+            self._sources["opensea"] = (opensea, _opensea_floor)
+        if rarible is not None:
+            self._sources["rarible"] = (rarible, _rarible_floor)
+        if looksrare is not None:
+            self._sources["looksrare"] = (looksrare, _looksrare_floor)
+        # Requests that miss the deadline keep running and refresh the last known prices when they land. Every source
+        # gets its own pool so a hung marketplace cannot take the workers of the healthy ones
+        self._executors = {source: ThreadPoolExecutor(max_workers=4, thread_name_prefix=f"floor-{source}")
+                           for source in self._sources}
+        # Requests still running, by (source, identifier); a new call waits on them instead of submitting again
+        self._in_flight = {}
+        self._last_known = OrderedDict()
+        self._results = OrderedDict()
+        self._lock = Lock()
+
+    def _store(self, entries: OrderedDict, key, value):
+        # Called with the lock held
+        entries[key] = value
+        entries.move_to_end(key)
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+
+    def _record(self, key, source, future):
+        with self._lock:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+        try:
+            price = future.result()
+        except Exception:
+            return
+        with self._lock:
+            self._store(self._last_known, key, FloorQuote(source, price, time.time()))
+
+    def get_floor_prices(self, opensea_slug: str = None, rarible_collection_id: str = None,
+                         looksrare_address: str = None) -> FloorPrices:
+        """
+        Get the floor price of a collection from every configured marketplace.
+
+        Args:
+            opensea_slug (str, optional): The OpenSea collection slug.
+            rarible_collection_id (str, optional): The Rarible collection ID, e.g. "ETHEREUM:0x...".
+            looksrare_address (str, optional): The collection contract address on LooksRare.
+
+        Returns:
+            FloorPrices: One FloorQuote per queried source.
+        """
+        identifiers = {"opensea": opensea_slug, "rarible": rarible_collection_id, "looksrare": looksrare_address}
+        requested = {source: identifier for source, identifier in identifiers.items()
+                     if identifier is not None and source in self._sources}
+        cache_key = tuple(sorted(requested.items()))
+        now = time.time()
+        with self._lock:
+            cached = self._results.get(cache_key)
+            if cached is not None:
+                if now - cached.created_at < self.cache_ttl:
+                    self._results.move_to_end(cache_key)
+                    return cached
+                del self._results[cache_key]
+
+        futures = {}
+        for source, identifier in requested.items():
+            key = (source, identifier)
+            with self._lock:
+                future = self._in_flight.get(key)
+                if future is None:
+                    api, fetch = self._sources[source]
+                    future = self._in_flight[key] = self._executors[source].submit(fetch, api, identifier)
+                    submitted = True
+                else:
+                    submitted = False
+            if submitted:
+                future.add_done_callback(lambda done, key=key, name=source: self._record(key, name, done))
+            futures[source] = future
+        wait(futures.values(), timeout=self.deadline)
+
+        quotes = {}
+        for source, future in futures.items():
+            error = None
+            if future.done():
+                try:
+                    quotes[source] = FloorQuote(source, future.result(), time.time())
+                    continue
+                except Exception as e:
+                    error = e
+            with self._lock:
+                last_known = self._last_known.get((source, requested[source]))
+                if last_known is not None:
+                    self._last_known.move_to_end((source, requested[source]))
+            if last_known is not None:
+                quotes[source] = FloorQuote(source, last_known.price, last_known.fetched_at, stale=True, error=error)
+            else:
+                quotes[source] = FloorQuote(source, None, None, stale=True, error=error)
+
+        result = FloorPrices(quotes, time.time())
+        with self._lock:
+            self._store(self._results, cache_key, result)
+        return result
+
+    def close(self):
+        for executor in self._executors.values():
+            executor.shutdown(wait=False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
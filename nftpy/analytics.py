@@ -0,0 +1,166 @@
+from datetime import datetime
+
+
+def _require_numpy():
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError("Columnar analytics require numpy. Install it with `pip install nftpy[analytics]`.") from e
+    return numpy
+
+
+def _timestamp(value) -> int:
+    if value in (None, ""):
+        return 0
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        pass
+    try:
+        return int(datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp())
+    except ValueError:
+        return 0
+
+
+def _strip_blockchain(value):
+    # Rarible prefixes addresses with the blockchain, e.g. "ETHEREUM:0x..."
+    return value.split(":", 1)[1] if isinstance(value, str) and ":" in value else value
+
+
+class ListingBook:
+    """
+    Listings of a collection stored as parallel NumPy arrays.
+
+    Prices are normalized to whole currency units (wei divided by the currency decimals). Token IDs, makers and
+    currencies are kept as object arrays since token IDs do not fit into 64 bit integers. Expiry is a unix timestamp,
+    0 when the listing does not expire.
+
+    Args:
+        price (array-like): Listing prices.
+        currency (array-like): Currency symbols or addresses.
+        token_id (array-like): Token IDs as strings.
+        maker (array-like): Maker addresses.
+        expiry (array-like): Expiry unix timestamps.
+    """
+    __slots__ = ("price", "currency", "token_id", "maker", "expiry")
+
+    def __init__(self, price, currency, token_id, maker, expiry):
+        np = _require_numpy()
+        self.price = np.asarray(price, dtype=np.float64)
+        self.currency = np.asarray(currency, dtype=object)
+        self.token_id = np.asarray(token_id, dtype=object)
+        self.maker = np.asarray(maker, dtype=object)
+        self.expiry = np.asarray(expiry, dtype=np.int64)
+
+    @classmethod
+    def _from_rows(cls, rows):
+        columns = tuple(zip(*rows)) if rows else ((), (), (), (), ())
+        return cls(*columns)
+
+    @classmethod
+    def from_opensea(cls, listings):
+        """
+        Build a book from an OpenSea listings response or its "listings" list.
+        """
+        if isinstance(listings, dict):
+            listings = listings.get("listings") or []
+        rows = []
+        for listing in listings:
+            current = (listing.get("price") or {}).get("current") or {}
+            parameters = (listing.get("protocol_data") or {}).get("parameters") or {}
+            offer = parameters.get("offer") or [{}]
+            value = current.get("value")
+            price = int(value) / 10 ** int(current.get("decimals", 18)) if value is not None else float("nan")
+            rows.append((price, current.get("currency"), offer[0].get("identifierOrCriteria"),
+                         parameters.get("offerer"), _timestamp(parameters.get("endTime"))))
+        return cls._from_rows(rows)
+
+    @classmethod
+    def from_rarible(cls, orders):
+        """
+        Build a book from a Rarible sell orders response or its "orders" list.
+        """
+        if isinstance(orders, dict):
+            orders = orders.get("orders") or []
+        rows = []
+        for order in orders:
+            make = order.get("make") or {}
+            take = order.get("take") or {}
+            take_type = take.get("type") or take.get("assetType") or {}
+            make_type = make.get("type") or make.get("assetType") or {}
+            price = order.get("makePrice")
+            if price is None and take.get("value") is not None and make.get("value"):
+                price = float(take["value"]) / float(make["value"])
+            currency = _strip_blockchain(take_type.get("contract")) or take_type.get("@type") \
+                or take_type.get("assetClass")
+            rows.append((float(price) if price is not None else float("nan"), currency, make_type.get("tokenId"),
+                         _strip_blockchain(order.get("maker")), _timestamp(order.get("endedAt") or order.get("end"))))
+        return cls._from_rows(rows)
+
+    def __len__(self):
+        return len(self.price)
+
+    def __repr__(self):
+        return f"ListingBook(listings={len(self)}, floor={self.floor()})"
+
+    def _mask(self, currency=None, now: int = None):
+        np = _require_numpy()
+        mask = ~np.isnan(self.price)
+        if currency is not None:
+            mask &= self.currency == currency
+        if now is not None:
+            mask &= (self.expiry == 0) | (self.expiry > now)
+        return mask
+
+    def select(self, currency: str = None, now: int = None) -> "ListingBook":
+        """
+        Get the listings in one currency and/or those still active at a unix timestamp.
+        """
+        mask = self._mask(currency, now)
+        return ListingBook(self.price[mask], self.currency[mask], self.token_id[mask], self.maker[mask],
+                           self.expiry[mask])
+
+    def floor(self, currency: str = None, now: int = None) -> float:
+        """
+        Get the lowest price, or None if there are no listings.
+        """
+        prices = self.price[self._mask(currency, now)]
+        return float(prices.min()) if len(prices) else None
+
+    def depth_at(self, price, currency: str = None, now: int = None):
+        """
+        Count the listings priced at or below one or more prices.
+
+        Args:
+            price (float or array-like): The price levels.
+
+        Returns:
+            int or numpy.ndarray: The number of listings per price level.
+        """
+        np = _require_numpy()
+        prices = np.sort(self.price[self._mask(currency, now)])
+        depth = np.searchsorted(prices, price, side="right")
+        return int(depth) if np.ndim(depth) == 0 else depth
+
+    def percentiles(self, q=(10, 25, 50, 75, 90), currency: str = None, now: int = None):
+        """
+        Get price percentiles.
+
+        Args:
+            q (float or array-like): Percentiles between 0 and 100.
+
+        Returns:
+            numpy.ndarray: The price at each percentile, NaN if there are no listings.
+        """
+        np = _require_numpy()
+        prices = self.price[self._mask(currency, now)]
+        if not len(prices):
+            return np.full(np.shape(q), np.nan)
+        return np.percentile(prices, q)
+
+    def histogram(self, bins=20, currency: str = None, now: int = None):
+        """
+        Get the price distribution as (counts, bin_edges), see numpy.histogram.
+        """
+        np = _require_numpy()
+        return np.histogram(self.price[self._mask(currency, now)], bins=bins)
@@ -0,0 +1,308 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from threading import Lock, Thread
+from urllib.parse import urlencode
+from .concurrency import SingleFlight
+
+
+class CacheEntry:
+    """
+    A stored response together with its validators.
+    """
+    __slots__ = ("status_code", "headers", "content", "url", "expires_at", "etag", "last_modified")
+
+    def __init__(self, status_code: int, headers: dict, content: bytes, url: str, expires_at: float):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.url = url
+        self.expires_at = expires_at
+        self.etag = headers.get("ETag") or headers.get("etag")
+        self.last_modified = headers.get("Last-Modified") or headers.get("last-modified")
+
+    def is_fresh(self, now: float = None) -> bool:
+        return (now or time.time()) < self.expires_at
+
+    def conditional_headers(self) -> dict:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class MemoryCacheBackend:
+    """
+    An in-process LRU cache backend.
+
+    Args:
+        max_entries (int, optional): Number of responses kept before the least recently used one is evicted.
+    """
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: str):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class DiskCacheBackend:
+    """
+    A cache backend storing one file per response, so cached data survives restarts and is shared between processes.
+
+    Each file holds a JSON line with the status, headers, URL and expiry followed by the raw body. Nothing in it is
+    executed when read, and unreadable files count as misses.
+
+    Args:
+        directory (str, optional): Where cached responses are written. Defaults to ~/.nftpy/cache.
+    """
+    FORMAT_VERSION = 1
+
+    def __init__(self, directory: str = None):
+        self.directory = directory or os.path.join(os.path.expanduser("~"), ".nftpy", "cache")
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, hashlib.sha256(key.encode("utf-8")).hexdigest())
+
+    def get(self, key: str):
+        try:
+            with open(self._path(key), "rb") as file:
+                header = json.loads(file.readline())
+                content = file.read()
+            if header.get("version") != self.FORMAT_VERSION:
+                return None
+            entry = CacheEntry(header["status_code"], header["headers"], content, header["url"], header["expires_at"])
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return None
+        if not isinstance(entry.status_code, int) or not isinstance(entry.expires_at, (int, float)):
+            return None
+        return entry
+
+    def set(self, key: str, entry: CacheEntry):
+        # A response that cannot be cached is still returned to the caller, so write failures are dropped
+        path = self._path(key)
+        header = {"version": self.FORMAT_VERSION, "status_code": entry.status_code, "headers": entry.headers,
+                  "url": entry.url, "expires_at": entry.expires_at}
+        try:
+            descriptor, temp_path = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp",
+                                                     dir=self.directory)
+        except OSError:
+            return
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(json.dumps(header, separators=(",", ":")).encode("utf-8") + b"\n")
+                file.write(entry.content)
+            os.replace(temp_path, path)
+        except (OSError, TypeError, ValueError):
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+    def delete(self, key: str):
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def clear(self):
+        for name in os.listdir(self.directory):
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+
+
+class HTTPCache:
+    """
+    A response cache for slowly changing marketplace reads.
+
+    Clients tag cacheable requests with an endpoint class. A fresh entry is served without touching the network;
+    once its TTL has passed the request is revalidated with If-None-Match / If-Modified-Since and a 304 answer
+    refreshes the stored entry instead of downloading the payload again.
+
+    Args:
+        backend (optional): MemoryCacheBackend (default), DiskCacheBackend or any object with get/set/delete/clear.
+        ttls (dict, optional): TTL in seconds per endpoint class, merged over DEFAULT_TTLS.
+    """
+    DEFAULT_TTLS = {
+        "collection": 300,
+        "contract": 3600,
+        "payment_token": 3600,
+        "traits": 600,
+        "default": 60,
+    }
+
+    def __init__(self, backend=None, ttls: dict = None):
+        self.backend = backend or MemoryCacheBackend()
+        self.ttls = dict(self.DEFAULT_TTLS, **(ttls or {}))
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+
+    @staticmethod
+    def key(method: str, url: str, params: dict = None) -> str:
+        if params:
+            params = sorted((key, value) for key, value in params.items() if value is not None)
+            return f"{method} {url}?{urlencode(params)}"
+        return f"{method} {url}"
+
+    def ttl(self, endpoint: str) -> float:
+        return self.ttls.get(endpoint, self.ttls["default"])
+
+    def lookup(self, key: str):
+        return self.backend.get(key)
+
+    def store(self, key: str, endpoint: str, status_code: int, headers, content: bytes, url: str) -> CacheEntry:
+        """
+        Store a successful response unless it forbids caching.
+
+        Returns:
+            CacheEntry: The stored entry, or None if the response was not cacheable.
+        """
+        if "no-store" in (headers.get("Cache-Control") or ""):
+            return None
+        entry = CacheEntry(status_code, dict(headers), content, url, time.time() + self.ttl(endpoint))
+        self.backend.set(key, entry)
+        return entry
+
+    def refresh(self, key: str, endpoint: str, entry: CacheEntry) -> CacheEntry:
+        """
+        Extend the lifetime of an entry after the server confirmed it is unchanged.
+        """
+        entry.expires_at = time.time() + self.ttl(endpoint)
+        self.backend.set(key, entry)
+        return entry
+
+    def clear(self):
+        self.backend.clear()
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class _StaleEntry:
+    __slots__ = ("value", "stored_at")
+
+    def __init__(self, value, stored_at: float):
+        self.value = value
+        self.stored_at = stored_at
+
+
+class StaleWhileRevalidateCache:
+    """
+    Serves cached values instantly and refreshes them in the background.
+
+    A value younger than soft_ttl is returned as is. Between soft_ttl and hard_ttl it is still returned immediately
+    while one background refresh per key replaces it. Past hard_ttl, or on a miss, the caller blocks on the load;
+    concurrent callers for the same key share that load. A failed background refresh keeps the stale value.
+
+    Args:
+        soft_ttl (float, optional): Seconds after which a value is refreshed in the background.
+        hard_ttl (float, optional): Seconds after which a value is no longer served.
+        max_entries (int, optional): Number of values kept before the least recently used one is evicted.
+    """
+    def __init__(self, soft_ttl: float = 30.0, hard_ttl: float = 300.0, max_entries: int = 1024):
+        self.soft_ttl = soft_ttl
+        self.hard_ttl = hard_ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = Lock()
+        self._loads = SingleFlight()
+        self._refreshing = set()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refresh_errors = 0
+
+    def _store(self, key, value):
+        with self._lock:
+            self._entries[key] = _StaleEntry(value, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def _load(self, key, loader):
+        return self._store(key, loader())
+
+    def _refresh(self, key, loader):
+        try:
+            self._loads.do(key, self._load, key, loader)
+        except Exception:
+            self.refresh_errors += 1
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def get(self, key, loader):
+        """
+        Get the value of a key, calling loader() to fetch it when needed.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                age = now - entry.stored_at
+                if age < self.soft_ttl:
+                    self.hits += 1
+                    return entry.value
+                if age < self.hard_ttl:
+                    self.stale_hits += 1
+                    refresh = key not in self._refreshing
+                    if refresh:
+                        self._refreshing.add(key)
+                else:
+                    entry = None
+            if entry is None:
+                self.misses += 1
+        if entry is None:
+            return self._loads.do(key, self._load, key, loader)
+        if refresh:
+            Thread(target=self._refresh, args=(key, loader), daemon=True).start()
+        return entry.value
+
+    def invalidate(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.stale_hits + self.misses
+        return (self.hits + self.stale_hits) / total if total else 0.0
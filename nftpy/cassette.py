@@ -0,0 +1,228 @@
+import base64
+import gzip
+import time
+from collections import deque
+from datetime import datetime, timezone
+from threading import Lock
+from urllib.parse import urlencode
+from .codec import dumps, loads
+from .errors import CassetteException, CassetteMissError, InvalidCassetteError
+
+# Mutated in place so the transports and the RPC provider can check it with a single truthiness test
+_cassettes = []
+
+_RECORDED_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Cache-Control", "Retry-After")
+
+
+def http_key(method: str, url: str, params: dict = None, json=None) -> str:
+    key = f"{method} {url}"
+    if params:
+        query = sorted((name, value) for name, value in params.items() if value is not None)
+        if query:
+            key += ("&" if "?" in url else "?") + urlencode(query)
+    if json is not None:
+        key += " " + dumps(json)
+    return key
+
+
+def rpc_key(endpoint: str, method: str, params) -> str:
+    return f"{endpoint} {method} {dumps(params)}"
+
+
+class Exchange:
+    """
+    One recorded request and its response.
+
+    Args:
+        kind (str): "http" or "rpc".
+        key (str): The request, see http_key and rpc_key. Request headers are never recorded.
+        offset (float): Seconds between the start of the recording and the request.
+        duration (float): Seconds the response took.
+        status (int): The HTTP status code, None if no response was received.
+        headers (dict): The recorded response headers.
+        content (bytes): The response body.
+        url (str): The final response URL.
+        error (str): "connection", "timeout" or "http" if the request raised instead of returning.
+    """
+    __slots__ = ("kind", "key", "offset", "duration", "status", "headers", "content", "url", "error")
+
+    def __init__(self, kind: str, key: str, offset: float, duration: float, status: int = None, headers: dict = None,
+                 content: bytes = b"", url: str = None, error: str = None):
+        self.kind = kind
+        self.key = key
+        self.offset = offset
+        self.duration = duration
+        self.status = status
+        self.headers = headers or {}
+        self.content = content
+        self.url = url
+        self.error = error
+
+    def to_dict(self) -> dict:
+        record = {"k": self.kind, "q": self.key, "t": round(self.offset, 6), "d": round(self.duration, 6)}
+        if self.status is not None:
+            record["s"] = self.status
+        if self.headers:
+            record["h"] = self.headers
+        if self.content:
+            try:
+                record["b"] = self.content.decode("utf-8")
+            except UnicodeDecodeError:
+                record["b64"] = base64.b64encode(self.content).decode("ascii")
+        if self.url is not None:
+            record["u"] = self.url
+        if self.error is not None:
+            record["x"] = self.error
+        return record
+
+    @classmethod
+    def from_dict(cls, record: dict) -> "Exchange":
+        if "b64" in record:
+            content = base64.b64decode(record["b64"])
+        else:
+            content = record.get("b", "").encode("utf-8")
+        return cls(record["k"], record["q"], record["t"], record["d"], record.get("s"), record.get("h"), content,
+                   record.get("u"), record.get("x"))
+
+
+class Cassette:
+    """
+    Records every HTTP and JSON-RPC exchange of the process to a file, or replays a recording instead of the network.
+
+    While a cassette is active the marketplace clients (through HTTPTransport and AsyncHTTPTransport) and NFT,
+    NFTWallet and BlockFollower (through the RPC provider) use it for every request attempt, retries included. The
+    file is gzip compressed JSON Lines: a header line followed by one line per exchange.
+
+    Replayed requests are matched on kind, method, URL, query parameters and body, and identical requests receive
+    their recorded responses in order. Each replayed response is delayed by its recorded duration times time_scale,
+    so a replay reproduces the original latency (1.0), a faster or slower network, or none at all (0).
+
+    Request headers are never recorded, but URLs are; an RPC URL containing an API key ends up in the cassette.
+
+    Args:
+        path (str): The cassette file.
+        mode (str, optional): "record" or "replay".
+        time_scale (float, optional): Factor applied to the recorded durations when replaying.
+        strict (bool, optional): Raise CassetteMissError for requests missing from the recording instead of sending
+            them to the network.
+    """
+    FORMAT_VERSION = 1
+
+    def __init__(self, path: str, mode: str = "replay", time_scale: float = 1.0, strict: bool = True):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown cassette mode '{mode}'. Use 'record' or 'replay'.")
+        self.path = path
+        self.mode = mode
+        self.time_scale = time_scale
+        self.strict = strict
+        self.recorded = 0
+        self.replayed = 0
+        self._exchanges = {}
+        self._file = None
+        self._started = None
+        self._lock = Lock()
+
+    @classmethod
+    def record(cls, path: str) -> "Cassette":
+        return cls(path, mode="record")
+
+    @classmethod
+    def replay(cls, path: str, time_scale: float = 1.0, strict: bool = True) -> "Cassette":
+        return cls(path, mode="replay", time_scale=time_scale, strict=strict)
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    def _load(self):
+        try:
+            with gzip.open(self.path, "rt", encoding="utf-8") as file:
+                header = loads(file.readline() or "{}")
+                if header.get("cassette") != self.FORMAT_VERSION:
+                    raise InvalidCassetteError(f"Unsupported cassette format {header.get('cassette')} in {self.path}.")
+                for line in file:
+                    exchange = Exchange.from_dict(loads(line))
+                    self._exchanges.setdefault((exchange.kind, exchange.key), deque()).append(exchange)
+        except (OSError, ValueError, KeyError) as e:
+            raise InvalidCassetteError(f"Cannot read cassette {self.path}: {e}") from e
+
+    def start(self) -> "Cassette":
+        """
+        Make this the active cassette of the process.
+
+        Raises:
+            CassetteException: If another cassette is active.
+        """
+        with self._lock:
+            if _cassettes:
+                raise CassetteException("Another cassette is already active.")
+            if self.replaying:
+                self._load()
+            else:
+                self._file = gzip.open(self.path, "wt", encoding="utf-8")
+                self._file.write(dumps({"cassette": self.FORMAT_VERSION,
+                                        "created": datetime.now(timezone.utc).isoformat(timespec="seconds")}) + "\n")
+            self._started = time.perf_counter()
+            _cassettes.append(self)
+        return self
+
+    def stop(self):
+        """
+        Deactivate the cassette and finish the recording.
+        """
+        with self._lock:
+            if self in _cassettes:
+                _cassettes.remove(self)
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def remaining(self) -> int:
+        """
+        Get the number of recorded exchanges not replayed yet.
+        """
+        with self._lock:
+            return sum(len(exchanges) for exchanges in self._exchanges.values())
+
+    def add(self, kind: str, key: str, started: float, status: int = None, headers=None, content: bytes = b"",
+            url: str = None, error: str = None):
+        """
+        Record an exchange that started at the perf_counter value started and has just finished.
+        """
+        now = time.perf_counter()
+        if headers:
+            headers = {name: headers[name] for name in _RECORDED_HEADERS if name in headers}
+        exchange = Exchange(kind, key, started - self._started, now - started, status, headers, content, url, error)
+        line = dumps(exchange.to_dict()) + "\n"
+        with self._lock:
+            if self._file is not None:
+                self._file.write(line)
+                self.recorded += 1
+
+    def next(self, kind: str, key: str) -> Exchange:
+        """
+        Take the next recorded exchange of a request.
+
+        Returns:
+            Exchange: The exchange, or None if it is missing and the cassette is not strict.
+
+        Raises:
+            CassetteMissError: If the request is missing from the recording and the cassette is strict.
+        """
+        with self._lock:
+            exchanges = self._exchanges.get((kind, key))
+            if exchanges:
+                self.replayed += 1
+                return exchanges.popleft()
+        if self.strict:
+            raise CassetteMissError(key)
+        return None
+
+    def delay(self, exchange: Exchange) -> float:
+        return exchange.duration * self.time_scale
@@ -0,0 +1,89 @@
+import json as _json
+from threading import Lock
+
+
+def _stdlib_loads(data):
+    return _json.loads(data)
+
+
+def _stdlib_dumps(obj) -> str:
+    return _json.dumps(obj, separators=(",", ":"))
+
+
+def _orjson_codec():
+    import orjson
+
+    def loads(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # e.g. UTF-16 bodies, which only the stdlib decoder detects
+            return _json.loads(data)
+
+    def dumps(obj) -> str:
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except TypeError:
+            return _stdlib_dumps(obj)
+
+    return loads, dumps
+
+
+_BACKENDS = {
+    "orjson": _orjson_codec,
+    "json": lambda: (_stdlib_loads, _stdlib_dumps),
+}
+
+_backend = "json"
+_loads = _stdlib_loads
+_dumps = _stdlib_dumps
+_lock = Lock()
+
+
+def set_json_backend(name: str = "json") -> str:
+    """
+    Select the JSON backend used to decode HTTP and RPC responses and to encode exported records.
+
+    The standard library decoder is the default. orjson is faster but decodes bare integers wider than 64 bits as
+    floats, silently losing precision, so it has to be selected explicitly and is only safe for sources known to send
+    such values (wei amounts, large token IDs) as strings. Token metadata is arbitrary third party JSON.
+
+    Args:
+        name (str, optional): "json" or "orjson".
+
+    Returns:
+        str: The name of the active backend.
+
+    Raises:
+        ValueError: If the backend is unknown.
+        ImportError: If the backend is not installed.
+    """
+    global _backend, _loads, _dumps
+    if name not in _BACKENDS:
+        raise ValueError(f"Unknown JSON backend '{name}'. Available backends: {', '.join(_BACKENDS)}.")
+    with _lock:
+        _loads, _dumps = _BACKENDS[name]()
+        _backend = name
+        return _backend
+
+
+def get_json_backend() -> str:
+    """
+    Get the name of the active JSON backend.
+    """
+    return _backend
+
+
+def loads(data):
+    """
+    Decode a JSON document given as str or bytes.
+    """
+    return _loads(data)
+
+
+def dumps(obj) -> str:
+    """
+    Encode an object as compact JSON.
+    """
+    return _dumps(obj)
+
@@ -0,0 +1,108 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, Lock
+
+
+class RateLimiter:
+    """
+    A thread safe token bucket shared by concurrent workers.
+
+    Args:
+        rate (float): Requests allowed per second.
+        burst (int, optional): Requests allowed back to back before the rate applies.
+    """
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = Lock()
+
+    def acquire(self):
+        """
+        Block until a request may be sent.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Reserve the token now and sleep outside the lock so waiting workers queue up fairly
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+
+def bounded_map(func, items, max_workers: int = 4) -> list:
+    """
+    Call func on every item with at most max_workers calls in flight.
+
+    Args:
+        func (callable): Called with one item.
+        items (iterable): The inputs.
+        max_workers (int, optional): Maximum number of concurrent calls.
+
+    Returns:
+        list: One (result, error) pair per item, in input order. Exactly one of the two is None.
+    """
+    items = list(items)
+
+    def call(item):
+        try:
+            return func(item), None
+        except Exception as e:
+            return None, e
+
+    if len(items) <= 1 or max_workers <= 1:
+        return [call(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(call, items))
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls.
+
+    The first caller for a key runs the function; callers arriving while it is in flight wait for it and receive the
+    same result or exception. Nothing is cached: once the call returns the next caller starts a new one.
+    """
+    def __init__(self):
+        self._calls = {}
+        self._lock = Lock()
+        self.shared = 0
+
+    def do(self, key, func, *args, **kwargs):
+        """
+        Run func(*args, **kwargs) unless a call with the same key is already in flight, then wait for that one.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.shared += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = func(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
@@ -41,6 +41,18 @@ class NoCredentialsProvidedError(NFTException):
         self.message = "Either private_key or address must be provided. Using address will grant you with a read-only interface. Transactions can be made by supplying a private key."
         super().__init__(self.message)
 
+class UnknownChainError(NFTException):
+    """Raised when a chain reference does not match any registered chain."""
+    def __init__(self, chain):
+        self.message = f"Unknown chain: {chain}"
+        super().__init__(self.message)
+
+class InvalidChainConfigError(NFTException):
+    """Raised when a chain definition or chain config file is invalid."""
+    def __init__(self, message):
+        self.message = message
+        super().__init__(self.message)
+
 class OpenSeaException(Exception):
     """Base class for exceptions in OpenSea class."""
     pass
@@ -85,6 +97,14 @@ class APIRequestFailedError(RaribleException):
         self.message = f"API request failed with status code {status_code}."
         super().__init__(self.message)
 
+class BatchRequestFailedError(RaribleException):
+    """Raised when some chunks of a chunked bulk request failed."""
+    def __init__(self, errors, partial):
+        self.errors = errors
+        self.partial = partial
+        self.message = f"{len(errors)} chunk(s) of the bulk request failed: {errors[0][1]}"
+        super().__init__(self.message)
+
 class LooksRareException(Exception):
     """Base class for exceptions in LooksRare class."""
     pass
@@ -107,4 +127,34 @@ class APIKeyRequiredForPostError(LooksRareException):
 class InvalidLooksRareAPIRequest(LooksRareException):
     def __init__(self, message="Invalid request to the LooksRare API."):
         self.message = message
-        super().__init__(self.message)
\ No newline at end of file
+        super().__init__(self.message)
+
+class MintableException(Exception):
+    """Base class for exceptions in Mintable class."""
+    pass
+
+class BulkFetchFailedError(MintableException):
+    """Raised when some requests of a bulk fetch failed. partial has one entry per ID, None where the request failed."""
+    def __init__(self, errors, partial):
+        self.errors = errors
+        self.partial = partial
+        self.failed_ids = [request_id for request_id, _ in errors]
+        self.message = f"{len(errors)} request(s) of the bulk fetch failed: {errors[0][1]}"
+        super().__init__(self.message)
+
+class CassetteException(Exception):
+    """Base class for exceptions in Cassette class."""
+    pass
+
+class CassetteMissError(CassetteException):
+    """Raised when a replayed request has no recorded exchange left."""
+    def __init__(self, key):
+        self.key = key
+        self.message = f"No recorded exchange left for {key}"
+        super().__init__(self.message)
+
+class InvalidCassetteError(CassetteException):
+    """Raised when a cassette file is not readable or from an unsupported version."""
+    def __init__(self, message):
+        self.message = message
+        super().__init__(self.message)
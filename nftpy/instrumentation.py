@@ -0,0 +1,366 @@
+import asyncio
+import functools
+import inspect
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from threading import Lock
+from urllib.parse import urlsplit
+
+# Mutated in place so the transports can import it and check it with a single truthiness test
+_observers = []
+_lock = Lock()
+_classes = []
+_originals = {}
+_operation = ContextVar("nftpy_operation", default=None)
+
+
+class RequestEvent:
+    """
+    One observed request or client call.
+
+    Args:
+        kind (str): "http" for a marketplace or metadata request, "rpc" for a JSON-RPC request, "call" for a completed
+            client method such as OpenSea.get_collection_stats or NFT.get_owner.
+        method (str): The HTTP method, the JSON-RPC method, or the client method name.
+        endpoint (str): The client method that made the request, e.g. "Rarible.get_item_by_id". The host when the
+            request was made outside a client method.
+        chain (str): The chain of the client or RPC connection, if known.
+        status (int): The HTTP status code. None if no response was received and for call events.
+        bytes (int): The size of the response body, 0 if there was none.
+        duration (float): Seconds from sending the request, or calling the method, to the response or return.
+        error (str): The exception class name if the request or call failed, "JSONRPCError" for RPC error responses.
+    """
+    __slots__ = ("kind", "method", "endpoint", "chain", "status", "bytes", "duration", "error")
+
+    def __init__(self, kind: str, method: str, endpoint: str, chain: str, status: int, bytes: int, duration: float,
+                 error: str = None):
+        self.kind = kind
+        self.method = method
+        self.endpoint = endpoint
+        self.chain = chain
+        self.status = status
+        self.bytes = bytes
+        self.duration = duration
+        self.error = error
+
+    def __repr__(self):
+        return (f"RequestEvent(kind={self.kind!r}, method={self.method!r}, endpoint={self.endpoint!r}, "
+                f"chain={self.chain!r}, status={self.status!r}, duration={self.duration:.6f})")
+
+
+def _chain_name(chain):
+    if chain is None or isinstance(chain, str):
+        return chain
+    return getattr(chain, "name", None) or str(chain)
+
+
+def _client_chain(client):
+    for attribute in ("chain", "_chain", "network"):
+        chain = getattr(client, attribute, None)
+        if chain is not None:
+            return _chain_name(chain)
+    return None
+
+
+def _emit(event: RequestEvent):
+    for observer in tuple(_observers):
+        try:
+            observer(event)
+        except Exception:
+            # A broken observer must never fail the request it observes
+            pass
+
+
+def report(kind: str, method: str, url: str, status, size: int, started: float, error: BaseException = None,
+           chain=None):
+    """
+    Report a finished wire request to the observers. Called by the transports and the RPC provider.
+    """
+    operation = _operation.get()
+    if operation is not None:
+        endpoint, operation_chain = operation
+    else:
+        endpoint, operation_chain = urlsplit(url).netloc if url else None, None
+    if isinstance(error, BaseException):
+        error = type(error).__name__
+    _emit(RequestEvent(kind, method, endpoint, _chain_name(chain) or operation_chain, status, size,
+                       time.perf_counter() - started, error))
+
+
+def _call_event(name, label, duration, error):
+    endpoint, chain = label
+    _emit(RequestEvent("call", name, endpoint, chain, None, 0, duration, type(error).__name__ if error else None))
+
+
+def _observed_generator(generator, name, label, outermost, elapsed):
+    # The label is only set while the generator runs and only that time is counted, so what the consumer does
+    # between items is not attributed to the iteration
+    error = None
+    try:
+        while True:
+            token = _operation.set(label)
+            started = time.perf_counter()
+            try:
+                item = next(generator)
+            except StopIteration:
+                return
+            finally:
+                elapsed += time.perf_counter() - started
+                _operation.reset(token)
+            yield item
+    except BaseException as e:
+        if not isinstance(e, GeneratorExit):
+            error = e
+        raise
+    finally:
+        generator.close()
+        if outermost:
+            _call_event(name, label, elapsed, error)
+
+
+async def _observed_async_generator(generator, name, label, outermost, elapsed):
+    error = None
+    try:
+        while True:
+            token = _operation.set(label)
+            started = time.perf_counter()
+            try:
+                item = await generator.__anext__()
+            except StopAsyncIteration:
+                return
+            finally:
+                elapsed += time.perf_counter() - started
+                _operation.reset(token)
+            yield item
+    except BaseException as e:
+        if not isinstance(e, GeneratorExit):
+            error = e
+        raise
+    finally:
+        await generator.aclose()
+        if outermost:
+            _call_event(name, label, elapsed, error)
+
+
+def _wrap(func):
+    # Only the outermost client method reports a call event, so a wrapper delegating to a client reports once
+    if asyncio.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            outermost = _operation.get() is None
+            label = (f"{type(self).__name__}.{func.__name__}", _client_chain(self))
+            token = _operation.set(label)
+            started = time.perf_counter()
+            error = None
+            try:
+                return await func(self, *args, **kwargs)
+            except BaseException as e:
+                error = e
+                raise
+            finally:
+                _operation.reset(token)
+                if outermost:
+                    _call_event(func.__name__, label, time.perf_counter() - started, error)
+    else:
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            outermost = _operation.get() is None
+            label = (f"{type(self).__name__}.{func.__name__}", _client_chain(self))
+            token = _operation.set(label)
+            started = time.perf_counter()
+            try:
+                result = func(self, *args, **kwargs)
+            except BaseException as e:
+                _operation.reset(token)
+                if outermost:
+                    _call_event(func.__name__, label, time.perf_counter() - started, e)
+                raise
+            _operation.reset(token)
+            # iter_* methods return generators that do their requests while being consumed; time that instead
+            if inspect.isgenerator(result):
+                return _observed_generator(result, func.__name__, label, outermost, time.perf_counter() - started)
+            if inspect.isasyncgen(result):
+                return _observed_async_generator(result, func.__name__, label, outermost,
+                                                 time.perf_counter() - started)
+            if outermost:
+                _call_event(func.__name__, label, time.perf_counter() - started, None)
+            return result
+    wrapper.__wrapped__ = func
+    return wrapper
+
+
+def _patch(cls):
+    originals = _originals.setdefault(cls, {})
+    for name, attribute in list(vars(cls).items()):
+        if name.startswith("_") or not callable(attribute) or isinstance(attribute, (staticmethod, classmethod, type)):
+            continue
+        originals[name] = attribute
+        setattr(cls, name, _wrap(attribute))
+
+
+def _unpatch(cls):
+    for name, attribute in _originals.pop(cls, {}).items():
+        setattr(cls, name, attribute)
+
+
+def instrumented(cls):
+    """
+    Register a client class whose public methods label the requests they make.
+
+    The methods are only wrapped while at least one observer is added, so an uninstrumented process calls the
+    original methods directly.
+    """
+    with _lock:
+        _classes.append(cls)
+        if _observers:
+            _patch(cls)
+    return cls
+
+
+def add_observer(observer):
+    """
+    Add an observer called with a RequestEvent for every HTTP request, JSON-RPC request and client call.
+
+    Observers run synchronously on the thread or event loop that made the request, so they should be fast. Exceptions
+    raised by an observer are ignored.
+
+    Args:
+        observer (callable): Called with one RequestEvent, e.g. a LatencyHistogram or RequestCounter.
+    """
+    with _lock:
+        if not _observers:
+            for cls in _classes:
+                _patch(cls)
+        _observers.append(observer)
+
+
+def remove_observer(observer):
+    """
+    Remove an observer. Removing the last one restores the original client methods.
+    """
+    with _lock:
+        _observers.remove(observer)
+        if not _observers:
+            for cls in _classes:
+                _unpatch(cls)
+
+
+def clear_observers():
+    """
+    Remove every observer.
+    """
+    with _lock:
+        if _observers:
+            _observers.clear()
+            for cls in _classes:
+                _unpatch(cls)
+
+
+class LatencyHistogram:
+    """
+    An observer counting request durations into cumulative buckets per (kind, endpoint, chain).
+
+    Args:
+        buckets (tuple, optional): Upper bounds of the buckets in seconds, ascending.
+        kinds (tuple, optional): The event kinds to record.
+    """
+    DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self, buckets: tuple = DEFAULT_BUCKETS, kinds: tuple = ("http", "rpc", "call")):
+        self.buckets = tuple(buckets)
+        self.kinds = kinds
+        self._series = {}
+        self._lock = Lock()
+
+    def __call__(self, event: RequestEvent):
+        if event.kind not in self.kinds:
+            return
+        key = (event.kind, event.endpoint, event.chain)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][bisect_left(self.buckets, event.duration)] += 1
+            series[1] += event.duration
+
+    def snapshot(self) -> dict:
+        """
+        Get the histograms.
+
+        Returns:
+            dict: (kind, endpoint, chain) -> {"buckets": [(upper_bound, cumulative_count), ...], "count": int,
+            "sum": float}. The last bucket has the upper bound float("inf").
+        """
+        with self._lock:
+            series = {key: (list(counts), total) for key, (counts, total) in self._series.items()}
+        snapshot = {}
+        for key, (counts, total) in series.items():
+            cumulative, buckets = 0, []
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                buckets.append((bound, cumulative))
+            snapshot[key] = {"buckets": buckets, "count": cumulative, "sum": total}
+        return snapshot
+
+    def quantile(self, q: float, kind: str, endpoint: str, chain: str = None) -> float:
+        """
+        Estimate a latency quantile of one series as the upper bound of the bucket holding it.
+
+        Args:
+            q (float): The quantile between 0 and 1.
+
+        Returns:
+            float: The bucket upper bound in seconds, None if the series has no observations.
+        """
+        series = self.snapshot().get((kind, endpoint, chain))
+        if series is None or not series["count"]:
+            return None
+        rank = q * series["count"]
+        for bound, cumulative in series["buckets"]:
+            if cumulative >= rank:
+                return bound
+        return float("inf")
+
+    def reset(self):
+        with self._lock:
+            self._series.clear()
+
+
+class RequestCounter:
+    """
+    An observer counting requests, errors and response bytes.
+    """
+    def __init__(self):
+        self._requests = {}
+        self._errors = {}
+        self._bytes = {}
+        self._lock = Lock()
+
+    def __call__(self, event: RequestEvent):
+        series = (event.kind, event.endpoint, event.chain)
+        with self._lock:
+            key = series + (event.method, event.status)
+            self._requests[key] = self._requests.get(key, 0) + 1
+            if event.error is not None:
+                key = series + (event.error,)
+                self._errors[key] = self._errors.get(key, 0) + 1
+            if event.bytes:
+                self._bytes[series] = self._bytes.get(series, 0) + event.bytes
+
+    def snapshot(self) -> dict:
+        """
+        Get the counters.
+
+        Returns:
+            dict: "requests" maps (kind, endpoint, chain, method, status) to a count, "errors" maps (kind, endpoint,
+            chain, error) to a count and "bytes" maps (kind, endpoint, chain) to the received bytes.
+        """
+        with self._lock:
+            return {"requests": dict(self._requests), "errors": dict(self._errors), "bytes": dict(self._bytes)}
+
+    def reset(self):
+        with self._lock:
+            self._requests.clear()
+            self._errors.clear()
+            self._bytes.clear()
@@ -0,0 +1,215 @@
+from threading import Lock, Thread
+from .cache import HTTPCache, StaleWhileRevalidateCache
+from .instrumentation import LatencyHistogram, RequestCounter, add_observer, remove_observer
+from .transport import HTTPTransport, get_default_transport
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _labels(**labels) -> str:
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items() if value is not None)
+    return "{" + pairs + "}" if pairs else ""
+
+
+def _number(value) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _pools(transport: HTTPTransport):
+    # urllib3 keeps one connection pool per host in every mounted adapter; adapters may be shared between prefixes
+    seen = set()
+    for adapter in transport.session.adapters.values():
+        manager = getattr(adapter, "poolmanager", None)
+        if manager is None or id(manager) in seen:
+            continue
+        seen.add(id(manager))
+        for key in list(manager.pools.keys()):
+            pool = manager.pools.get(key)
+            if pool is not None:
+                yield f"{pool.scheme}://{pool.host}:{pool.port}", pool
+
+
+class MetricsExporter:
+    """
+    Serves request, error, latency, cache and connection pool metrics in the Prometheus text format.
+
+    The exporter adds a LatencyHistogram and a RequestCounter as instrumentation observers while it runs and serves
+    them, together with the hit counters of the registered caches and the pool usage of the registered transports,
+    from a stdlib HTTP server on a background thread.
+
+    Metrics:
+        nftpy_requests_total: Requests and client calls by kind, endpoint, chain, method and status.
+        nftpy_errors_total: Failures by kind, endpoint, chain and exception class. Call events carry the nftpy.errors
+            class raised by the client, e.g. RateLimitExceededError.
+        nftpy_response_bytes_total: Received response bytes.
+        nftpy_request_duration_seconds: Latency histogram by kind, endpoint and chain.
+        nftpy_cache_hits_total, nftpy_cache_misses_total, nftpy_cache_hit_ratio: Per registered cache.
+        nftpy_pool_connections_in_use, nftpy_pool_connections_idle, nftpy_pool_maxsize,
+        nftpy_pool_connections_opened_total: Per host pool of every registered transport.
+
+    Args:
+        host (str, optional): The interface to listen on.
+        port (int, optional): The port to listen on, 0 for any free port.
+        buckets (tuple, optional): Latency histogram bucket bounds in seconds.
+        transports (dict, optional): name -> HTTPTransport. Defaults to the process wide transport.
+        caches (dict, optional): name -> HTTPCache or StaleWhileRevalidateCache.
+    """
+    def __init__(self, host: str = "127.0.0.1", port: int = 9464, buckets: tuple = LatencyHistogram.DEFAULT_BUCKETS,
+                 transports: dict = None, caches: dict = None):
+        self.host = host
+        self.port = port
+        self.histogram = LatencyHistogram(buckets)
+        self.counter = RequestCounter()
+        self.transports = dict(transports) if transports is not None else {"default": get_default_transport()}
+        self.caches = dict(caches or {})
+        self._server = None
+        self._thread = None
+        self._lock = Lock()
+
+    def add_transport(self, name: str, transport: HTTPTransport):
+        self.transports[name] = transport
+
+    def add_cache(self, name: str, cache):
+        self.caches[name] = cache
+
+    def render(self) -> str:
+        """
+        Render every metric in the Prometheus text exposition format.
+        """
+        lines = []
+        counters = self.counter.snapshot()
+
+        lines.append("# HELP nftpy_requests_total Requests and client calls.")
+        lines.append("# TYPE nftpy_requests_total counter")
+        for (kind, endpoint, chain, method, status), count in sorted(counters["requests"].items(), key=repr):
+            labels = _labels(kind=kind, endpoint=endpoint, chain=chain, method=method, status=status)
+            lines.append(f"nftpy_requests_total{labels} {count}")
+
+        lines.append("# HELP nftpy_errors_total Failed requests and client calls by exception class.")
+        lines.append("# TYPE nftpy_errors_total counter")
+        for (kind, endpoint, chain, error), count in sorted(counters["errors"].items(), key=repr):
+            lines.append(f"nftpy_errors_total{_labels(kind=kind, endpoint=endpoint, chain=chain, error=error)} {count}")
+
+        lines.append("# HELP nftpy_response_bytes_total Received response bytes.")
+        lines.append("# TYPE nftpy_response_bytes_total counter")
+        for (kind, endpoint, chain), size in sorted(counters["bytes"].items(), key=repr):
+            lines.append(f"nftpy_response_bytes_total{_labels(kind=kind, endpoint=endpoint, chain=chain)} {size}")
+
+        lines.append("# HELP nftpy_request_duration_seconds Request and client call latency.")
+        lines.append("# TYPE nftpy_request_duration_seconds histogram")
+        for (kind, endpoint, chain), series in sorted(self.histogram.snapshot().items(), key=repr):
+            for bound, cumulative in series["buckets"]:
+                labels = _labels(kind=kind, endpoint=endpoint, chain=chain, le=_number(bound))
+                lines.append(f"nftpy_request_duration_seconds_bucket{labels} {cumulative}")
+            labels = _labels(kind=kind, endpoint=endpoint, chain=chain)
+            lines.append(f"nftpy_request_duration_seconds_sum{labels} {_number(series['sum'])}")
+            lines.append(f"nftpy_request_duration_seconds_count{labels} {series['count']}")
+
+        self._render_caches(lines)
+        self._render_pools(lines)
+        return "\n".join(lines) + "\n"
+
+    def _render_caches(self, lines: list):
+        hits, misses, ratios = [], [], []
+        for name, cache in sorted(self.caches.items()):
+            if isinstance(cache, StaleWhileRevalidateCache):
+                hits.append((_labels(cache=name, state="fresh"), cache.hits))
+                hits.append((_labels(cache=name, state="stale"), cache.stale_hits))
+            elif isinstance(cache, HTTPCache):
+                hits.append((_labels(cache=name, state="fresh"), cache.hits - cache.revalidations))
+                hits.append((_labels(cache=name, state="revalidated"), cache.revalidations))
+            else:
+                continue
+            misses.append((_labels(cache=name), cache.misses))
+            ratios.append((_labels(cache=name), cache.hit_ratio))
+        for metric, kind, help_text, samples in (
+                ("nftpy_cache_hits_total", "counter", "Cache hits.", hits),
+                ("nftpy_cache_misses_total", "counter", "Cache misses.", misses),
+                ("nftpy_cache_hit_ratio", "gauge", "Share of lookups served from cache.", ratios)):
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} {kind}")
+            lines.extend(f"{metric}{labels} {_number(value)}" for labels, value in samples)
+
+    def _render_pools(self, lines: list):
+        samples = {"in_use": [], "idle": [], "maxsize": [], "opened": []}
+        for name, transport in sorted(self.transports.items()):
+            for host, pool in _pools(transport):
+                queue = pool.pool
+                if queue is None:
+                    continue
+                labels = _labels(transport=name, host=host)
+                # Unopened slots are None placeholders in the queue, so idle counts only real connections
+                samples["in_use"].append((labels, max(0, queue.maxsize - queue.qsize())))
+                samples["idle"].append((labels, sum(1 for connection in list(queue.queue) if connection is not None)))
+                samples["maxsize"].append((labels, queue.maxsize))
+                samples["opened"].append((labels, pool.num_connections))
+        for key, metric, kind, help_text in (
+                ("in_use", "nftpy_pool_connections_in_use", "gauge", "Connections checked out of the pool."),
+                ("idle", "nftpy_pool_connections_idle", "gauge", "Open connections waiting in the pool."),
+                ("maxsize", "nftpy_pool_maxsize", "gauge", "Connections the pool keeps alive."),
+                ("opened", "nftpy_pool_connections_opened_total", "counter", "Connections opened by the pool.")):
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} {kind}")
+            lines.extend(f"{metric}{labels} {value}" for labels, value in samples[key])
+
+    def start(self) -> "MetricsExporter":
+        """
+        Start observing and serve GET /metrics on a daemon thread.
+        """
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+                    self.send_error(404)
+                    return
+                body = exporter.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        with self._lock:
+            if self._server is not None:
+                return self
+            add_observer(self.histogram)
+            add_observer(self.counter)
+            self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+            self._server.daemon_threads = True
+            self.port = self._server.server_port
+            self._thread = Thread(target=self._server.serve_forever, name="nftpy-metrics", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stop serving and observing.
+        """
+        with self._lock:
+            if self._server is None:
+                return
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+            self._thread = None
+            remove_observer(self.histogram)
+            remove_observer(self.counter)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
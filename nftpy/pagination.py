@@ -0,0 +1,120 @@
+from threading import Thread
+
+
+class _PageFetch(Thread):
+    """Fetches one page in the background so the caller can keep consuming the previous one."""
+    def __init__(self, fetch_page, cursor):
+        super().__init__(daemon=True)
+        self._fetch_page = fetch_page
+        self._cursor = cursor
+        self._page = None
+        self._error = None
+        self.start()
+
+    def run(self):
+        try:
+            self._page = self._fetch_page(self._cursor)
+        except BaseException as e:
+            self._error = e
+
+    def result(self):
+        self.join()
+        if self._error is not None:
+            raise self._error
+        return self._page
+
+
+def iterate_pages(fetch_page, cursor: str = None, next_key: str = "next", prefetch: bool = False,
+                  max_pages: int = None):
+    """
+    Follow a cursor chain and yield every page.
+
+    Args:
+        fetch_page (callable): Called with a cursor (None for the first page) and returns the decoded page.
+        cursor (str, optional): The cursor to start from.
+        next_key (str, optional): The key of the next page cursor in each page.
+        prefetch (bool, optional): Fetch the next page in a background thread while the current one is consumed.
+            At most two pages are held in memory.
+        max_pages (int, optional): Stop after this many pages.
+
+    Yields:
+        dict: Each page in order.
+    """
+    fetched = 0
+    pending = _PageFetch(fetch_page, cursor) if prefetch else None
+    while max_pages is None or fetched < max_pages:
+        page = pending.result() if prefetch else fetch_page(cursor)
+        fetched += 1
+        next_cursor = page.get(next_key) if isinstance(page, dict) else None
+        has_next = bool(next_cursor) and next_cursor != cursor and (max_pages is None or fetched < max_pages)
+        if prefetch and has_next:
+            pending = _PageFetch(fetch_page, next_cursor)
+        yield page
+        if not has_next:
+            return
+        cursor = next_cursor
+
+
+def iterate_items(fetch_page, items_key: str, cursor: str = None, next_key: str = "next", prefetch: bool = False,
+                  max_pages: int = None):
+    """
+    Follow a cursor chain and yield the items of every page one at a time.
+
+    Args:
+        fetch_page (callable): Called with a cursor (None for the first page) and returns the decoded page.
+        items_key (str): The key of the item list in each page.
+        cursor (str, optional): The cursor to start from.
+        next_key (str, optional): The key of the next page cursor in each page.
+        prefetch (bool, optional): Fetch the next page in a background thread while the current one is consumed.
+        max_pages (int, optional): Stop after this many pages.
+
+    Yields:
+        The items of every page in order.
+    """
+    for page in iterate_pages(fetch_page, cursor=cursor, next_key=next_key, prefetch=prefetch, max_pages=max_pages):
+        yield from page.get(items_key) or []
+
+
+def page_items(page, items_keys: tuple = ("items", "results", "data", "nfts", "listings")) -> list:
+    """
+    Get the item list of a page that is either a bare list or wraps the list in one of items_keys.
+    """
+    if isinstance(page, list):
+        return page
+    if isinstance(page, dict):
+        for key in items_keys:
+            if isinstance(page.get(key), list):
+                return page[key]
+    return []
+
+
+def iterate_numbered_pages(fetch_page, page_size: int, first_page: int = 1, prefetch: bool = False,
+                           max_pages: int = None, extract_items=page_items):
+    """
+    Request numbered pages and yield their items until a page comes back short or empty.
+
+    Args:
+        fetch_page (callable): Called with a page number and returns the decoded page.
+        page_size (int): The requested number of items per page.
+        first_page (int, optional): The number of the first page.
+        prefetch (bool, optional): Fetch the next page in a background thread while the current one is consumed.
+        max_pages (int, optional): Stop after this many pages.
+        extract_items (callable, optional): Returns the item list of a page.
+
+    Yields:
+        The items of every page in order.
+    """
+    number = first_page
+    fetched = 0
+    pending = _PageFetch(fetch_page, number) if prefetch else None
+    while max_pages is None or fetched < max_pages:
+        page = pending.result() if prefetch else fetch_page(number)
+        fetched += 1
+        items = extract_items(page)
+        has_next = len(items) >= page_size and (max_pages is None or fetched < max_pages)
+        number += 1
+        if prefetch and has_next:
+            pending = _PageFetch(fetch_page, number)
+        yield from items
+        if not has_next:
+            return
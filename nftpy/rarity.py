@@ -0,0 +1,239 @@
+from itertools import chain
+from .analytics import _require_numpy
+
+
+def _unwrap(item):
+    return item["nft"] if isinstance(item, dict) and isinstance(item.get("nft"), dict) else item
+
+
+def _token_id(item: dict, token_id_key: str = None):
+    if token_id_key is not None:
+        return item[token_id_key]
+    return item.get("identifier", item.get("tokenId", item.get("id")))
+
+
+def _attributes(item, mapping_as_traits: bool = True):
+    """
+    Extract (trait_type, value) pairs from an OpenSea NFT, a Rarible item, token metadata or a plain mapping.
+
+    A mapping without a "traits", "meta" or "attributes" key is read as trait_type -> value only if mapping_as_traits
+    is set; otherwise it is an item without traits, e.g. an NFT from OpenSea's list endpoints.
+    """
+    if isinstance(item, dict):
+        item = _unwrap(item)
+        if "traits" in item:
+            item = item["traits"]
+        elif "meta" in item and isinstance(item["meta"], dict):
+            item = item["meta"].get("attributes")
+        elif "attributes" in item:
+            item = item["attributes"]
+        elif mapping_as_traits:
+            return list(item.items())
+        else:
+            return []
+    pairs = []
+    for attribute in item or []:
+        if isinstance(attribute, dict):
+            trait_type = attribute.get("trait_type", attribute.get("key"))
+            value = attribute.get("value")
+        else:
+            trait_type, value = attribute
+        if trait_type is None or value is None:
+            continue
+        pairs.append((trait_type, value if isinstance(value, (str, int, float, bool)) else str(value)))
+    return pairs
+
+
+# Keys only an item has, so a mapping carrying one is an item, even one without traits, rather than trait_type -> value
+_ITEM_KEYS = frozenset(("nft", "traits", "meta", "attributes", "identifier", "tokenId", "token_id", "id"))
+
+
+def _given_attributes(attributes):
+    """
+    Extract the pairs passed to an incremental update: an item accepted by from_items or a bare trait mapping.
+    """
+    if isinstance(attributes, dict) and not _ITEM_KEYS.isdisjoint(attributes):
+        return _attributes(_unwrap(attributes), mapping_as_traits=False)
+    return _attributes(attributes)
+
+
+def _rank(scores, rarest_first_descending: bool):
+    np = _require_numpy()
+    # Ties share the best rank (1, 2, 2, 4); rounding keeps float noise from splitting ties
+    keys = np.round(-scores if rarest_first_descending else scores, 12)
+    ordered = np.sort(keys)
+    return np.searchsorted(ordered, keys, side="left") + 1
+
+
+class RarityEngine:
+    """
+    Scores the rarity of every token of a collection from its traits.
+
+    Tokens and traits form a sparse token x trait matrix stored as coordinate arrays, and all scores are computed
+    with vectorized NumPy operations. Adding, updating or removing a token only touches that token's traits and the
+    affected trait counts, so a metadata change does not require reloading the collection.
+
+    Scores (rank 1 is the rarest token):
+        statistical: Product of the probabilities of the token's traits. Lower is rarer.
+        information_content: Sum of -log2(probability) of the token's traits. Higher is rarer.
+        trait_count: Share of tokens with the same number of traits. Lower is rarer.
+
+    Args:
+        include_missing (bool, optional): Treat a trait type a token does not have as a trait value of its own.
+    """
+    METHODS = ("statistical", "information_content", "trait_count")
+
+    def __init__(self, include_missing: bool = True):
+        self.include_missing = include_missing
+        self._token_ids = []
+        self._token_rows = {}
+        self._token_traits = []
+        self._trait_columns = {}
+        self._trait_keys = []
+        self._trait_types = {}
+        self._column_types = []
+        self._counts = []
+        self._scores = None
+
+    @classmethod
+    def from_items(cls, items, token_id_key: str = None, include_missing: bool = True) -> "RarityEngine":
+        """
+        Build an engine from OpenSea NFTs, Rarible items or token metadata.
+
+        Traits are read from "traits", "meta.attributes" or "attributes". An item without them, such as an NFT from
+        OpenSea's list endpoints, is added without traits.
+
+        Args:
+            items (iterable): The items. Each must carry its token ID in "identifier", "tokenId" or token_id_key.
+            token_id_key (str, optional): The key of the token ID if it is not one of the defaults.
+            include_missing (bool, optional): See RarityEngine.
+        """
+        engine = cls(include_missing=include_missing)
+        for item in items:
+            item = _unwrap(item)
+            engine.update(_token_id(item, token_id_key), _attributes(item, mapping_as_traits=False))
+        return engine
+
+    def _column(self, trait_type, value) -> int:
+        key = (trait_type, value)
+        column = self._trait_columns.get(key)
+        if column is None:
+            column = self._trait_columns[key] = len(self._trait_keys)
+            self._trait_keys.append(key)
+            self._column_types.append(self._trait_types.setdefault(trait_type, len(self._trait_types)))
+            self._counts.append(0)
+        return column
+
+    def update(self, token_id, attributes):
+        """
+        Add a token or replace its traits.
+
+        Args:
+            token_id: The token ID.
+            attributes: A list of {"trait_type", "value"} dicts, (trait_type, value) pairs, a trait_type -> value
+                mapping, or an item accepted by from_items. An item without traits is added without traits.
+        """
+        pairs = _given_attributes(attributes)
+        columns = tuple(sorted({self._column(trait_type, value) for trait_type, value in pairs}))
+        row = self._token_rows.get(token_id)
+        if row is None:
+            self._token_rows[token_id] = len(self._token_ids)
+            self._token_ids.append(token_id)
+            self._token_traits.append(columns)
+        else:
+            for column in self._token_traits[row]:
+                self._counts[column] -= 1
+            self._token_traits[row] = columns
+        for column in columns:
+            self._counts[column] += 1
+        self._scores = None
+
+    def remove(self, token_id):
+        """
+        Remove a token, e.g. after it was burned.
+        """
+        row = self._token_rows.pop(token_id)
+        for column in self._token_traits[row]:
+            self._counts[column] -= 1
+        last_id = self._token_ids.pop()
+        last_traits = self._token_traits.pop()
+        if row < len(self._token_ids):
+            self._token_ids[row] = last_id
+            self._token_traits[row] = last_traits
+            self._token_rows[last_id] = row
+        self._scores = None
+
+    def __len__(self):
+        return len(self._token_ids)
+
+    def __contains__(self, token_id):
+        return token_id in self._token_rows
+
+    def trait_counts(self) -> dict:
+        """
+        Get the number of tokens per (trait_type, value).
+        """
+        return {key: count for key, count in zip(self._trait_keys, self._counts) if count}
+
+    def _compute(self):
+        np = _require_numpy()
+        total = len(self._token_ids)
+        lengths = np.fromiter((len(columns) for columns in self._token_traits), dtype=np.int64, count=total)
+        columns = np.fromiter(chain.from_iterable(self._token_traits), dtype=np.int64, count=int(lengths.sum()))
+        rows = np.repeat(np.arange(total), lengths)
+        probability = np.asarray(self._counts, dtype=np.float64) / max(total, 1)
+        log_probability = np.log2(probability[columns]) if len(columns) else np.zeros(0)
+
+        if self.include_missing and self._trait_types:
+            has_type = np.zeros((total, len(self._trait_types)), dtype=bool)
+            has_type[rows, np.asarray(self._column_types, dtype=np.int64)[columns]] = True
+            missing_probability = (total - has_type.sum(axis=0)) / max(total, 1)
+            missing_rows, missing_types = np.nonzero(~has_type)
+            rows = np.concatenate([rows, missing_rows])
+            log_probability = np.concatenate([log_probability, np.log2(missing_probability[missing_types])])
+
+        information_content = -np.bincount(rows, weights=log_probability, minlength=total)
+        statistical = np.exp2(-information_content)
+        trait_count = np.bincount(lengths)[lengths] / max(total, 1)
+        self._scores = {
+            "token_id": np.asarray(self._token_ids, dtype=object),
+            "statistical": statistical,
+            "statistical_rank": _rank(statistical, False),
+            "information_content": information_content,
+            "information_content_rank": _rank(information_content, True),
+            "trait_count": trait_count,
+            "trait_count_rank": _rank(trait_count, False),
+        }
+
+    def scores(self) -> dict:
+        """
+        Get the scores and ranks of every token.
+
+        Returns:
+            dict: Arrays aligned with "token_id": one per score in METHODS and one "<method>_rank" per score.
+        """
+        if self._scores is None:
+            self._compute()
+        return self._scores
+
+    def rank(self, token_id, method: str = "information_content") -> int:
+        """
+        Get the rank of a token, 1 being the rarest.
+        """
+        if method not in self.METHODS:
+            raise ValueError(f"Unknown rarity method '{method}'. Available methods: {', '.join(self.METHODS)}.")
+        return int(self.scores()[f"{method}_rank"][self._token_rows[token_id]])
+
+    def top(self, n: int = 10, method: str = "information_content") -> list:
+        """
+        Get the n rarest tokens.
+
+        Returns:
+            list: (token_id, score, rank) tuples, rarest first.
+        """
+        if method not in self.METHODS:
+            raise ValueError(f"Unknown rarity method '{method}'. Available methods: {', '.join(self.METHODS)}.")
+        np = _require_numpy()
+        scores = self.scores()
+        order = np.argsort(scores[f"{method}_rank"], kind="stable")[:n]
+        return [(scores["token_id"][i], float(scores[method][i]), int(scores[f"{method}_rank"][i])) for i in order]
@@ -0,0 +1,119 @@
+import random
+import time
+from email.utils import parsedate_to_datetime
+from threading import Lock
+
+
+class RetryBudget:
+    """
+    Caps retries to a fraction of the traffic of a client.
+
+    Every request deposits ``ratio`` tokens and every retry withdraws one, so a failing API cannot multiply the
+    request rate by more than ``1 + ratio`` once the initial ``max_tokens`` are spent.
+
+    Args:
+        ratio (float, optional): Tokens earned per request.
+        max_tokens (float, optional): Maximum number of banked tokens. The budget starts full.
+    """
+    def __init__(self, ratio: float = 0.2, max_tokens: float = 20):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = float(max_tokens)
+        self._lock = Lock()
+
+    def deposit(self):
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    @property
+    def tokens(self) -> float:
+        return self._tokens
+
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed request is retried.
+
+    429 responses are retried for every method since the server did not process them. 5xx responses, connection
+    errors and timeouts are only retried for idempotent methods. The delay is taken from the Retry-After header when
+    present and otherwise is a fully jittered exponential backoff.
+
+    Args:
+        max_retries (int, optional): Maximum number of retries per request.
+        backoff_factor (float, optional): Base delay in seconds, doubled on every attempt.
+        max_backoff (float, optional): Upper bound of the backoff delay in seconds.
+        max_retry_after (float, optional): Give up instead of waiting when Retry-After asks for longer than this.
+        retry_statuses (tuple, optional): Status codes that are retried.
+        idempotent_methods (tuple, optional): Methods that are retried on 5xx and connection errors.
+        budget (RetryBudget, optional): The retry budget. Each policy gets its own by default.
+    """
+    def __init__(self, max_retries: int = 3, backoff_factor: float = 0.5, max_backoff: float = 30.0,
+                 max_retry_after: float = 120.0, retry_statuses: tuple = (429, 500, 502, 503, 504),
+                 idempotent_methods: tuple = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE"), budget: RetryBudget = None):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.retry_statuses = frozenset(retry_statuses)
+        self.idempotent_methods = frozenset(idempotent_methods)
+        self.budget = budget or RetryBudget()
+
+    def backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.max_backoff, self.backoff_factor * (2 ** attempt)))
+
+    @staticmethod
+    def parse_retry_after(value) -> float:
+        """
+        Parse a Retry-After header given in seconds or as an HTTP date.
+
+        Returns:
+            float: The delay in seconds, or None if the header is missing or malformed.
+        """
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError, IndexError, OverflowError):
+            return None
+
+    def response_delay(self, method: str, status_code: int, headers, attempt: int) -> float:
+        """
+        Get the delay before retrying a response.
+
+        Returns:
+            float: Seconds to wait, or None if the response should be returned as is.
+        """
+        if attempt >= self.max_retries or status_code not in self.retry_statuses:
+            return None
+        if status_code != 429 and method.upper() not in self.idempotent_methods:
+            return None
+        retry_after = self.parse_retry_after(headers.get("Retry-After")) if headers is not None else None
+        if retry_after is not None and retry_after > self.max_retry_after:
+            return None
+        if not self.budget.withdraw():
+            return None
+        return retry_after if retry_after is not None else self.backoff(attempt)
+
+    def error_delay(self, method: str, attempt: int) -> float:
+        """
+        Get the delay before retrying a request that failed with a connection error or timeout.
+
+        Returns:
+            float: Seconds to wait, or None if the error should be raised.
+        """
+        if attempt >= self.max_retries or method.upper() not in self.idempotent_methods:
+            return None
+        if not self.budget.withdraw():
+            return None
+        return self.backoff(attempt)
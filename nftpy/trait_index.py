@@ -0,0 +1,256 @@
+import json
+import os
+import zlib
+from .concurrency import bounded_map
+from .rarity import _attributes, _given_attributes, _token_id, _unwrap
+
+
+def _positions(bitset: int) -> list:
+    bits = bin(bitset)[:1:-1]
+    positions = []
+    position = bits.find("1")
+    while position != -1:
+        positions.append(position)
+        position = bits.find("1", position + 1)
+    return positions
+
+
+def _bitset(positions: list, size: int) -> int:
+    bits = bytearray((size >> 3) + 1)
+    for position in positions:
+        bits[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(bits, "little")
+
+
+class TraitIndex:
+    """
+    An inverted index from (trait_type, value) to the tokens having it.
+
+    Every token gets a bit position and every trait a Python int used as a bitset, so multi-trait filters are a few
+    bitwise operations on machine words regardless of the number of traits. The index can be saved as a zlib
+    compressed JSON file and loaded for a warm start; token IDs, trait types and values must then be JSON scalars.
+    """
+    _FORMAT_VERSION = 2
+
+    def __init__(self):
+        self._tokens = []
+        self._positions = {}
+        self._free = []
+        self._token_traits = {}
+        self._bitsets = {}
+        self._alive = 0
+
+    @classmethod
+    def from_items(cls, items, token_id_key: str = None) -> "TraitIndex":
+        """
+        Build an index from OpenSea NFTs, Rarible items or token metadata.
+
+        Traits are read from "traits", "meta.attributes" or "attributes". An item without them, such as an NFT from
+        OpenSea's list endpoints, is indexed without traits.
+
+        Args:
+            items (iterable): The items. Each must carry its token ID in "identifier", "tokenId" or token_id_key.
+            token_id_key (str, optional): The key of the token ID if it is not one of the defaults.
+        """
+        return cls._build((_token_id(item, token_id_key), item) for item in map(_unwrap, items))
+
+    @classmethod
+    def _build(cls, entries) -> "TraitIndex":
+        # Collect positions per trait first so every bitset is built once instead of growing one OR at a time
+        index = cls()
+        positions = {}
+        for token_id, attributes in entries:
+            traits = tuple({(trait_type, value) for trait_type, value in _attributes(attributes, False)})
+            position = index._positions.get(token_id)
+            if position is None:
+                position = index._positions[token_id] = len(index._tokens)
+                index._tokens.append(token_id)
+            else:
+                for trait in index._token_traits[token_id]:
+                    positions[trait].remove(position)
+            index._token_traits[token_id] = traits
+            for trait in traits:
+                positions.setdefault(trait, []).append(position)
+        size = len(index._tokens)
+        index._bitsets = {trait: _bitset(trait_positions, size)
+                          for trait, trait_positions in positions.items() if trait_positions}
+        index._alive = (1 << size) - 1
+        return index
+
+    @classmethod
+    def from_contract(cls, nft, token_ids, max_workers: int = 8) -> "TraitIndex":
+        """
+        Build an index from the on-chain metadata of a contract.
+
+        Args:
+            nft (NFT): The contract to read token metadata from.
+            token_ids (iterable): The tokens to index.
+            max_workers (int, optional): Maximum number of metadata requests in flight.
+
+        Raises:
+            ContractFunctionFailedError: If the metadata of a token cannot be fetched.
+        """
+        token_ids = list(token_ids)
+        results = bounded_map(nft.get_token_metadata, token_ids, max_workers)
+        for metadata, error in results:
+            if error is not None:
+                raise error
+        return cls._build((token_id, metadata) for token_id, (metadata, _) in zip(token_ids, results))
+
+    def add(self, token_id, attributes):
+        """
+        Add a token or replace its traits.
+
+        Args:
+            token_id: The token ID.
+            attributes: A list of {"trait_type", "value"} dicts, (trait_type, value) pairs, a trait_type -> value
+                mapping, or an item accepted by from_items. An item without traits is added without traits.
+        """
+        if token_id in self._positions:
+            self.remove(token_id)
+        if self._free:
+            position = self._free.pop()
+            self._tokens[position] = token_id
+        else:
+            position = len(self._tokens)
+            self._tokens.append(token_id)
+        self._positions[token_id] = position
+        bit = 1 << position
+        traits = tuple({(trait_type, value) for trait_type, value in _given_attributes(attributes)})
+        for trait in traits:
+            self._bitsets[trait] = self._bitsets.get(trait, 0) | bit
+        self._token_traits[token_id] = traits
+        self._alive |= bit
+
+    def remove(self, token_id):
+        """
+        Remove a token. Its bit position is reused by the next added token.
+        """
+        position = self._positions.pop(token_id)
+        mask = ~(1 << position)
+        for trait in self._token_traits.pop(token_id):
+            bitset = self._bitsets[trait] & mask
+            if bitset:
+                self._bitsets[trait] = bitset
+            else:
+                del self._bitsets[trait]
+        self._alive &= mask
+        self._tokens[position] = None
+        self._free.append(position)
+
+    def __len__(self):
+        return len(self._positions)
+
+    def __contains__(self, token_id):
+        return token_id in self._positions
+
+    def traits(self) -> dict:
+        """
+        Get the values indexed for every trait type.
+        """
+        values = {}
+        for trait_type, value in self._bitsets:
+            values.setdefault(trait_type, []).append(value)
+        return values
+
+    def bitset(self, trait_type, value) -> int:
+        return self._bitsets.get((trait_type, value), 0)
+
+    def match(self, filters: dict = None, any_of: list = None, exclude: list = None) -> int:
+        """
+        Get the bitset of the tokens matching a filter.
+
+        Args:
+            filters (dict, optional): trait_type -> value or list of values. Values of one trait type are ORed and
+                trait types are ANDed, e.g. {"Background": "Gold", "Eyes": ["Laser", "Cyborg"]}.
+            any_of (list, optional): (trait_type, value) pairs of which a token needs at least one.
+            exclude (list, optional): (trait_type, value) pairs a token must not have.
+
+        Returns:
+            int: The bitset of matching token positions. Pass it to tokens() or count().
+        """
+        result = self._alive
+        bitsets = self._bitsets
+        for trait_type, values in (filters or {}).items():
+            if isinstance(values, (list, tuple, set, frozenset)):
+                union = 0
+                for value in values:
+                    union |= bitsets.get((trait_type, value), 0)
+                result &= union
+            else:
+                result &= bitsets.get((trait_type, values), 0)
+            if not result:
+                return 0
+        if any_of:
+            union = 0
+            for trait in any_of:
+                union |= bitsets.get(tuple(trait), 0)
+            result &= union
+        for trait in exclude or ():
+            result &= ~bitsets.get(tuple(trait), 0)
+        return result
+
+    def tokens(self, bitset: int) -> list:
+        """
+        Get the token IDs of a bitset, in bit position order.
+        """
+        tokens = self._tokens
+        return [tokens[position] for position in _positions(bitset)]
+
+    @staticmethod
+    def count(bitset: int) -> int:
+        return bin(bitset).count("1")
+
+    def query(self, filters: dict = None, any_of: list = None, exclude: list = None) -> list:
+        """
+        Get the token IDs matching a filter. See match for the arguments.
+        """
+        return self.tokens(self.match(filters, any_of=any_of, exclude=exclude))
+
+    def save(self, path: str, level: int = 6):
+        """
+        Write the index to a zlib compressed JSON file. Bitsets are stored as hex strings.
+        """
+        state = {
+            "version": self._FORMAT_VERSION,
+            "tokens": self._tokens,
+            "token_traits": [None if token_id is None else self._token_traits[token_id] for token_id in self._tokens],
+            "bitsets": [[trait_type, value, format(bitset, "x")]
+                        for (trait_type, value), bitset in self._bitsets.items()],
+        }
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as file:
+            file.write(zlib.compress(json.dumps(state, separators=(",", ":")).encode("utf-8"), level))
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "TraitIndex":
+        """
+        Read an index written by save.
+
+        Raises:
+            ValueError: If the file is corrupt or was written by an incompatible version.
+        """
+        with open(path, "rb") as file:
+            data = file.read()
+        try:
+            state = json.loads(zlib.decompress(data))
+            version = state.get("version")
+        except (zlib.error, ValueError, AttributeError) as e:
+            raise ValueError(f"Cannot read trait index {path}: {e}") from e
+        if version != cls._FORMAT_VERSION:
+            raise ValueError(f"Unsupported trait index format {version} in {path}.")
+        index = cls()
+        try:
+            index._tokens = list(state["tokens"])
+            index._bitsets = {(trait_type, value): int(bitset, 16) for trait_type, value, bitset in state["bitsets"]}
+            for position, (token_id, traits) in enumerate(zip(index._tokens, state["token_traits"])):
+                if token_id is None:
+                    index._free.append(position)
+                else:
+                    index._positions[token_id] = position
+                    index._token_traits[token_id] = tuple((trait_type, value) for trait_type, value in traits)
+                    index._alive |= 1 << position
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Cannot read trait index {path}: {e}") from e
+        return index
@@ -0,0 +1,460 @@
+import asyncio
+import time
+from threading import Lock
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from .cache import HTTPCache
+from .codec import loads
+from .concurrency import SingleFlight
+from .instrumentation import _observers, report
+from .cassette import _cassettes, http_key
+from .retry import RetryPolicy
+
+
+class CodecResponse(requests.Response):
+    """
+    A requests.Response that decodes its body with the configured JSON backend.
+    """
+    def json(self, **kwargs):
+        if kwargs or not self.content:
+            return super().json(**kwargs)
+        try:
+            return loads(self.content)
+        except ValueError as e:
+            raise requests.JSONDecodeError(getattr(e, "msg", str(e)), getattr(e, "doc", ""), getattr(e, "pos", 0))
+
+
+class CodecHTTPAdapter(HTTPAdapter):
+    """
+    An HTTPAdapter that builds CodecResponse objects.
+    """
+    def build_response(self, req, resp):
+        response = super().build_response(req, resp)
+        response.__class__ = CodecResponse
+        return response
+
+
+class HTTPTransport:
+    """
+    A pooled HTTP transport shared by the marketplace clients.
+
+    Connections are kept alive in a requests Session, so repeated calls to the same API reuse the TCP and TLS
+    connection instead of opening a new one per request.
+
+    Args:
+        pool_connections (int, optional): Number of per-host connection pools to keep.
+        pool_maxsize (int, optional): Maximum number of connections kept alive per host.
+        timeout (float or tuple, optional): Default (connect, read) timeout in seconds for every request.
+        headers (dict, optional): Headers sent with every request.
+        session (requests.Session, optional): A preconfigured session to use instead of a new one.
+        cache (HTTPCache, optional): Response cache for requests tagged with an endpoint class.
+        coalesce (bool, optional): Let concurrent identical GET requests share one in-flight request.
+    """
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 32, timeout=(5, 30), headers: dict = None,
+                 session: requests.Session = None, cache: HTTPCache = None, coalesce: bool = True):
+        self.timeout = timeout
+        self.cache = cache
+        self._inflight = SingleFlight() if coalesce else None
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.session = session or requests.Session()
+        adapter = CodecHTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        if headers:
+            self.session.headers.update(headers)
+
+    def request(self, method: str, url: str, headers: dict = None, params: dict = None, json=None, timeout=None,
+                retry: RetryPolicy = None, cache: str = None):
+        """
+        Send a request through the pooled session.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The URL to request.
+            headers (dict, optional): Request specific headers.
+            params (dict, optional): Query parameters. None values are dropped.
+            json (optional): A JSON serializable request body.
+            timeout (float or tuple, optional): Overrides the default timeout.
+            retry (RetryPolicy, optional): Retries throttled, failed and dropped requests.
+            cache (str, optional): The endpoint class of a cacheable GET request. Ignored without a transport cache.
+
+        Returns:
+            requests.Response: The response. After the last retry the final response is returned as is. Cached
+            responses are returned as BufferedResponse. Coalesced callers share the same response object.
+        """
+        if self._inflight is not None and method == "GET":
+            return self._inflight.do(_flight_key(url, headers, params), self._request, method, url, headers, params,
+                                     json, timeout, retry, cache)
+        return self._request(method, url, headers, params, json, timeout, retry, cache)
+
+    def _request(self, method, url, headers, params, json, timeout, retry, cache):
+        if cache is None or self.cache is None or method != "GET":
+            return self._send(method, url, headers, params, json, timeout, retry)
+        key = self.cache.key(method, url, params)
+        entry = self.cache.lookup(key)
+        if entry is not None:
+            if entry.is_fresh():
+                self.cache.hits += 1
+                return _cached_response(entry)
+            headers = dict(headers or {}, **entry.conditional_headers())
+        response = self._send(method, url, headers, params, json, timeout, retry)
+        return _update_cache(self.cache, key, cache, entry, response)
+
+    def _send(self, method, url, headers, params, json, timeout, retry):
+        if retry is not None:
+            retry.budget.deposit()
+        attempt = 0
+        while True:
+            try:
+                response = self._send_once(method, url, headers, params, json, timeout)
+            except (requests.ConnectionError, requests.Timeout):
+                delay = retry.error_delay(method, attempt) if retry is not None else None
+                if delay is None:
+                    raise
+            else:
+                if retry is None:
+                    return response
+                delay = retry.response_delay(method, response.status_code, response.headers, attempt)
+                if delay is None:
+                    return response
+                response.close()
+            attempt += 1
+            time.sleep(delay)
+
+    def _send_once(self, method, url, headers, params, json, timeout):
+        if not _observers and not _cassettes:
+            return self.session.request(method, url, headers=headers, params=params, json=json,
+                                        timeout=timeout or self.timeout)
+        started = time.perf_counter()
+        try:
+            response = self._exchange(method, url, headers, params, json, timeout, started)
+        except Exception as e:
+            if _observers:
+                report("http", method, url, None, 0, started, e)
+            raise
+        if _observers:
+            report("http", method, url, response.status_code, len(response.content), started)
+        return response
+
+    def _exchange(self, method, url, headers, params, json, timeout, started):
+        cassette = _cassettes[0] if _cassettes else None
+        if cassette is not None:
+            key = http_key(method, url, params, json)
+            if cassette.replaying:
+                exchange = cassette.next("http", key)
+                if exchange is not None:
+                    time.sleep(cassette.delay(exchange))
+                    if exchange.error == "timeout":
+                        raise requests.Timeout(f"Recorded timeout for {key}")
+                    if exchange.error is not None:
+                        raise requests.ConnectionError(f"Recorded connection error for {key}")
+                    return _replayed_response(exchange)
+                cassette = None
+        try:
+            response = self.session.request(method, url, headers=headers, params=params, json=json,
+                                            timeout=timeout or self.timeout)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if cassette is not None:
+                cassette.add("http", key, started, error="timeout" if isinstance(e, requests.Timeout) else "connection")
+            raise
+        if cassette is not None:
+            cassette.add("http", key, started, response.status_code, response.headers, response.content,
+                         str(response.url))
+        return response
+
+    def get(self, url: str, headers: dict = None, params: dict = None, **kwargs):
+        return self.request("GET", url, headers=headers, params=params, **kwargs)
+
+    def post(self, url: str, headers: dict = None, params: dict = None, json=None, **kwargs):
+        return self.request("POST", url, headers=headers, params=params, json=json, **kwargs)
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _flight_key(url, headers, params):
+    return (url, repr(sorted(params.items())) if params else None, repr(sorted(headers.items())) if headers else None)
+
+
+def _replayed_response(exchange):
+    return BufferedResponse(exchange.status, CaseInsensitiveDict(exchange.headers), exchange.content, exchange.url)
+
+
+def _cached_response(entry):
+    return BufferedResponse(entry.status_code, CaseInsensitiveDict(entry.headers), entry.content, entry.url)
+
+
+def _update_cache(cache: HTTPCache, key: str, endpoint: str, entry, response):
+    if response.status_code == 304 and entry is not None:
+        cache.hits += 1
+        cache.revalidations += 1
+        return _cached_response(cache.refresh(key, endpoint, entry))
+    cache.misses += 1
+    if response.status_code == 200:
+        cache.store(key, endpoint, response.status_code, response.headers, response.content, str(response.url))
+    return response
+
+
+class BufferedResponse:
+    """
+    A fully read response, mirroring the parts of requests.Response the clients use. Returned by AsyncHTTPTransport
+    and for cached responses.
+    """
+    def __init__(self, status_code: int, headers, content: bytes, url: str):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.url = url
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self):
+        return loads(self.content)
+
+    def raise_for_status(self):
+        if not self.ok:
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}", response=self)
+
+    def close(self):
+        # Nothing to release, the body is already read
+        pass
+
+
+class AsyncHTTPTransport:
+    """
+    A pooled aiohttp transport shared by the async marketplace clients. Requires the optional aiohttp dependency.
+
+    The session is created on first use inside the running event loop. Close the transport (or use it as an async
+    context manager) when done.
+
+    Args:
+        limit (int, optional): Maximum number of open connections.
+        limit_per_host (int, optional): Maximum number of open connections per host.
+        timeout (float, optional): Default total timeout in seconds for every request.
+        max_concurrency (int, optional): Maximum number of requests in flight. Further requests wait for a slot.
+        headers (dict, optional): Headers sent with every request.
+        cache (HTTPCache, optional): Response cache for requests tagged with an endpoint class.
+        coalesce (bool, optional): Let concurrent identical GET requests share one in-flight request.
+    """
+    def __init__(self, limit: int = 100, limit_per_host: int = 32, timeout: float = 30, max_concurrency: int = None,
+                 headers: dict = None, cache: HTTPCache = None, coalesce: bool = True):
+        self.cache = cache
+        self._inflight = {} if coalesce else None
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.headers = headers
+        self._session = None
+        self._semaphore = None
+
+    def _get_session(self):
+        if self._session is None or self._session.closed:
+            try:
+                import aiohttp
+            except ImportError as e:
+                raise ImportError("The async clients require aiohttp. Install it with `pip install nftpy[async]`.") from e
+            connector = aiohttp.TCPConnector(limit=self.limit, limit_per_host=self.limit_per_host)
+            self._session = aiohttp.ClientSession(connector=connector, headers=self.headers,
+                                                  timeout=aiohttp.ClientTimeout(total=self.timeout))
+            if self.max_concurrency:
+                self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+
+    async def _send(self, session, method, url, headers, params, json, timeout):
+        kwargs = {}
+        if timeout is not None:
+            import aiohttp
+            kwargs["timeout"] = aiohttp.ClientTimeout(total=timeout)
+        if _observers or _cassettes:
+            return await self._observed_send(session, method, url, headers, params, json, kwargs)
+        if self._semaphore is None:
+            return await self._read(session, method, url, headers, params, json, kwargs)
+        # The slot is released before any retry backoff so sleeping requests do not block others
+        async with self._semaphore:
+            return await self._read(session, method, url, headers, params, json, kwargs)
+
+    async def _observed_send(self, session, method, url, headers, params, json, kwargs):
+        # Timed after acquiring the concurrency slot so queueing is not reported or recorded as request latency
+        if self._semaphore is None:
+            return await self._observed_read(session, method, url, headers, params, json, kwargs)
+        async with self._semaphore:
+            return await self._observed_read(session, method, url, headers, params, json, kwargs)
+
+    async def _observed_read(self, session, method, url, headers, params, json, kwargs):
+        started = time.perf_counter()
+        try:
+            response = await self._exchange(session, method, url, headers, params, json, kwargs, started)
+        except Exception as e:
+            if _observers:
+                report("http", method, url, None, 0, started, e)
+            raise
+        if _observers:
+            report("http", method, url, response.status_code, len(response.content), started)
+        return response
+
+    async def _exchange(self, session, method, url, headers, params, json, kwargs, started):
+        import aiohttp
+        cassette = _cassettes[0] if _cassettes else None
+        if cassette is not None:
+            key = http_key(method, url, params, json)
+            if cassette.replaying:
+                exchange = cassette.next("http", key)
+                if exchange is not None:
+                    await asyncio.sleep(cassette.delay(exchange))
+                    if exchange.error == "timeout":
+                        raise asyncio.TimeoutError(f"Recorded timeout for {key}")
+                    if exchange.error is not None:
+                        raise aiohttp.ClientConnectionError(f"Recorded connection error for {key}")
+                    return _replayed_response(exchange)
+                cassette = None
+        try:
+            response = await self._read(session, method, url, headers, params, json, kwargs)
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+            if cassette is not None:
+                cassette.add("http", key, started,
+                             error="timeout" if isinstance(e, asyncio.TimeoutError) else "connection")
+            raise
+        if cassette is not None:
+            cassette.add("http", key, started, response.status_code, response.headers, response.content, response.url)
+        return response
+
+    @staticmethod
+    async def _read(session, method, url, headers, params, json, kwargs):
+        async with session.request(method, url, headers=headers, params=params, json=json, **kwargs) as response:
+            content = await response.read()
+            return BufferedResponse(response.status, response.headers, content, str(response.url))
+
+    async def _send_with_retry(self, session, method, url, headers, params, json, timeout, retry):
+        import aiohttp
+        retry.budget.deposit()
+        attempt = 0
+        while True:
+            try:
+                response = await self._send(session, method, url, headers, params, json, timeout)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                delay = retry.error_delay(method, attempt)
+                if delay is None:
+                    raise
+            else:
+                delay = retry.response_delay(method, response.status_code, response.headers, attempt)
+                if delay is None:
+                    return response
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def request(self, method: str, url: str, headers: dict = None, params: dict = None, json=None,
+                      timeout: float = None, retry: RetryPolicy = None, cache: str = None) -> BufferedResponse:
+        """
+        Send a request through the pooled session.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The URL to request.
+            headers (dict, optional): Request specific headers. None values are dropped.
+            params (dict, optional): Query parameters. None values are dropped.
+            json (optional): A JSON serializable request body.
+            timeout (float, optional): Overrides the default timeout.
+            retry (RetryPolicy, optional): Retries throttled, failed and dropped requests.
+            cache (str, optional): The endpoint class of a cacheable GET request. Ignored without a transport cache.
+
+        Returns:
+            BufferedResponse: The fully read response.
+        """
+        if self._inflight is None or method != "GET":
+            return await self._cached_request(method, url, headers, params, json, timeout, retry, cache)
+        key = _flight_key(url, headers, params)
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._cached_request(method, url, headers, params, json, timeout, retry,
+                                                                cache))
+            self._inflight[key] = future
+            future.add_done_callback(lambda _, key=key: self._inflight.pop(key, None))
+        # Shielded so a cancelled caller does not cancel the request the other callers are waiting for
+        return await asyncio.shield(future)
+
+    async def _cached_request(self, method, url, headers, params, json, timeout, retry, cache):
+        if cache is None or self.cache is None or method != "GET":
+            return await self._request(method, url, headers, params, json, timeout, retry)
+        key = self.cache.key(method, url, params)
+        entry = self.cache.lookup(key)
+        if entry is not None:
+            if entry.is_fresh():
+                self.cache.hits += 1
+                return _cached_response(entry)
+            headers = dict(headers or {}, **entry.conditional_headers())
+        response = await self._request(method, url, headers, params, json, timeout, retry)
+        return _update_cache(self.cache, key, cache, entry, response)
+
+    async def _request(self, method, url, headers, params, json, timeout, retry):
+        session = self._get_session()
+        if headers:
+            headers = {key: value for key, value in headers.items() if value is not None}
+        if params:
+            params = {key: value for key, value in params.items() if value is not None}
+        if retry is not None:
+            return await self._send_with_retry(session, method, url, headers, params, json, timeout, retry)
+        return await self._send(session, method, url, headers, params, json, timeout)
+
+    async def get(self, url: str, headers: dict = None, params: dict = None, **kwargs) -> BufferedResponse:
+        return await self.request("GET", url, headers=headers, params=params, **kwargs)
+
+    async def post(self, url: str, headers: dict = None, params: dict = None, json=None,
+                   **kwargs) -> BufferedResponse:
+        return await self.request("POST", url, headers=headers, params=params, json=json, **kwargs)
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+
+_default_transport = None
+_default_transport_lock = Lock()
+
+
+def get_default_transport() -> HTTPTransport:
+    """
+    Get the process wide transport used by clients that were not given one.
+
+    Returns:
+        HTTPTransport: The shared transport.
+    """
+    global _default_transport
+    if _default_transport is None:
+        with _default_transport_lock:
+            if _default_transport is None:
+                _default_transport = HTTPTransport()
+    return _default_transport
+
+
+def set_default_transport(transport: HTTPTransport):
+    """
+    Replace the process wide transport, e.g. to change pool sizes or timeouts for every client.
+
+    Args:
+        transport (HTTPTransport): The transport to share.
+    """
+    global _default_transport
+    with _default_transport_lock:
+        _default_transport = transport
@@ -0,0 +1,168 @@
+import hashlib
+import json
+import time
+from .pagination import page_items
+
+
+class ChangeEvent:
+    """
+    One difference between two polls.
+
+    Args:
+        kind (str): "added", "removed" or "changed".
+        key: The key of the item.
+        item: The current item, None for removed items.
+        previous: The item from the previous poll, None for added items.
+    """
+    __slots__ = ("kind", "key", "item", "previous")
+
+    def __init__(self, kind: str, key, item, previous):
+        self.kind = kind
+        self.key = key
+        self.item = item
+        self.previous = previous
+
+    def __repr__(self):
+        return f"ChangeEvent(kind={self.kind!r}, key={self.key!r})"
+
+
+def _digest(item) -> bytes:
+    # Canonical encoding, so an API returning the same object with its keys in another order is not a change
+    canonical = json.dumps(item, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).digest()
+
+
+class Watcher:
+    """
+    Polls an endpoint and reports only the items that were added, removed or changed since the last poll.
+
+    Every item is reduced to a 16 byte content hash, so a poll compares one digest per item instead of deep comparing
+    payloads. The interval shrinks towards min_interval while changes keep coming and grows towards max_interval
+    while nothing changes or a poll fails. Items without a key are skipped, and of items sharing a key only the first
+    one is kept.
+
+    Args:
+        fetch (callable): Returns the current items, either as a list or as a page wrapping the list.
+        key (str or callable): The item field, or a function of the item, that identifies an item across polls.
+        extract_items (callable, optional): Returns the item list of whatever fetch returned.
+        min_interval (float, optional): Shortest delay between polls in seconds.
+        max_interval (float, optional): Longest delay between polls in seconds.
+        backoff (float, optional): Factor the interval grows by after a poll without changes.
+        speedup (float, optional): Factor the interval shrinks by after a poll with changes.
+        emit_initial (bool, optional): Report the items of the first poll as added.
+        max_failures (int, optional): Raise the error of a failed poll in watch once this many polls in a row
+            failed. By default watch keeps polling.
+    """
+    def __init__(self, fetch, key, extract_items=page_items, min_interval: float = 5.0, max_interval: float = 120.0,
+                 backoff: float = 1.5, speedup: float = 0.5, emit_initial: bool = False, max_failures: int = None):
+        self.fetch = fetch
+        self.key = key if callable(key) else (lambda item, field=key: item.get(field))
+        self.extract_items = extract_items
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.speedup = speedup
+        self.emit_initial = emit_initial
+        self.max_failures = max_failures
+        self.interval = min_interval
+        self.failures = 0
+        self.last_error = None
+        self._state = None
+
+    @classmethod
+    def opensea_listings(cls, api, collection_slug: str, chain=None, **kwargs) -> "Watcher":
+        """
+        Watch every listing of an OpenSea collection, keyed by order hash.
+        """
+        return cls(lambda: list(api.iter_all_listings_on_collection(collection_slug, chain=chain)), "order_hash",
+                   **kwargs)
+
+    @classmethod
+    def mintable_auctions_ending_soon(cls, api, query_params=None, key: str = "id", **kwargs) -> "Watcher":
+        """
+        Watch the Mintable auctions ending soon.
+        """
+        return cls(lambda: api.fetch_auctions_ending_soon(query_params), key, **kwargs)
+
+    @classmethod
+    def mintable_hot_auctions(cls, api, query_params=None, key: str = "id", **kwargs) -> "Watcher":
+        """
+        Watch the hot Mintable auctions.
+        """
+        return cls(lambda: api.fetch_hot_auctions(query_params), key, **kwargs)
+
+    @property
+    def items(self) -> dict:
+        """The items of the last poll by key."""
+        return {key: item for key, (_, item) in (self._state or {}).items()}
+
+    def poll(self) -> list:
+        """
+        Fetch once and diff against the previous poll.
+
+        Returns:
+            list: ChangeEvents, added and changed items in fetch order followed by removed items.
+        """
+        state = {}
+        for item in self.extract_items(self.fetch()):
+            key = self.key(item)
+            if key is None or key in state:
+                continue
+            state[key] = (_digest(item), item)
+
+        previous = self._state
+        self._state = state
+        if previous is None:
+            events = [ChangeEvent("added", key, item, None) for key, (_, item) in state.items()] \
+                if self.emit_initial else []
+        else:
+            events = []
+            for key, (digest, item) in state.items():
+                old = previous.get(key)
+                if old is None:
+                    events.append(ChangeEvent("added", key, item, None))
+                elif old[0] != digest:
+                    events.append(ChangeEvent("changed", key, item, old[1]))
+            for key, (_, item) in previous.items():
+                if key not in state:
+                    events.append(ChangeEvent("removed", key, None, item))
+
+        if events:
+            self.interval = max(self.min_interval, self.interval * self.speedup)
+        elif previous is not None:
+            self.interval = min(self.max_interval, self.interval * self.backoff)
+        return events
+
+    def watch(self, max_polls: int = None):
+        """
+        Poll on the adaptive schedule and yield every change.
+
+        A failed poll (timeout, server error, rate limit) is recorded in ``failures`` and ``last_error`` and backs the
+        interval off towards max_interval. The items of the last successful poll are kept, so the next successful poll
+        reports every change since then.
+
+        Args:
+            max_polls (int, optional): Stop after this many polls, failed ones included.
+
+        Yields:
+            ChangeEvent: Each change as soon as its poll completes.
+        """
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            started = time.monotonic()
+            try:
+                events = self.poll()
+            except Exception as e:
+                self.failures += 1
+                self.last_error = e
+                if self.max_failures is not None and self.failures >= self.max_failures:
+                    raise
+                self.interval = min(self.max_interval, self.interval * self.backoff)
+                events = []
+            else:
+                self.failures = 0
+            yield from events
+            polls += 1
+            if max_polls is not None and polls >= max_polls:
+                return
+            time.sleep(max(0.0, self.interval - (time.monotonic() - started)))
@@ -0,0 +1,15 @@
+import pytest
+
+from benchmarks.mock_servers import MockMarketplace, MockRPCNode
+
+
+@pytest.fixture
+def market():
+    with MockMarketplace(collection_size=250) as server:
+        yield server
+
+
+@pytest.fixture
+def node(market):
+    with MockRPCNode(metadata_url=market.metadata_url) as server:
+        yield server
@@ -0,0 +1,42 @@
+import pytest
+
+from nftpy import OpenSea, OpenSeaChain
+from nftpy.OpenSea import EventBackfill
+from benchmarks.mock_servers import MockMarketplace
+
+CONTRACT = "0xBC4CA0EdA7647A8aB7C2061c2E118A18a936f13D"
+
+
+@pytest.fixture
+def events_market():
+    # 240 intervals of 60 seconds split into 8 windows of 1800 seconds: every window edge is an event timestamp
+    with MockMarketplace(event_count=241, event_interval=60) as server:
+        yield server
+
+
+def test_backfill_emits_edge_events_once(events_market):
+    opensea = OpenSea(api_key="mock", chain=OpenSeaChain.ETHEREUM)
+    opensea.base_url = events_market.opensea_url
+    after, before = events_market.events_start, events_market.events_end
+
+    events = list(opensea.backfill_events_by_nft(CONTRACT, "1", after, before, windows=8, max_workers=4,
+                                                 requests_per_second=1000, limit=7))
+
+    timestamps = [event["event_timestamp"] for event in events]
+    assert len(events) == 241
+    assert len({event["transaction"] for event in events}) == 241
+    assert timestamps == sorted(timestamps, reverse=True)
+    assert events == list(opensea.iter_events_by_nft(CONTRACT, "1", occurred_after=after, occurred_before=before,
+                                                     limit=50))
+
+
+def test_windows_overlap_at_their_edges(events_market):
+    opensea = OpenSea(api_key="mock", chain=OpenSeaChain.ETHEREUM)
+    opensea.base_url = events_market.opensea_url
+    after, before = events_market.events_start, events_market.events_end
+    backfill = EventBackfill(opensea, CONTRACT, "1", chain=OpenSeaChain.ETHEREUM, windows=8)
+
+    returned = sum(len(backfill._crawl_window(window)) for window in backfill.split(after, before))
+
+    # The API returns the 7 shared edge events twice; without dedupe the backfill would emit them twice
+    assert returned == 241 + 7
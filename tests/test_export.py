@@ -0,0 +1,66 @@
+import gzip
+import json
+
+import pytest
+
+from nftpy import Rarible, RaribleChain
+from nftpy.Rarible import TransactionExporter
+from nftpy.errors import APIRequestFailedError
+
+
+class _FailingAfter:
+    """Delegates get_transactions to a client and fails once `pages` pages were returned."""
+    def __init__(self, api, pages: int):
+        self.api = api
+        self.pages = pages
+
+    def get_transactions(self, **kwargs):
+        if self.pages == 0:
+            raise APIRequestFailedError(503)
+        self.pages -= 1
+        return self.api.get_transactions(**kwargs)
+
+
+@pytest.fixture
+def rarible(market):
+    api = Rarible(api_key="mock", chain=RaribleChain.ETHEREUM)
+    api.base_url = market.rarible_url
+    return api
+
+
+def _records(path):
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        return [json.loads(line) for line in file]
+
+
+def test_export_writes_every_transaction_once(rarible, tmp_path):
+    path = tmp_path / "transactions.ndjson.gz"
+
+    assert TransactionExporter(rarible, str(path), page_size=100).export() == 250
+    assert [record["id"] for record in _records(path)] == [f"tx-{index}" for index in range(250)]
+
+
+def test_export_resumes_after_interruption(rarible, market, tmp_path):
+    path = tmp_path / "transactions.ndjson.gz"
+    with pytest.raises(APIRequestFailedError):
+        TransactionExporter(_FailingAfter(rarible, pages=1), str(path), page_size=100).export()
+    # A page cut off mid-write after the last checkpoint
+    with open(path, "ab") as file:
+        file.write(b"\x1f\x8b\x08\x00partial")
+    requests = market.requests
+
+    assert TransactionExporter(rarible, str(path), page_size=100).export() == 250
+    assert market.requests - requests == 2
+    assert [record["id"] for record in _records(path)] == [f"tx-{index}" for index in range(250)]
+
+    # A finished export is not fetched again
+    assert TransactionExporter(rarible, str(path), page_size=100).export() == 250
+    assert market.requests - requests == 2
+
+
+def test_export_rejects_checkpoint_of_another_range(rarible, tmp_path):
+    path = tmp_path / "transactions.ndjson.gz"
+    TransactionExporter(rarible, str(path), page_size=100).export(start_date="2024-01-01")
+
+    with pytest.raises(ValueError):
+        TransactionExporter(rarible, str(path), page_size=100).export(start_date="2024-02-01")
@@ -0,0 +1,67 @@
+import threading
+
+import pytest
+from web3 import Web3
+from web3.exceptions import BlockNotFound
+
+from nftpy.EVM import BlockFollower, Chains, NewBlockEvent, RollbackEvent
+
+
+@pytest.fixture
+def follower(node):
+    node.head = 10
+    return BlockFollower(Chains.ETH, rpc_url=node.url, poll_interval=0.01)
+
+
+def _numbers(events):
+    return [event.number for event in events]
+
+
+def test_poll_yields_new_blocks(follower, node):
+    assert _numbers(follower.poll(start_block=5)) == [5, 6, 7, 8, 9, 10]
+    assert follower.poll() == []
+    node.head = 12
+    assert _numbers(follower.poll()) == [11, 12]
+
+
+def test_reorg_rolls_back_and_replays_canonical_blocks(follower, node):
+    follower.poll(start_block=5)
+    orphaned = {number: node.block_hash(1, number) for number in (9, 10)}
+    node.reorg(9)
+    node.head = 12
+
+    events = follower.poll()
+
+    rollback = events[0]
+    assert isinstance(rollback, RollbackEvent)
+    assert rollback.common_ancestor == 8
+    assert [(number, Web3.to_hex(block_hash)) for number, block_hash in rollback.dropped] == \
+        [(10, orphaned[10]), (9, orphaned[9])]
+    assert all(isinstance(event, NewBlockEvent) for event in events[1:])
+    assert _numbers(events[1:]) == [9, 10, 11, 12]
+    assert Web3.to_hex(events[1].hash) == node.block_hash(1, 9)
+
+
+def test_failed_block_is_fetched_again(follower, node):
+    follower.poll(start_block=10)
+    node.head = 15
+    node.missing_blocks.add(14)
+
+    assert _numbers(follower.poll()) == [11, 12, 13]
+    with pytest.raises(BlockNotFound):
+        follower.poll()
+    node.missing_blocks.clear()
+    assert _numbers(follower.poll()) == [14, 15]
+
+
+def test_follow_retries_transient_errors(follower, node):
+    follower.poll(start_block=10)
+    node.head = 13
+    node.missing_blocks.add(12)
+    stream = follower.follow()
+
+    assert next(stream).number == 11
+    timer = threading.Timer(0.1, node.missing_blocks.clear)
+    timer.start()
+    assert [next(stream).number, next(stream).number] == [12, 13]
+    timer.join()
@@ -0,0 +1,143 @@
+import pickle
+import zlib
+
+import pytest
+
+from nftpy import OpenSea, OpenSeaChain, TraitIndex
+
+np = pytest.importorskip("numpy")
+from nftpy import RarityEngine  # noqa: E402
+
+
+def _listed(count):
+    # NFTs as returned by OpenSea's list endpoints: no traits
+    return [{"identifier": str(i), "collection": "mock", "name": f"Mock #{i}", "image_url": f"https://img/{i}.png",
+             "opensea_url": f"https://opensea.io/{i}"} for i in range(count)]
+
+
+def _with_traits():
+    return [
+        {"identifier": "1",
+         "traits": [{"trait_type": "Hat", "value": "Crown"}, {"trait_type": "Eyes", "value": "Laser"}]},
+        {"identifier": "2",
+         "traits": [{"trait_type": "Hat", "value": "Cap"}, {"trait_type": "Eyes", "value": "Laser"}]},
+        {"nft": {"identifier": "3", "traits": [{"trait_type": "Hat", "value": "Cap"}]}},
+        {"tokenId": "4", "meta": {"attributes": [{"key": "Hat", "value": "Cap"}]}},
+        {"id": "5", "attributes": [{"trait_type": "Hat", "value": "Cap"}, {"trait_type": "Eyes", "value": "Sleepy"}]},
+    ]
+
+
+def test_rarity_ignores_fields_of_items_without_traits():
+    engine = RarityEngine.from_items(_listed(5))
+
+    assert engine.trait_counts() == {}
+    assert set(engine.scores()["information_content_rank"]) == {1}
+
+
+def test_rarity_reads_traits_of_every_item_shape():
+    engine = RarityEngine.from_items(_with_traits())
+
+    assert engine.trait_counts() == {("Hat", "Crown"): 1, ("Hat", "Cap"): 4, ("Eyes", "Laser"): 2,
+                                     ("Eyes", "Sleepy"): 1}
+    assert engine.rank("1") == 1
+
+
+def test_rarity_update_accepts_a_trait_mapping():
+    engine = RarityEngine.from_items(_with_traits())
+    engine.update("6", {"Hat": "Crown", "Eyes": "Laser"})
+
+    assert engine.trait_counts()[("Hat", "Crown")] == 2
+
+
+def test_rarity_update_with_items():
+    engine = RarityEngine.from_items(_with_traits())
+    engine.update("7", _listed(8)[7])
+    engine.update("8", {"nft": {"identifier": "8", "traits": [{"trait_type": "Hat", "value": "Crown"}]}})
+
+    assert "7" in engine
+    assert engine.trait_counts() == {("Hat", "Crown"): 2, ("Hat", "Cap"): 4, ("Eyes", "Laser"): 2,
+                                     ("Eyes", "Sleepy"): 1}
+
+
+def test_rarity_updates_match_a_rebuild():
+    items = _with_traits()
+    engine = RarityEngine.from_items(items[:2])
+    for token_id, item in zip("345", items[2:]):
+        engine.update(token_id, item)
+    engine.update("2", {"Hat": "Crown"})
+    engine.update("6", [("Hat", "Cap")])
+    engine.remove("6")
+
+    rebuilt = RarityEngine.from_items([{"identifier": "2", "traits": [{"trait_type": "Hat", "value": "Crown"}]}]
+                                      + [item for item in items if item.get("identifier") != "2"])
+
+    assert engine.trait_counts() == rebuilt.trait_counts()
+    for method in ("information_content", "statistical"):
+        assert {token_id: engine.rank(token_id, method) for token_id in "12345"} == \
+            {token_id: rebuilt.rank(token_id, method) for token_id in "12345"}
+
+
+def test_rarity_of_mock_collection(market):
+    opensea = OpenSea(api_key="mock", chain=OpenSeaChain.ETHEREUM)
+    opensea.base_url = market.opensea_url
+    engine = RarityEngine.from_items(opensea.iter_nfts_by_collection("mock", limit=100))
+
+    assert len(engine) == 250
+    assert {trait_type for trait_type, _ in engine.trait_counts()} == {"Background", "Eyes", "Hat", "Mouth"}
+
+
+def test_trait_index_ignores_fields_of_items_without_traits():
+    index = TraitIndex.from_items(_listed(3) + _with_traits())
+
+    assert set(index.traits()) == {"Hat", "Eyes"}
+    assert index.query({"Hat": "Cap", "Eyes": ["Laser", "Sleepy"]}) == ["2", "5"]
+
+
+def test_trait_index_add_with_items():
+    index = TraitIndex.from_items(_with_traits())
+    index.add("7", _listed(8)[7])
+    index.add("8", {"nft": {"identifier": "8", "traits": [{"trait_type": "Hat", "value": "Crown"}]}})
+
+    assert len(index) == 7
+    assert set(index.traits()) == {"Hat", "Eyes"}
+    assert index.query({"Hat": "Crown"}) == ["1", "8"]
+
+
+def test_trait_index_adds_match_a_rebuild():
+    items = _with_traits()
+    index = TraitIndex.from_items(items[:2])
+    index.add("6", [("Hat", "Crown")])
+    for token_id, item in zip("345", items[2:]):
+        index.add(token_id, item)
+    index.add("2", {"Hat": "Crown"})
+    index.remove("6")
+
+    rebuilt = TraitIndex.from_items([{"identifier": "2", "traits": [{"trait_type": "Hat", "value": "Crown"}]}]
+                                    + [item for item in items if item.get("identifier") != "2"])
+
+    assert len(index) == len(rebuilt) == 5
+    assert index.traits() == rebuilt.traits()
+    for filters in ({"Hat": "Cap"}, {"Hat": "Crown"}, {"Eyes": ["Laser", "Sleepy"]}):
+        assert sorted(index.query(filters)) == sorted(rebuilt.query(filters))
+
+
+def test_trait_index_snapshot_round_trip(tmp_path):
+    index = TraitIndex.from_items(_with_traits())
+    index.remove("2")
+    path = str(tmp_path / "collection.idx")
+    index.save(path)
+
+    loaded = TraitIndex.load(path)
+
+    assert len(loaded) == 4
+    assert loaded.query({"Hat": "Cap"}) == index.query({"Hat": "Cap"})
+    loaded.add("7", [("Hat", "Cap")])
+    assert loaded.query({"Hat": "Cap"}) == ["7", "3", "4", "5"]
+
+
+def test_trait_index_refuses_pickled_snapshots(tmp_path):
+    path = tmp_path / "collection.idx"
+    path.write_bytes(zlib.compress(pickle.dumps({"version": 1})))
+
+    with pytest.raises(ValueError):
+        TraitIndex.load(str(path))
@@ -0,0 +1,131 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from nftpy import OpenSea, OpenSeaChain, HTTPTransport, HTTPCache, DiskCacheBackend
+from nftpy.cache import CacheEntry
+from nftpy.errors import APIRequestFailedError
+from nftpy.retry import RetryPolicy
+
+
+def _opensea(market, **kwargs):
+    opensea = OpenSea(api_key="mock", chain=OpenSeaChain.ETHEREUM, **kwargs)
+    opensea.base_url = market.opensea_url
+    return opensea
+
+
+def test_retry_waits_for_retry_after(market):
+    # A backoff this large would time the test out, so the short Retry-After must be the delay used
+    policy = RetryPolicy(max_retries=3, backoff_factor=30)
+    opensea = _opensea(market, transport=HTTPTransport(), retry_policy=policy)
+    market.fail_next(2, status=429, headers={"Retry-After": "0.1"})
+
+    started = time.perf_counter()
+    stats = opensea.get_collection_stats("mock")
+    elapsed = time.perf_counter() - started
+
+    assert stats["total"]["sales"] == 500
+    assert market.requests == 3
+    assert 0.2 <= elapsed < 5
+
+
+def test_retry_gives_up_when_retry_after_is_too_long(market):
+    policy = RetryPolicy(max_retries=3, max_retry_after=1)
+    opensea = _opensea(market, transport=HTTPTransport(), retry_policy=policy)
+    market.fail_next(1, status=429, headers={"Retry-After": "60"})
+
+    with pytest.raises(APIRequestFailedError):
+        opensea.get_collection_stats("mock")
+    assert market.requests == 1
+
+
+def test_etag_revalidation(market):
+    cache = HTTPCache(ttls={"collection": 0})
+    opensea = _opensea(market, transport=HTTPTransport(cache=cache))
+
+    first = opensea.get_collection("mock")
+    second = opensea.get_collection("mock")
+
+    assert first == second
+    assert market.requests == 2
+    assert market.not_modified == 1
+    assert cache.revalidations == 1
+
+
+def test_fresh_cache_entry_skips_the_network(market):
+    cache = HTTPCache()
+    opensea = _opensea(market, transport=HTTPTransport(cache=cache))
+
+    opensea.get_collection("mock")
+    opensea.get_collection("mock")
+
+    assert market.requests == 1
+    assert cache.hits == 1
+
+
+def test_disk_cache_concurrent_writes(tmp_path):
+    backend = DiskCacheBackend(str(tmp_path))
+    barrier = threading.Barrier(8)
+
+    def write(i):
+        barrier.wait()
+        backend.set("key", CacheEntry(200, {}, str(i).encode() * 10000, "https://mock", time.time() + 60))
+
+    threads = [threading.Thread(target=write, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    content = backend.get("key").content
+    assert content == content[:1] * 10000
+    assert len(list(tmp_path.iterdir())) == 1
+
+
+def test_disk_cache_write_failure_is_ignored(tmp_path):
+    backend = DiskCacheBackend(str(tmp_path))
+    backend.set("key", CacheEntry(200, {"X-Unserializable": object()}, b"{}", "https://mock", time.time() + 60))
+
+    assert backend.get("key") is None
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize("coalesce, expected_requests", [(True, 1), (False, 8)])
+def test_sync_coalescing(market, coalesce, expected_requests):
+    market.latency = 0.2
+    transport = HTTPTransport(coalesce=coalesce)
+    barrier = threading.Barrier(8)
+    results = []
+
+    def call():
+        barrier.wait()
+        results.append(transport.get(f"{market.opensea_url}/collection/mock/stats").json())
+
+    threads = [threading.Thread(target=call) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 8 and all(result == results[0] for result in results)
+    assert market.requests == expected_requests
+
+
+@pytest.mark.parametrize("coalesce, expected_requests", [(True, 1), (False, 8)])
+def test_async_coalescing(market, coalesce, expected_requests):
+    pytest.importorskip("aiohttp")
+    from nftpy.transport import AsyncHTTPTransport
+
+    market.latency = 0.2
+
+    async def main():
+        async with AsyncHTTPTransport(coalesce=coalesce) as transport:
+            responses = await asyncio.gather(*(transport.get(f"{market.opensea_url}/collection/mock/stats")
+                                               for _ in range(8)))
+        return [response.json() for response in responses]
+
+    results = asyncio.run(main())
+    assert all(result == results[0] for result in results)
+    assert market.requests == expected_requests
@@ -0,0 +1,46 @@
+import pytest
+
+from nftpy import Watcher
+from nftpy.errors import RateLimitExceededError
+
+
+class _Responses:
+    """Returns the given item lists in turn, raising the ones that are exceptions."""
+    def __init__(self, *responses):
+        self.responses = list(responses)
+
+    def __call__(self):
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def test_watch_survives_failed_polls():
+    fetch = _Responses([{"id": 1, "price": 1}, {"id": 2, "price": 1}], RateLimitExceededError(),
+                       [{"id": 1, "price": 2}, {"id": 3, "price": 1}])
+    watcher = Watcher(fetch, "id", min_interval=0, max_interval=0.01, backoff=2)
+
+    events = list(watcher.watch(max_polls=3))
+
+    assert [(event.kind, event.key) for event in events] == [("changed", 1), ("added", 3), ("removed", 2)]
+    assert isinstance(watcher.last_error, RateLimitExceededError)
+    assert watcher.failures == 0
+
+
+def test_watch_raises_after_max_failures():
+    watcher = Watcher(_Responses(TimeoutError(), TimeoutError()), "id", min_interval=0, max_interval=0,
+                      max_failures=2)
+
+    with pytest.raises(TimeoutError):
+        list(watcher.watch())
+    assert watcher.failures == 2
+
+
+def test_poll_skips_items_without_a_unique_key():
+    fetch = _Responses([{"id": 1, "price": 1}, {"price": 5}, {"id": 1, "price": 9}, {"id": 2, "price": 1}])
+    watcher = Watcher(fetch, "id")
+
+    watcher.poll()
+
+    assert watcher.items == {1: {"id": 1, "price": 1}, 2: {"id": 2, "price": 1}}